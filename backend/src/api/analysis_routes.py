@@ -8,7 +8,7 @@ import os
 import sys
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
 # Add project root so mcp_server package is importable
@@ -16,7 +16,26 @@ _PROJECT_ROOT = str(Path(__file__).resolve().parent.parent.parent.parent)
 if _PROJECT_ROOT not in sys.path:
     sys.path.insert(0, _PROJECT_ROOT)
 
-analysis_router = APIRouter()
+# Imported once at startup; tools are looked up as module attributes at call
+# time so they remain patchable.
+from mcp_server.tools import (  # noqa: E402
+    create_chart,
+    create_table,
+    generate_report,
+    query_data,
+)
+
+
+async def require_api_key() -> None:
+    """Router-wide guard: reject analysis requests when no API key is configured."""
+    if not os.environ.get("ANTHROPIC_API_KEY"):
+        raise HTTPException(
+            status_code=503,
+            detail="ANTHROPIC_API_KEY is not set. Analysis features require a valid API key.",
+        )
+
+
+analysis_router = APIRouter(dependencies=[Depends(require_api_key)])
 
 
 class QueryRequest(BaseModel):
@@ -31,49 +50,29 @@ class AnalysisResponse(BaseModel):
     result: str
 
 
-def _check_api_key() -> None:
-    if not os.environ.get("ANTHROPIC_API_KEY"):
-        raise HTTPException(
-            status_code=503,
-            detail="ANTHROPIC_API_KEY is not set. Analysis features require a valid API key.",
-        )
-
-
 @analysis_router.post("/analysis/query", response_model=AnalysisResponse)
 async def analysis_query(body: QueryRequest) -> AnalysisResponse:
     """Query tax data using natural language."""
-    _check_api_key()
-    from mcp_server.tools.query_data import query_tax_data
-
-    result = await query_tax_data(body.question)
+    result = await query_data.query_tax_data(body.question)
     return AnalysisResponse(result=result)
 
 
 @analysis_router.post("/analysis/chart", response_model=AnalysisResponse)
 async def analysis_chart(body: PromptRequest) -> AnalysisResponse:
     """Generate a Plotly chart from tax data."""
-    _check_api_key()
-    from mcp_server.tools.create_chart import create_chart
-
-    result = await create_chart(body.prompt)
+    result = await create_chart.create_chart(body.prompt)
     return AnalysisResponse(result=result)
 
 
 @analysis_router.post("/analysis/table", response_model=AnalysisResponse)
 async def analysis_table(body: PromptRequest) -> AnalysisResponse:
     """Generate a markdown table from tax data."""
-    _check_api_key()
-    from mcp_server.tools.create_table import create_table
-
-    result = await create_table(body.prompt)
+    result = await create_table.create_table(body.prompt)
     return AnalysisResponse(result=result)
 
 
 @analysis_router.post("/analysis/report", response_model=AnalysisResponse)
 async def analysis_report(body: PromptRequest) -> AnalysisResponse:
     """Generate an analytical report from tax data."""
-    _check_api_key()
-    from mcp_server.tools.generate_report import generate_report
-
-    result = await generate_report(body.prompt)
+    result = await generate_report.generate_report(body.prompt)
     return AnalysisResponse(result=result)
@@ -9,10 +9,12 @@ from fastapi import FastAPI
 # Load .env from project root (one level above backend/)
 load_dotenv(Path(__file__).resolve().parent.parent.parent.parent / ".env")
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from src.api.analysis_routes import analysis_router
 from src.api.exception_handlers import register_exception_handlers
-from src.api.routes import router
+from src.api.routes import STATIC_JSON, router
+from src.api.static_responses import StaticJSONMiddleware
 from src.database.db import close_db, init_db
 
 
@@ -31,13 +33,25 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# CORS — allow the Vite dev server and preview server
+# Constant 2024 tables are answered from memory without entering the router.
+# Added first so it sits inside CORS/GZip and still gets their headers.
+app.add_middleware(
+    StaticJSONMiddleware,
+    responses={f"/api{path}": entry for path, entry in STATIC_JSON.items()},
+)
+
+# Compress larger payloads (history pages, bracket tables); small JSON is sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# CORS — allow the Vite dev server and preview server.  Explicit method/header
+# lists plus max_age let browsers cache the preflight for a day.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173", "http://localhost:4173"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
 register_exception_handlers(app)
@@ -3,17 +3,31 @@
 from decimal import Decimal
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from src.models.filing_status import FilingStatus
 
 
 class EstimateInput(BaseModel):
-    """Quick estimate input — gross income + filing status only."""
+    """Quick estimate input — gross income + filing status only.
 
-    gross_income: Decimal = Field(ge=0, description="Total gross income")
+    Income may be sent either as a decimal amount or as whole cents; exactly
+    one of the two must be present.
+    """
+
+    gross_income: Decimal | None = Field(default=None, ge=0, description="Total gross income")
+    gross_income_cents: int | None = Field(
+        default=None, ge=0, strict=True, description="Total gross income in whole cents"
+    )
     filing_status: FilingStatus
 
+    @model_validator(mode="after")
+    def exactly_one_income(self) -> "EstimateInput":
+        if (self.gross_income is None) == (self.gross_income_cents is None):
+            msg = "provide exactly one of gross_income or gross_income_cents"
+            raise ValueError(msg)
+        return self
+
 
 class EstimateResult(BaseModel):
     """Quick estimate output — simplified tax summary."""
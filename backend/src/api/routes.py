@@ -1,8 +1,16 @@
 """FastAPI routes for the IRS Tax Calculator API."""
 
+import hashlib
+from collections.abc import Callable
 from decimal import Decimal
+from functools import lru_cache
 
-from fastapi import APIRouter, HTTPException
+import anyio
+import orjson
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
 
 from src.api.models import (
     BracketEntry,
@@ -15,67 +23,138 @@ from src.api.models import (
     EstimateResult,
 )
 from src.data.tax_year_2024 import FEDERAL_BRACKETS, STANDARD_DEDUCTION
+from src.database.db import POOL_SIZE
 from src.database.repository import (
     delete_calculation,
     get_calculation,
     list_calculations,
 )
+from src.models.filing_status import FilingStatus
 from src.models.workflow_models import FullTaxCalculationResult, TaxReturnInput
-from src.tools.calculate_bracket_tax import calculate_bracket_tax
+from src.tools.calculate_bracket_tax import calculate_bracket_tax_totals
 from src.tools.lookup_standard_deduction import lookup_standard_deduction
-from src.workflows.orchestrator import calculate_full_tax
+from src.workflows.orchestrator import calculate_full_tax, persist_calculation
 
 router = APIRouter()
 
 
+def _json(model: BaseModel) -> Response:
+    """Serialise *model* with pydantic-core and wrap it in a ready-made response.
+
+    Returning a Response directly skips FastAPI's response-model validation and
+    jsonable_encoder pass; ``response_model`` on the route still drives OpenAPI.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 @router.post("/calculate", response_model=FullTaxCalculationResult)
-def full_calculation(tax_return: TaxReturnInput) -> FullTaxCalculationResult:
+async def full_calculation(tax_return: TaxReturnInput) -> Response:
     """Full tax calculation — accepts all income sources and deductions.
 
     Runs the complete pipeline: income aggregation, FICA, AGI, deductions,
-    tax computation, credits, and summary.
+    tax computation, credits, and summary.  The calculation is saved to history
+    after the response has been sent, so the SQLite write is off the request path.
     """
-    return calculate_full_tax(tax_return)
+    result = calculate_full_tax(tax_return, persist=False)
+    response = _json(result)
+    response.background = BackgroundTask(_run_db, persist_calculation, tax_return, result)
+    return response
 
 
-@router.post("/calculate/estimate", response_model=EstimateResult)
-def quick_estimate(body: EstimateInput) -> EstimateResult:
-    """Quick estimate from gross income + filing status.
+@lru_cache(maxsize=4096)
+def _estimate_json(gross_income: str, filing_status: FilingStatus) -> bytes:
+    """Compute and encode one estimate.
 
-    Uses the standard deduction and bracket tax only — no FICA, credits, or
-    investment income breakdown.
+    Keyed on the exact string form of the income so that equal-valued inputs
+    with different precision (``"75000"`` vs ``"75000.00"``) keep their own
+    echoed representation.
     """
-    std_ded = lookup_standard_deduction(body.filing_status)
-    taxable_income = max(body.gross_income - std_ded.total_deduction, Decimal("0"))
-    bracket_result = calculate_bracket_tax(taxable_income, body.filing_status)
-
+    income = Decimal(gross_income)
+    std_ded = lookup_standard_deduction(filing_status)
+    taxable_income = max(income - std_ded.total_deduction, Decimal("0"))
+    estimated_tax, effective_rate, marginal_rate = calculate_bracket_tax_totals(
+        taxable_income, filing_status
+    )
     return EstimateResult(
-        gross_income=body.gross_income,
-        filing_status=body.filing_status,
+        gross_income=income,
+        filing_status=filing_status,
         standard_deduction=std_ded.total_deduction,
         taxable_income=taxable_income,
-        estimated_tax=bracket_result.total_tax,
-        effective_rate=bracket_result.effective_rate,
-        marginal_rate=bracket_result.marginal_rate,
+        estimated_tax=estimated_tax,
+        effective_rate=effective_rate,
+        marginal_rate=marginal_rate,
+    ).model_dump_json().encode()
+
+
+@router.post("/calculate/estimate", response_model=EstimateResult)
+async def quick_estimate(body: EstimateInput) -> Response:
+    """Quick estimate from gross income + filing status.
+
+    Uses the standard deduction and bracket tax only — no FICA, credits, or
+    investment income breakdown.  Results are memoised; an estimate is a pure
+    function of its two inputs.
+    """
+    if body.gross_income is None:
+        gross_income = str(Decimal(body.gross_income_cents).scaleb(-2))
+    else:
+        gross_income = str(body.gross_income)
+    return Response(
+        content=_estimate_json(gross_income, body.filing_status),
+        media_type="application/json",
+        headers={"Cache-Control": "private, max-age=60"},
     )
 
 
-@router.get("/brackets/2024", response_model=BracketsResponse)
-def get_brackets() -> BracketsResponse:
-    """Return 2024 federal income-tax brackets for all filing statuses."""
+def _build_brackets() -> BracketsResponse:
     brackets: dict[str, list[BracketEntry]] = {}
     for status, bracket_list in FEDERAL_BRACKETS.items():
-        brackets[status] = [
+        brackets[status.value] = [
             BracketEntry(upper_bound=upper, rate=rate)
             for upper, rate in bracket_list
         ]
     return BracketsResponse(brackets=brackets)
 
 
+def _static_json(model: BaseModel) -> tuple[bytes, dict[str, str]]:
+    """Serialise a constant response once; returns (body, caching headers)."""
+    body = model.model_dump_json().encode()
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    return body, {"Cache-Control": "public, max-age=86400, immutable", "ETag": etag}
+
+
+# 2024 tables never change for the life of the process — build and encode them once.
+_BRACKETS_JSON, _BRACKETS_HEADERS = _static_json(_build_brackets())
+_DEDUCTIONS_JSON, _DEDUCTIONS_HEADERS = _static_json(
+    DeductionsResponse(
+        standard_deductions={
+            status.value: amount for status, amount in STANDARD_DEDUCTION.items()
+        }
+    )
+)
+
+# Router-relative path -> (body, headers).  main.py mounts these in
+# StaticJSONMiddleware so they are answered before routing; the routes below
+# remain for the OpenAPI schema and for apps built without the middleware.
+STATIC_JSON: dict[str, tuple[bytes, dict[str, str]]] = {
+    "/brackets/2024": (_BRACKETS_JSON, _BRACKETS_HEADERS),
+    "/deductions/2024": (_DEDUCTIONS_JSON, _DEDUCTIONS_HEADERS),
+}
+
+
+@router.get("/brackets/2024", response_model=BracketsResponse)
+async def get_brackets() -> Response:
+    """Return 2024 federal income-tax brackets for all filing statuses."""
+    return Response(
+        content=_BRACKETS_JSON, media_type="application/json", headers=_BRACKETS_HEADERS
+    )
+
+
 @router.get("/deductions/2024", response_model=DeductionsResponse)
-def get_deductions() -> DeductionsResponse:
+async def get_deductions() -> Response:
     """Return 2024 standard deduction amounts for all filing statuses."""
-    return DeductionsResponse(standard_deductions=STANDARD_DEDUCTION)
+    return Response(
+        content=_DEDUCTIONS_JSON, media_type="application/json", headers=_DEDUCTIONS_HEADERS
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -83,26 +162,42 @@ def get_deductions() -> DeductionsResponse:
 # ---------------------------------------------------------------------------
 
 
+# Repository calls block on SQLite, so history routes run them on worker threads —
+# at most one per pooled connection, leaving starlette's shared thread pool free.
+_DB_LIMITER = anyio.CapacityLimiter(POOL_SIZE)
+
+
+async def _run_db[T](func: Callable[..., T], *args: object) -> T:
+    """Run a blocking repository call off the event loop."""
+    return await anyio.to_thread.run_sync(func, *args, limiter=_DB_LIMITER)
+
+
 @router.get("/history", response_model=list[CalculationSummary])
-def history_list() -> list[CalculationSummary]:
-    """List all saved tax calculations (newest first)."""
-    rows = list_calculations()
-    return [CalculationSummary(**row) for row in rows]
+async def history_list(
+    limit: int | None = Query(None, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+) -> Response:
+    """List saved tax calculations (newest first): all of them, or one page if *limit* is set."""
+    # Summary rows are flat scalars straight from SQLite — no need to
+    # re-validate them through CalculationSummary before encoding.
+    rows = await _run_db(list_calculations, limit, offset)
+    return Response(content=orjson.dumps(rows), media_type="application/json")
 
 
 @router.get("/history/{calc_id}", response_model=CalculationDetail)
-def history_detail(calc_id: int) -> CalculationDetail:
+async def history_detail(calc_id: int) -> Response:
     """Return a single saved calculation with full input/result data."""
-    row = get_calculation(calc_id)
+    row = await _run_db(get_calculation, calc_id)
     if row is None:
         raise HTTPException(status_code=404, detail="Calculation not found")
-    return CalculationDetail(**row)
+    # The blobs were written by model_dump_json, so the row is already valid JSON data
+    return Response(content=orjson.dumps(row), media_type="application/json")
 
 
 @router.delete("/history/{calc_id}", response_model=DeleteResponse)
-def history_delete(calc_id: int) -> DeleteResponse:
+async def history_delete(calc_id: int) -> Response:
     """Delete a saved calculation by id."""
-    deleted = delete_calculation(calc_id)
+    deleted = await _run_db(delete_calculation, calc_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Calculation not found")
-    return DeleteResponse(success=True, message=f"Calculation {calc_id} deleted")
+    return _json(DeleteResponse(success=True, message=f"Calculation {calc_id} deleted"))
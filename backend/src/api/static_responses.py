@@ -0,0 +1,68 @@
+"""Serve constant JSON bodies before the request reaches FastAPI routing."""
+
+from collections.abc import Mapping
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class StaticJSONMiddleware:
+    """Answer GET/HEAD for fixed paths straight from pre-encoded bytes.
+
+    ``responses`` maps a full request path to ``(body, headers)``.  When the
+    headers carry an ``ETag``, a matching ``If-None-Match`` gets a bodiless 304.
+    Every other request is passed through untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        responses: Mapping[str, tuple[bytes, Mapping[str, str]]],
+    ) -> None:
+        self.app = app
+        self._responses = {
+            path: (body, _raw_headers(body, headers), headers.get("ETag"))
+            for path, (body, headers) in responses.items()
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        entry = None
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            entry = self._responses.get(scope["path"])
+        if entry is None:
+            await self.app(scope, receive, send)
+            return
+
+        body, raw_headers, etag = entry
+        if etag is not None and _etag_matches(Headers(scope=scope).get("if-none-match"), etag):
+            kept = [(k, v) for k, v in raw_headers if k in (b"etag", b"cache-control")]
+            await send({"type": "http.response.start", "status": 304, "headers": kept})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        # Fresh list each time: outer middleware (GZip) edits headers in place
+        await send({"type": "http.response.start", "status": 200, "headers": list(raw_headers)})
+        await send(
+            {"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body}
+        )
+
+
+def _raw_headers(body: bytes, headers: Mapping[str, str]) -> list[tuple[bytes, bytes]]:
+    raw = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+    raw.extend((k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items())
+    return raw
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison per RFC 9110 §13.1.2."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag.removeprefix("W/")
+        for tag in if_none_match.split(",")
+    )
@@ -13,22 +13,26 @@ Sources:
 
 from decimal import Decimal
 
+from src.models.filing_status import FilingStatus
+
 # ---------------------------------------------------------------------------
 # Filing statuses
 # ---------------------------------------------------------------------------
-# Canonical strings — match the FilingStatus enum in models/filing_status.py
-SINGLE = "SINGLE"
-MFJ = "MARRIED_FILING_JOINTLY"
-MFS = "MARRIED_FILING_SEPARATELY"
-HOH = "HEAD_OF_HOUSEHOLD"
-QSS = "QUALIFYING_SURVIVING_SPOUSE"
+# Tables below are keyed by the FilingStatus members themselves so callers can
+# index with the enum directly.  FilingStatus is a StrEnum, so lookups by the
+# canonical string ("SINGLE", ...) still resolve to the same entries.
+SINGLE = FilingStatus.SINGLE
+MFJ = FilingStatus.MARRIED_FILING_JOINTLY
+MFS = FilingStatus.MARRIED_FILING_SEPARATELY
+HOH = FilingStatus.HEAD_OF_HOUSEHOLD
+QSS = FilingStatus.QUALIFYING_SURVIVING_SPOUSE
 
 # ---------------------------------------------------------------------------
 # Federal income‑tax brackets — Rev. Proc. 2023-34, §1
 # Each entry: (upper_bound, rate).  The last bracket has no upper bound (None).
 # Brackets are cumulative — tax is computed progressively.
 # ---------------------------------------------------------------------------
-FEDERAL_BRACKETS: dict[str, list[tuple[Decimal | None, Decimal]]] = {
+FEDERAL_BRACKETS: dict[FilingStatus, list[tuple[Decimal | None, Decimal]]] = {
     SINGLE: [
         (Decimal("11600"), Decimal("0.10")),
         (Decimal("47150"), Decimal("0.12")),
@@ -76,10 +80,24 @@ FEDERAL_BRACKETS: dict[str, list[tuple[Decimal | None, Decimal]]] = {
     ],
 }
 
+# Integer mirror of FEDERAL_BRACKETS for the integer-cents path in
+# calculate_bracket_tax.  Each entry: (upper_bound, upper_bound in cents,
+# rate, rate in basis points) — the Decimal originals are kept so results
+# carry exactly the same values as the table above.
+FEDERAL_BRACKETS_CENTS: dict[
+    FilingStatus, tuple[tuple[Decimal | None, int | None, Decimal, int], ...]
+] = {
+    status: tuple(
+        (upper, None if upper is None else int(upper * 100), rate, int(rate * 10000))
+        for upper, rate in brackets
+    )
+    for status, brackets in FEDERAL_BRACKETS.items()
+}
+
 # ---------------------------------------------------------------------------
 # Standard deduction — Rev. Proc. 2023-34, §3 / IRS Pub 501
 # ---------------------------------------------------------------------------
-STANDARD_DEDUCTION: dict[str, Decimal] = {
+STANDARD_DEDUCTION: dict[FilingStatus, Decimal] = {
     SINGLE: Decimal("14600"),
     MFJ: Decimal("29200"),
     MFS: Decimal("14600"),
@@ -99,7 +117,7 @@ ADDITIONAL_DEDUCTION_MARRIED = Decimal("1550")
 # Rev. Proc. 2023-34, §1.  Rates: 0% / 15% / 20%
 # Thresholds represent the *upper bound* of taxable income for each rate.
 # ---------------------------------------------------------------------------
-CAPITAL_GAINS_THRESHOLDS: dict[str, list[tuple[Decimal | None, Decimal]]] = {
+CAPITAL_GAINS_THRESHOLDS: dict[FilingStatus, list[tuple[Decimal | None, Decimal]]] = {
     SINGLE: [
         (Decimal("47025"), Decimal("0.00")),
         (Decimal("518900"), Decimal("0.15")),
@@ -127,13 +145,26 @@ CAPITAL_GAINS_THRESHOLDS: dict[str, list[tuple[Decimal | None, Decimal]]] = {
     ],
 }
 
+# Integer mirror of CAPITAL_GAINS_THRESHOLDS for the integer-cents path in
+# preferential_rate, in the same (upper_bound, upper_bound in cents, rate,
+# rate in basis points) layout as FEDERAL_BRACKETS_CENTS.
+CAPITAL_GAINS_THRESHOLDS_CENTS: dict[
+    FilingStatus, tuple[tuple[Decimal | None, int | None, Decimal, int], ...]
+] = {
+    status: tuple(
+        (upper, None if upper is None else int(upper * 100), rate, int(rate * 10000))
+        for upper, rate in thresholds
+    )
+    for status, thresholds in CAPITAL_GAINS_THRESHOLDS.items()
+}
+
 # ---------------------------------------------------------------------------
 # Net Investment Income Tax (NIIT) — IRC §1411
 # 3.8% on lesser of net investment income or MAGI exceeding threshold
 # ---------------------------------------------------------------------------
 NIIT_RATE = Decimal("0.038")
 
-NIIT_THRESHOLDS: dict[str, Decimal] = {
+NIIT_THRESHOLDS: dict[FilingStatus, Decimal] = {
     SINGLE: Decimal("200000"),
     MFJ: Decimal("250000"),
     MFS: Decimal("125000"),
@@ -152,7 +183,7 @@ MEDICARE_RATE_EMPLOYER = Decimal("0.0145")
 
 # Additional Medicare Tax — IRC §3101(b)(2)
 ADDITIONAL_MEDICARE_RATE = Decimal("0.009")         # 0.9%
-ADDITIONAL_MEDICARE_THRESHOLDS: dict[str, Decimal] = {
+ADDITIONAL_MEDICARE_THRESHOLDS: dict[FilingStatus, Decimal] = {
     SINGLE: Decimal("200000"),
     MFJ: Decimal("250000"),
     MFS: Decimal("125000"),
@@ -169,7 +200,7 @@ SE_DEDUCTIBLE_FRACTION = Decimal("0.5")  # 50% of SE tax is above-the-line deduc
 # ---------------------------------------------------------------------------
 CHILD_TAX_CREDIT_MAX = Decimal("2000")
 CHILD_TAX_CREDIT_REFUNDABLE = Decimal("1700")  # Additional Child Tax Credit
-CHILD_TAX_CREDIT_PHASEOUT: dict[str, Decimal] = {
+CHILD_TAX_CREDIT_PHASEOUT: dict[FilingStatus, Decimal] = {
     SINGLE: Decimal("200000"),
     MFJ: Decimal("400000"),
     MFS: Decimal("200000"),
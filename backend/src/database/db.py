@@ -1,36 +1,105 @@
-"""SQLite connection manager for tax calculation persistence."""
+"""SQLite connection pool for tax calculation persistence.
 
+A small, fixed set of connections is opened up front and handed out per
+request via ``get_db()``.  Each connection runs in autocommit mode with WAL
+journalling, so readers never wait on a committing writer and no request
+serialises on a single shared connection's mutex.
+"""
+
+import queue
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 # Database file lives at backend/tax_data.db
 DB_PATH: Path = Path(__file__).resolve().parent.parent.parent / "tax_data.db"
 _SCHEMA_PATH: Path = Path(__file__).resolve().parent / "schema.sql"
 
-_connection: sqlite3.Connection | None = None
+POOL_SIZE = 4
+
+# Applied to every pooled connection.  WAL + synchronous=NORMAL is durable
+# across application crashes; cache_size is in KiB when negative (~20 MB).
+_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA wal_autocheckpoint=1000",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+)
+
+_pool: queue.Queue[sqlite3.Connection] | None = None
+# Every connection the current pool opened, borrowed or idle, so closing the
+# pool closes them all
+_pool_conns: list[sqlite3.Connection] = []
+_pool_lock = threading.Lock()
+
+
+def _connect() -> sqlite3.Connection:
+    """Open one autocommit connection with the pool's PRAGMAs applied."""
+    conn = sqlite3.connect(str(DB_PATH), check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    return conn
 
 
-def init_db() -> sqlite3.Connection:
-    """Create (or open) the database and apply the schema. Returns the connection."""
-    global _connection
-    _connection = sqlite3.connect(str(DB_PATH), check_same_thread=False)
-    _connection.row_factory = sqlite3.Row
-    schema = _SCHEMA_PATH.read_text()
-    _connection.executescript(schema)
-    return _connection
+def init_db(pool_size: int = POOL_SIZE) -> None:
+    """Create (or open) the database, apply the schema, and fill the pool."""
+    with _pool_lock:
+        _open_pool(pool_size)
 
 
-def get_db() -> sqlite3.Connection:
-    """Return the module-level connection, creating it if necessary."""
-    global _connection
-    if _connection is None:
-        return init_db()
-    return _connection
+@contextmanager
+def get_db() -> Iterator[sqlite3.Connection]:
+    """Borrow a pooled connection for the duration of the ``with`` block.
+
+    Blocks until a connection is free; the pool is created lazily on first use.
+    """
+    while True:
+        with _pool_lock:
+            if _pool is None:
+                _open_pool(POOL_SIZE)
+            pool = _pool
+        conn = pool.get()
+        if pool is _pool:
+            break
+        # The pool was closed or replaced while this thread waited; the
+        # connection handed over is a closed one from the old pool.
+        pool.put(conn)
+    try:
+        yield conn
+    finally:
+        # Returned even if the pool has since been dropped, so a thread still
+        # waiting on the old queue wakes up and retries on the current one
+        pool.put(conn)
 
 
 def close_db() -> None:
-    """Close the connection if open."""
-    global _connection
-    if _connection is not None:
-        _connection.close()
-        _connection = None
+    """Close every pooled connection."""
+    with _pool_lock:
+        _close_pool()
+
+
+def _open_pool(pool_size: int) -> None:
+    """Replace the current pool with *pool_size* fresh connections (lock held)."""
+    global _pool
+    _close_pool()
+    first = _connect()
+    first.executescript(_SCHEMA_PATH.read_text())
+    _pool_conns.append(first)
+    _pool_conns.extend(_connect() for _ in range(pool_size - 1))
+    pool: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=pool_size)
+    for conn in _pool_conns:
+        pool.put(conn)
+    _pool = pool
+
+
+def _close_pool() -> None:
+    """Close every pooled connection, borrowed ones included, and drop the pool (lock held)."""
+    global _pool
+    for conn in _pool_conns:
+        conn.close()
+    _pool_conns.clear()
+    _pool = None
@@ -1,74 +1,87 @@
 """CRUD operations for tax calculation history."""
 
-import json
+import orjson
 
 from src.database.db import get_db
 from src.models.workflow_models import FullTaxCalculationResult, TaxReturnInput
 
+_INSERT_SQL = """
+    INSERT INTO tax_calculations
+        (filing_status, input_data, total_income, agi, taxable_income,
+         federal_tax, total_credits, total_tax, effective_rate,
+         marginal_rate, refund_or_owed, result_data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    RETURNING id
+"""
 
-def save_calculation(tax_input: TaxReturnInput, result: FullTaxCalculationResult) -> int:
-    """Persist a tax calculation. Returns the new row id."""
-    conn = get_db()
+
+# Answered entirely from idx_calc_summary (see schema.sql)
+_LIST_SQL = """
+    SELECT id, created_at, filing_status, total_income, agi,
+           taxable_income, federal_tax, total_credits, total_tax,
+           effective_rate, marginal_rate, refund_or_owed
+    FROM tax_calculations
+    ORDER BY id DESC
+    LIMIT ? OFFSET ?
+"""
+
+
+def _row_params(tax_input: TaxReturnInput, result: FullTaxCalculationResult) -> tuple:
+    """Build the INSERT parameters for one calculation."""
     summary = result.summary
-    cursor = conn.execute(
-        """
-        INSERT INTO tax_calculations
-            (filing_status, input_data, total_income, agi, taxable_income,
-             federal_tax, total_credits, total_tax, effective_rate,
-             marginal_rate, refund_or_owed, result_data)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            tax_input.filing_status.value,
-            tax_input.model_dump_json(),
-            float(summary.total_income),
-            float(summary.agi),
-            float(summary.taxable_income),
-            float(summary.total_income_tax_before_credits),
-            float(summary.total_credits),
-            float(summary.total_tax),
-            float(summary.effective_rate),
-            float(summary.marginal_rate),
-            float(summary.refund_or_owed),
-            result.model_dump_json(),
-        ),
+    return (
+        tax_input.filing_status.value,
+        tax_input.model_dump_json(),
+        float(summary.total_income),
+        float(summary.agi),
+        float(summary.taxable_income),
+        float(summary.total_income_tax_before_credits),
+        float(summary.total_credits),
+        float(summary.total_tax),
+        float(summary.effective_rate),
+        float(summary.marginal_rate),
+        float(summary.refund_or_owed),
+        result.model_dump_json(),
     )
-    conn.commit()
-    return cursor.lastrowid  # type: ignore[return-value]
 
 
-def list_calculations() -> list[dict]:
-    """Return summary rows (no JSON blobs) ordered by newest first."""
-    conn = get_db()
-    rows = conn.execute(
-        """
-        SELECT id, created_at, filing_status, total_income, agi,
-               taxable_income, federal_tax, total_credits, total_tax,
-               effective_rate, marginal_rate, refund_or_owed
-        FROM tax_calculations
-        ORDER BY id DESC
-        """
-    ).fetchall()
-    return [dict(row) for row in rows]
+def save_calculation(tax_input: TaxReturnInput, result: FullTaxCalculationResult) -> int:
+    """Persist a tax calculation. Returns the new row id."""
+    # Serialise before borrowing a connection so the pool slot is held only for the INSERT
+    params = _row_params(tax_input, result)
+    with get_db() as conn:
+        return conn.execute(_INSERT_SQL, params).fetchone()[0]
+
+
+def list_calculations(limit: int | None = None, offset: int = 0) -> list[dict]:
+    """Return summary rows (no JSON blobs), newest first — all of them, or up to *limit*."""
+    with get_db() as conn:
+        # Plain tuples zipped with the column names once skip building an
+        # intermediate sqlite3.Row per result row
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        # SQLite reads a negative LIMIT as no limit
+        rows = cursor.execute(_LIST_SQL, (-1 if limit is None else limit, offset)).fetchall()
+    columns = [col[0] for col in cursor.description]
+    return [dict(zip(columns, row, strict=True)) for row in rows]
 
 
 def get_calculation(calc_id: int) -> dict | None:
     """Return a full row (including parsed JSON blobs) or None."""
-    conn = get_db()
-    row = conn.execute(
-        "SELECT * FROM tax_calculations WHERE id = ?", (calc_id,)
-    ).fetchone()
+    with get_db() as conn:
+        row = conn.execute(
+            "SELECT * FROM tax_calculations WHERE id = ?", (calc_id,)
+        ).fetchone()
     if row is None:
         return None
     result = dict(row)
-    result["input_data"] = json.loads(result["input_data"])
-    result["result_data"] = json.loads(result["result_data"])
+    result["input_data"] = orjson.loads(result["input_data"])
+    result["result_data"] = orjson.loads(result["result_data"])
     return result
 
 
 def delete_calculation(calc_id: int) -> bool:
     """Delete a calculation by id. Returns True if a row was actually deleted."""
-    conn = get_db()
-    cursor = conn.execute("DELETE FROM tax_calculations WHERE id = ?", (calc_id,))
-    conn.commit()
+    with get_db() as conn:
+        cursor = conn.execute("DELETE FROM tax_calculations WHERE id = ?", (calc_id,))
     return cursor.rowcount > 0
@@ -14,3 +14,11 @@ CREATE TABLE IF NOT EXISTS tax_calculations (
     refund_or_owed REAL NOT NULL,
     result_data TEXT NOT NULL
 );
+
+-- Covering index for list_calculations: the newest-first summary page is
+-- served from the index alone, without touching the rows' JSON blobs.
+CREATE INDEX IF NOT EXISTS idx_calc_summary ON tax_calculations (
+    id DESC, created_at, filing_status, total_income, agi, taxable_income,
+    federal_tax, total_credits, total_tax, effective_rate, marginal_rate,
+    refund_or_owed
+);
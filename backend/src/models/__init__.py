@@ -1,53 +1,64 @@
-"""Tax calculator models — re-exports for convenience."""
+"""Tax calculator models — re-exports for convenience.
 
-from src.models.exceptions import (
-    InvalidFilingStatusError,
-    MissingIncomeDataError,
-    NegativeIncomeError,
-    TaxCalculatorError,
-    UnsupportedScenarioError,
-)
-from src.models.filing_status import FilingStatus
-from src.models.tax_input import (
-    AboveLineDeductions,
-    AGIInput,
-    BracketTaxInput,
-    CapitalGainsTaxInput,
-    CreditInput,
-    FicaInput,
-    GrossIncome,
-    NiitInput,
-    QualifiedDividendTaxInput,
-    StandardDeductionInput,
-)
-from src.models.tax_output import (
-    AGIResult,
-    BracketDetail,
-    BracketTaxResult,
-    CapitalGainsTaxResult,
-    CreditResult,
-    FicaResult,
-    NiitResult,
-    PreferentialRateDetail,
-    QualifiedDividendTaxResult,
-    StandardDeductionResult,
-)
-from src.models.workflow_models import (
-    CreditsResult,
-    DeductionResult,
-    FullTaxCalculationResult,
-    Income1099B,
-    Income1099DIV,
-    Income1099INT,
-    Income1099NEC,
-    IncomeResult,
-    ItemizedDeductions,
-    TaxComputationResult,
-    TaxCredits,
-    TaxReturnInput,
-    TaxSummary,
-    W2Income,
-)
+Names resolve lazily (PEP 562), so importing one submodule such as
+``src.models.filing_status`` does not import — and build schemas for —
+every model in the package.
+"""
+
+import importlib
+from typing import Any
+
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "src.models.exceptions": (
+        "InvalidFilingStatusError",
+        "MissingIncomeDataError",
+        "NegativeIncomeError",
+        "TaxCalculatorError",
+        "UnsupportedScenarioError",
+    ),
+    "src.models.filing_status": ("FilingStatus",),
+    "src.models.tax_input": (
+        "AboveLineDeductions",
+        "AGIInput",
+        "BracketTaxInput",
+        "CapitalGainsTaxInput",
+        "CreditInput",
+        "FicaInput",
+        "GrossIncome",
+        "NiitInput",
+        "QualifiedDividendTaxInput",
+        "StandardDeductionInput",
+    ),
+    "src.models.tax_output": (
+        "AGIResult",
+        "BracketDetail",
+        "BracketTaxResult",
+        "CapitalGainsTaxResult",
+        "CreditResult",
+        "FicaResult",
+        "NiitResult",
+        "PreferentialRateDetail",
+        "QualifiedDividendTaxResult",
+        "StandardDeductionResult",
+    ),
+    "src.models.workflow_models": (
+        "CreditsResult",
+        "DeductionResult",
+        "FullTaxCalculationResult",
+        "Income1099B",
+        "Income1099DIV",
+        "Income1099INT",
+        "Income1099NEC",
+        "IncomeResult",
+        "ItemizedDeductions",
+        "TaxComputationResult",
+        "TaxCredits",
+        "TaxReturnInput",
+        "TaxSummary",
+        "W2Income",
+    ),
+}
+_LAZY: dict[str, str] = {name: module for module, names in _EXPORTS.items() for name in names}
 
 __all__ = [
     "AGIInput",
@@ -91,3 +102,17 @@ __all__ = [
     "UnsupportedScenarioError",
     "W2Income",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -2,7 +2,7 @@
 
 from decimal import Decimal
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from src.models.filing_status import FilingStatus
 
@@ -10,6 +10,8 @@ from src.models.filing_status import FilingStatus
 class GrossIncome(BaseModel):
     """All income sources — Form 1040 Lines 1-8."""
 
+    model_config = ConfigDict(frozen=True)
+
     w2_wages: Decimal = Field(default=Decimal("0"), ge=0, description="W-2 Box 1 wages")
     nec_1099: Decimal = Field(
         default=Decimal("0"), ge=0, description="1099-NEC non-employee compensation"
@@ -41,6 +43,8 @@ class GrossIncome(BaseModel):
 class AboveLineDeductions(BaseModel):
     """Above-the-line (Schedule 1) deductions — Form 1040 Line 10."""
 
+    model_config = ConfigDict(frozen=True)
+
     educator_expenses: Decimal = Field(default=Decimal("0"), ge=0)
     student_loan_interest: Decimal = Field(default=Decimal("0"), ge=0)
     hsa_deduction: Decimal = Field(default=Decimal("0"), ge=0)
@@ -2,14 +2,19 @@
 
 from decimal import Decimal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.models.filing_status import FilingStatus
 
+# Tool results are immutable once built; unknown fields are a programming error.
+_RESULT_CONFIG = ConfigDict(frozen=True, extra="forbid")
+
 
 class BracketDetail(BaseModel):
     """One bracket in the progressive tax breakdown."""
 
+    model_config = _RESULT_CONFIG
+
     rate: Decimal
     bracket_bottom: Decimal
     bracket_top: Decimal | None = None  # None = no cap (top bracket)
@@ -20,6 +25,8 @@ class BracketDetail(BaseModel):
 class BracketTaxResult(BaseModel):
     """Result of progressive bracket-tax computation."""
 
+    model_config = _RESULT_CONFIG
+
     taxable_income: Decimal
     filing_status: FilingStatus
     total_tax: Decimal
@@ -31,6 +38,8 @@ class BracketTaxResult(BaseModel):
 class StandardDeductionResult(BaseModel):
     """Result of standard deduction lookup."""
 
+    model_config = _RESULT_CONFIG
+
     filing_status: FilingStatus
     base_amount: Decimal
     additional_amount: Decimal
@@ -40,6 +49,8 @@ class StandardDeductionResult(BaseModel):
 class AGIResult(BaseModel):
     """Result of AGI calculation."""
 
+    model_config = _RESULT_CONFIG
+
     total_gross_income: Decimal
     total_above_line_deductions: Decimal
     agi: Decimal
@@ -51,6 +62,8 @@ class PreferentialRateDetail(BaseModel):
     Shared by long-term capital gains and qualified dividends — IRC §1(h).
     """
 
+    model_config = _RESULT_CONFIG
+
     rate: Decimal
     bracket_bottom: Decimal
     bracket_top: Decimal | None = None  # None = no cap (top bracket)
@@ -61,6 +74,8 @@ class PreferentialRateDetail(BaseModel):
 class CapitalGainsTaxResult(BaseModel):
     """Result of capital gains tax computation — IRC §1(h), Form 8949 / Schedule D."""
 
+    model_config = _RESULT_CONFIG
+
     short_term_gains: Decimal
     long_term_gains: Decimal
     long_term_tax: Decimal
@@ -70,6 +85,8 @@ class CapitalGainsTaxResult(BaseModel):
 class QualifiedDividendTaxResult(BaseModel):
     """Result of qualified dividend tax computation — IRC §1(h)."""
 
+    model_config = _RESULT_CONFIG
+
     qualified_dividends: Decimal
     tax: Decimal
     breakdown: list[PreferentialRateDetail]
@@ -78,6 +95,8 @@ class QualifiedDividendTaxResult(BaseModel):
 class NiitResult(BaseModel):
     """Result of Net Investment Income Tax calculation — IRC §1411."""
 
+    model_config = _RESULT_CONFIG
+
     magi: Decimal
     threshold: Decimal
     excess_magi: Decimal
@@ -88,6 +107,8 @@ class NiitResult(BaseModel):
 class FicaResult(BaseModel):
     """Result of FICA / self-employment tax calculation — IRC §§3101, 3111."""
 
+    model_config = _RESULT_CONFIG
+
     ss_tax: Decimal
     medicare_tax: Decimal
     additional_medicare_tax: Decimal
@@ -99,6 +120,8 @@ class FicaResult(BaseModel):
 class CreditResult(BaseModel):
     """Result of applying a tax credit."""
 
+    model_config = _RESULT_CONFIG
+
     tax_before: Decimal
     credit_applied: Decimal
     tax_after: Decimal
@@ -6,7 +6,7 @@ as it flows through the full tax-calculation pipeline.
 
 from decimal import Decimal
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from src.models.filing_status import FilingStatus
 
@@ -137,10 +137,17 @@ class TaxReturnInput(BaseModel):
 # Workflow OUTPUT models
 # ---------------------------------------------------------------------------
 
+# Output schemas are built on first use rather than at import, so processes
+# that never run the pipeline (CLI tools, the MCP server) don't pay for them.
+# Frozen because the orchestrator shares cached results between callers.
+_OUTPUT_CONFIG = ConfigDict(defer_build=True, frozen=True)
+
 
 class IncomeResult(BaseModel):
     """Output of the income aggregation workflow."""
 
+    model_config = _OUTPUT_CONFIG
+
     wages: Decimal = Field(description="Total W-2 wages")
     self_employment_income: Decimal = Field(description="Total 1099-NEC compensation")
     interest_income: Decimal = Field(description="Total 1099-INT interest")
@@ -157,6 +164,8 @@ class IncomeResult(BaseModel):
 class DeductionResult(BaseModel):
     """Output of the deduction workflow."""
 
+    model_config = _OUTPUT_CONFIG
+
     standard_deduction_amount: Decimal = Field(description="Standard deduction (if applicable)")
     itemized_total: Decimal = Field(description="Itemized deduction total (if applicable)")
     used_standard: bool = Field(description="True if standard deduction was used")
@@ -176,16 +185,21 @@ class DeductionResult(BaseModel):
 class TaxComputationResult(BaseModel):
     """Output of the tax computation workflow — Form 1040 Line 16+."""
 
+    model_config = _OUTPUT_CONFIG
+
     ordinary_tax: Decimal = Field(description="Tax on ordinary income (bracket tax)")
     qualified_dividend_tax: Decimal = Field(description="Tax on qualified dividends at 0/15/20%")
     capital_gains_tax: Decimal = Field(description="Tax on long-term gains at 0/15/20%")
     niit: Decimal = Field(description="Net Investment Income Tax (3.8%)")
     total_income_tax: Decimal = Field(description="Sum of all income tax components")
+    marginal_rate: Decimal = Field(description="Bracket rate at total taxable income")
 
 
 class CreditsResult(BaseModel):
     """Output of the credits workflow."""
 
+    model_config = _OUTPUT_CONFIG
+
     child_tax_credit: Decimal = Field(description="CTC amount (before refundable split)")
     nonrefundable_ctc_applied: Decimal = Field(description="Non-refundable CTC applied")
     refundable_ctc_applied: Decimal = Field(description="Additional (refundable) CTC applied")
@@ -196,6 +210,8 @@ class CreditsResult(BaseModel):
 class TaxSummary(BaseModel):
     """Final tax summary — the bottom line."""
 
+    model_config = _OUTPUT_CONFIG
+
     filing_status: FilingStatus
     total_income: Decimal
     agi: Decimal
@@ -229,6 +245,8 @@ class TaxSummary(BaseModel):
 class FullTaxCalculationResult(BaseModel):
     """Complete result including all intermediate workflow outputs — for API transparency."""
 
+    model_config = _OUTPUT_CONFIG
+
     income: IncomeResult
     fica: "FicaResult"
     agi: "AGIResult"
@@ -238,7 +256,6 @@ class FullTaxCalculationResult(BaseModel):
     summary: TaxSummary
 
 
-# Avoid circular imports — use forward refs
-from src.models.tax_output import AGIResult, FicaResult  # noqa: E402
-
-FullTaxCalculationResult.model_rebuild()
+# Avoid circular imports — use forward refs, resolved when the deferred
+# schema is first built
+from src.models.tax_output import AGIResult, FicaResult  # noqa: E402, F401
@@ -2,7 +2,11 @@
 
 from src.tools.apply_credit import apply_credit
 from src.tools.calculate_agi import calculate_agi
-from src.tools.calculate_bracket_tax import calculate_bracket_tax
+from src.tools.calculate_bracket_tax import (
+    calculate_bracket_tax,
+    calculate_bracket_tax_batch,
+    calculate_bracket_tax_totals,
+)
 from src.tools.calculate_capital_gains_tax import calculate_capital_gains_tax
 from src.tools.calculate_fica import calculate_fica
 from src.tools.calculate_niit import calculate_niit
@@ -14,6 +18,8 @@ __all__ = [
     "apply_credit",
     "calculate_agi",
     "calculate_bracket_tax",
+    "calculate_bracket_tax_batch",
+    "calculate_bracket_tax_totals",
     "calculate_capital_gains_tax",
     "calculate_fica",
     "calculate_niit",
@@ -0,0 +1,19 @@
+"""Integer-cent helpers shared by the tools' Decimal-free fast paths.
+
+Conversions are exact: an amount with sub-cent precision has no integer-cent
+form, so callers get ``None`` and fall back to their Decimal arithmetic.
+"""
+
+from decimal import Decimal
+
+
+def to_cents(amount: Decimal) -> int | None:
+    """Return *amount* as a whole number of cents, or None if it has sub-cent precision."""
+    scaled = amount.scaleb(2)
+    cents = int(scaled)
+    return cents if cents == scaled else None
+
+
+def from_cents(cents: int) -> Decimal:
+    """Two-place Decimal for *cents*, e.g. ``12345 -> Decimal("123.45")``."""
+    return Decimal(cents).scaleb(-2)
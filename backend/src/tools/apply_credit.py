@@ -7,8 +7,10 @@ Refundable credits can result in a negative tax (refund).
 from decimal import ROUND_HALF_UP, Decimal
 
 from src.models.tax_output import CreditResult
+from src.tools._cents import from_cents, to_cents
 
 TWO_PLACES = Decimal("0.01")
+_D_ZERO = Decimal("0")
 
 
 def apply_credit(
@@ -24,15 +26,29 @@ def apply_credit(
         msg = "credit_amount must be >= 0"
         raise ValueError(msg)
 
+    tax_cents = to_cents(tax_owed)
+    credit_cents = to_cents(credit_amount)
+    if tax_cents is not None and credit_cents is not None:
+        after_cents = tax_cents - credit_cents
+        if after_cents < 0 and not is_refundable:
+            after_cents = 0  # a plain compare beats a max() call on ints
+        # Trusted internal values — skip re-validating what was just computed
+        return CreditResult.model_construct(
+            tax_before=from_cents(tax_cents),
+            credit_applied=from_cents(tax_cents - after_cents),
+            tax_after=from_cents(after_cents),
+        )
+
+    # Sub-cent inputs: compute in Decimal and round each output once
     tax_after = tax_owed - credit_amount
 
     if not is_refundable:
-        tax_after = max(tax_after, Decimal("0"))
+        tax_after = max(tax_after, _D_ZERO)
 
-    credit_applied = (tax_owed - tax_after).quantize(TWO_PLACES, rounding=ROUND_HALF_UP)
+    credit_applied = (tax_owed - tax_after).quantize(TWO_PLACES, ROUND_HALF_UP)
 
-    return CreditResult(
-        tax_before=tax_owed.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
+    return CreditResult.model_construct(
+        tax_before=tax_owed.quantize(TWO_PLACES, ROUND_HALF_UP),
         credit_applied=credit_applied,
-        tax_after=tax_after.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
+        tax_after=tax_after.quantize(TWO_PLACES, ROUND_HALF_UP),
     )
@@ -1,11 +1,34 @@
 """Calculate Adjusted Gross Income (AGI) — Form 1040 Line 11."""
 
 from decimal import ROUND_HALF_UP, Decimal
+from operator import attrgetter
 
 from src.models.tax_input import AboveLineDeductions, GrossIncome
 from src.models.tax_output import AGIResult
 
 TWO_PLACES = Decimal("0.01")
+_D_ZERO = Decimal("0")
+# Shared default — AboveLineDeductions is frozen, so one instance serves every call
+_EMPTY_DEDUCTIONS = AboveLineDeductions()
+
+_INCOME_FIELDS = attrgetter(
+    "w2_wages",
+    "nec_1099",
+    "interest_income",
+    "ordinary_dividends",
+    "short_term_gains",
+    "long_term_gains",
+)
+_DEDUCTION_FIELDS = attrgetter(
+    "educator_expenses",
+    "student_loan_interest",
+    "hsa_deduction",
+    "ira_deduction",
+    "se_tax_deduction",
+    "self_employed_health_insurance",
+    "penalty_early_withdrawal",
+    "alimony_paid",
+)
 
 
 def calculate_agi(
@@ -17,38 +40,18 @@ def calculate_agi(
     Form 1040: Line 9 (total income) minus Schedule 1 Part II → Line 11 (AGI).
     """
     if above_line_deductions is None:
-        above_line_deductions = AboveLineDeductions()
-
-    total_income = sum(
-        [
-            gross_income.w2_wages,
-            gross_income.nec_1099,
-            gross_income.interest_income,
-            gross_income.ordinary_dividends,
-            gross_income.short_term_gains,
-            gross_income.long_term_gains,
-        ],
-        Decimal("0"),
+        above_line_deductions = _EMPTY_DEDUCTIONS
+
+    # C-level sums over the fields; exact in Decimal, so each total is rounded once
+    total_income = sum(_INCOME_FIELDS(gross_income), _D_ZERO)
+    total_deductions = sum(_DEDUCTION_FIELDS(above_line_deductions), _D_ZERO)
+    agi = max(total_income - total_deductions, _D_ZERO)
+
+    # Results are built with model_construct: all three fields are Decimals
+    # computed here from already-validated input models.
+    return AGIResult.model_construct(
+        total_gross_income=total_income.quantize(TWO_PLACES, ROUND_HALF_UP),
+        total_above_line_deductions=total_deductions.quantize(TWO_PLACES, ROUND_HALF_UP),
+        agi=agi.quantize(TWO_PLACES, ROUND_HALF_UP),
     )
 
-    total_deductions = sum(
-        [
-            above_line_deductions.educator_expenses,
-            above_line_deductions.student_loan_interest,
-            above_line_deductions.hsa_deduction,
-            above_line_deductions.ira_deduction,
-            above_line_deductions.se_tax_deduction,
-            above_line_deductions.self_employed_health_insurance,
-            above_line_deductions.penalty_early_withdrawal,
-            above_line_deductions.alimony_paid,
-        ],
-        Decimal("0"),
-    )
-
-    agi = max(total_income - total_deductions, Decimal("0"))
-
-    return AGIResult(
-        total_gross_income=total_income.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        total_above_line_deductions=total_deductions.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        agi=agi.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-    )
@@ -1,12 +1,20 @@
 """Progressive federal income-tax calculation — IRC §1(j), Rev. Proc. 2023-34."""
 
+from bisect import bisect_left
+from collections.abc import Iterable
 from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from typing import NamedTuple
 
-from src.data.tax_year_2024 import FEDERAL_BRACKETS
+from src.data.tax_year_2024 import FEDERAL_BRACKETS, FEDERAL_BRACKETS_CENTS
 from src.models.filing_status import FilingStatus
 from src.models.tax_output import BracketDetail, BracketTaxResult
+from src.tools._cents import from_cents, to_cents
 
 TWO_PLACES = Decimal("0.01")
+SIX_PLACES = Decimal("0.000001")
+_D_ZERO = Decimal("0")
+_DEFAULT_MARGINAL_RATE = Decimal("0.10")  # reported when income is 0
 
 
 def calculate_bracket_tax(
@@ -16,16 +24,194 @@ def calculate_bracket_tax(
     """Compute federal income tax using 2024 progressive brackets.
 
     Form 1040 Line 16 (tax from Tax Table / Tax Computation Worksheet).
+    Whole-cent incomes are answered from precomputed integer-cent tables — a
+    binary search for the marginal bracket, the cumulative tax below it, and
+    one rounded multiply.  Incomes with sub-cent precision use Decimal
+    arithmetic.  Both give identical results, memoised per (income, status).
     """
     if taxable_income < 0:
         msg = "taxable_income must be >= 0"
         raise ValueError(msg)
 
-    brackets = FEDERAL_BRACKETS[filing_status.value]
+    # Keyed on the exact string form so that equal incomes written with
+    # different precision keep their own representation in the result.
+    return _cached_bracket_tax(str(taxable_income), filing_status)
+
+
+@lru_cache(maxsize=4096)
+def _cached_bracket_tax(taxable_income: str, filing_status: FilingStatus) -> BracketTaxResult:
+    """Memoised bracket tax; results are frozen models shared between callers."""
+    return _calculate_bracket_tax(Decimal(taxable_income), filing_status)
+
+
+def _calculate_bracket_tax(
+    taxable_income: Decimal,
+    filing_status: FilingStatus,
+) -> BracketTaxResult:
+    income_cents = to_cents(taxable_income)
+    if income_cents is None:
+        return _calculate_bracket_tax_decimal(taxable_income, filing_status)
+
+    if income_cents == 0:
+        breakdown: list[BracketDetail] = []
+        total_cents = 0
+        marginal_rate = _DEFAULT_MARGINAL_RATE
+    else:
+        table = _TABLES[filing_status]
+        i, tax_cents = _marginal_bracket_tax(table, income_cents)
+        # model_construct: every field is computed here from the bracket table
+        partial = BracketDetail.model_construct(
+            rate=table.rates[i],
+            bracket_bottom=table.bottom_amounts[i],
+            bracket_top=table.top_amounts[i],
+            taxable_in_bracket=taxable_income - table.bottom_amounts[i],
+            tax_in_bracket=from_cents(tax_cents),
+        )
+        breakdown = [*table.full_details[:i], partial]
+        total_cents = table.tax_at_bottom[i] + tax_cents
+        marginal_rate = table.rates[i]
+
+    # Trusted internal values — skip re-validating what was just computed
+    return BracketTaxResult.model_construct(
+        taxable_income=taxable_income,
+        filing_status=filing_status,
+        total_tax=from_cents(total_cents),
+        effective_rate=_effective_rate(total_cents, income_cents),
+        marginal_rate=marginal_rate,
+        breakdown=breakdown,
+    )
+
+
+def calculate_bracket_tax_totals(
+    taxable_income: Decimal,
+    filing_status: FilingStatus,
+) -> tuple[Decimal, Decimal, Decimal]:
+    """Return ``(total_tax, effective_rate, marginal_rate)`` without a breakdown.
+
+    Same values as ``calculate_bracket_tax``, for callers that only need the
+    totals (e.g. the quick estimate).
+    """
+    if taxable_income < 0:
+        msg = "taxable_income must be >= 0"
+        raise ValueError(msg)
+
+    income = to_cents(taxable_income)
+    if income is None:
+        result = _calculate_bracket_tax_decimal(taxable_income, filing_status)
+        return result.total_tax, result.effective_rate, result.marginal_rate
+
+    table = _TABLES[filing_status]
+    i, tax_cents = _marginal_bracket_tax(table, income)
+    total = table.tax_at_bottom[i] + tax_cents
+    return from_cents(total), _effective_rate(total, income), table.rates[i]
+
+
+def marginal_rate(taxable_income: Decimal, filing_status: FilingStatus) -> Decimal:
+    """Rate of the bracket holding *taxable_income* (10% at zero income).
+
+    The same ``marginal_rate`` ``calculate_bracket_tax`` reports, found by a
+    binary search over the bracket tops without computing any tax.
+    """
+    table = _TABLES[filing_status]
+    return table.rates[bisect_left(table.bottom_amounts, taxable_income, lo=1) - 1]
+
+
+def calculate_bracket_tax_batch(
+    taxable_cents: Iterable[int],
+    filing_statuses: Iterable[FilingStatus],
+) -> list[int]:
+    """Bracket tax in cents for many (taxable income in cents, status) pairs.
+
+    Same per-return totals as ``calculate_bracket_tax``, from the same bracket
+    tables with no Decimal or model construction.
+    """
+    taxes = []
+    for income, status in zip(taxable_cents, filing_statuses, strict=True):
+        if income < 0:
+            msg = "taxable_income must be >= 0"
+            raise ValueError(msg)
+        table = _TABLES[status]
+        i, tax_cents = _marginal_bracket_tax(table, income)
+        taxes.append(table.tax_at_bottom[i] + tax_cents)
+    return taxes
+
+
+class _StatusTable(NamedTuple):
+    """Per-status bracket data; bracket ``i`` spans ``bottoms[i]`` to ``uppers[i]``."""
+
+    uppers: list[int]  # finite upper bounds, cents (the top bracket has none)
+    bottoms: list[int]  # bracket bottoms, cents
+    tax_at_bottom: list[int]  # cumulative tax owed at each bottom, cents
+    rates_bp: list[int]
+    rates: list[Decimal]
+    bottom_amounts: list[Decimal]  # bottoms/tops as the Decimals in FEDERAL_BRACKETS
+    top_amounts: list[Decimal | None]
+    full_details: list[BracketDetail]  # breakdown entries for completely filled brackets
+
+
+def _build_table(
+    brackets: tuple[tuple[Decimal | None, int | None, Decimal, int], ...],
+) -> _StatusTable:
+    uppers = [upper for _, upper, _, _ in brackets if upper is not None]
+    bottoms = [0, *uppers]
+    top_amounts = [upper for upper, _, _, _ in brackets]
+    bottom_amounts = [Decimal("0"), *(upper for upper in top_amounts if upper is not None)]
+    tax_at_bottom = [0]
+    full_details = []
+    for i, top in enumerate(uppers):
+        _, _, rate, rate_bp = brackets[i]
+        tax_cents = ((top - bottoms[i]) * rate_bp + 5_000) // 10_000
+        tax_at_bottom.append(tax_at_bottom[-1] + tax_cents)
+        full_details.append(
+            BracketDetail(
+                rate=rate,
+                bracket_bottom=bottom_amounts[i],
+                bracket_top=top_amounts[i],
+                taxable_in_bracket=top_amounts[i] - bottom_amounts[i],
+                tax_in_bracket=from_cents(tax_cents),
+            )
+        )
+    return _StatusTable(
+        uppers=uppers,
+        bottoms=bottoms,
+        tax_at_bottom=tax_at_bottom,
+        rates_bp=[rate_bp for _, _, _, rate_bp in brackets],
+        rates=[rate for _, _, rate, _ in brackets],
+        bottom_amounts=bottom_amounts,
+        top_amounts=top_amounts,
+        full_details=full_details,
+    )
+
+
+_TABLES = {status: _build_table(brackets) for status, brackets in FEDERAL_BRACKETS_CENTS.items()}
+
+
+def _marginal_bracket_tax(table: _StatusTable, income_cents: int) -> tuple[int, int]:
+    """Return ``(i, tax_cents)``: the bracket holding *income_cents* and the tax within it.
+
+    Rounded half-up to the cent, as for every filled bracket in the table.
+    """
+    i = bisect_left(table.uppers, income_cents)
+    return i, ((income_cents - table.bottoms[i]) * table.rates_bp[i] + 5_000) // 10_000
+
+
+def _effective_rate(total_cents: int, income_cents: int) -> Decimal:
+    """total / income rounded ROUND_HALF_UP to six places (0 if income is 0)."""
+    if income_cents <= 0:
+        return _D_ZERO
+    return Decimal((2 * total_cents * 1_000_000 + income_cents) // (2 * income_cents)).scaleb(-6)
+
+
+def _calculate_bracket_tax_decimal(
+    taxable_income: Decimal,
+    filing_status: FilingStatus,
+) -> BracketTaxResult:
+    """Decimal implementation, used when *taxable_income* has sub-cent precision."""
+    brackets = FEDERAL_BRACKETS[filing_status]
     breakdown: list[BracketDetail] = []
-    total_tax = Decimal("0")
-    prev_top = Decimal("0")
-    marginal_rate = Decimal("0.10")  # default if income is 0
+    total_tax = _D_ZERO
+    prev_top = _D_ZERO
+    marginal_rate = _DEFAULT_MARGINAL_RATE
 
     for upper_bound, rate in brackets:
         if taxable_income <= prev_top:
@@ -37,12 +223,14 @@ def calculate_bracket_tax(
         else:
             taxable_in_bracket = min(taxable_income, upper_bound) - prev_top
 
-        tax_in_bracket = (taxable_in_bracket * rate).quantize(
-            TWO_PLACES, rounding=ROUND_HALF_UP
-        )
+        tax_in_bracket = taxable_in_bracket * rate
+        if upper_bound is None or taxable_income <= upper_bound:
+            # Only the bracket holding taxable_income can carry sub-cent digits;
+            # full brackets are whole-dollar widths times two-place rates.
+            tax_in_bracket = tax_in_bracket.quantize(TWO_PLACES, ROUND_HALF_UP)
 
         breakdown.append(
-            BracketDetail(
+            BracketDetail.model_construct(
                 rate=rate,
                 bracket_bottom=bracket_bottom,
                 bracket_top=upper_bound,
@@ -56,15 +244,15 @@ def calculate_bracket_tax(
         prev_top = upper_bound if upper_bound is not None else taxable_income
 
     effective_rate = (
-        (total_tax / taxable_income).quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP)
+        (total_tax / taxable_income).quantize(SIX_PLACES, ROUND_HALF_UP)
         if taxable_income > 0
-        else Decimal("0")
+        else _D_ZERO
     )
 
-    return BracketTaxResult(
+    return BracketTaxResult.model_construct(
         taxable_income=taxable_income,
         filing_status=filing_status,
-        total_tax=total_tax.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
+        total_tax=total_tax.quantize(TWO_PLACES, ROUND_HALF_UP),
         effective_rate=effective_rate,
         marginal_rate=marginal_rate,
         breakdown=breakdown,
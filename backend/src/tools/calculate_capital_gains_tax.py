@@ -16,6 +16,7 @@ def calculate_capital_gains_tax(
     long_term_gains: Decimal,
     ordinary_income: Decimal,
     filing_status: FilingStatus,
+    include_breakdown: bool = True,
 ) -> CapitalGainsTaxResult:
     """Compute tax on capital gains.
 
@@ -23,6 +24,7 @@ def calculate_capital_gains_tax(
     - Long-term: taxed at preferential 0%/15%/20% rates stacked on ordinary income.
 
     Schedule D Tax Worksheet, Lines 18-22.
+    Pass ``include_breakdown=False`` to skip building the per-bracket detail.
     """
     if ordinary_income < 0:
         msg = "ordinary_income must be >= 0"
@@ -32,6 +34,7 @@ def calculate_capital_gains_tax(
         amount=long_term_gains,
         ordinary_income=ordinary_income,
         filing_status=filing_status,
+        include_breakdown=include_breakdown,
     )
 
     return CapitalGainsTaxResult(
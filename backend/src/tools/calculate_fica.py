@@ -19,8 +19,11 @@ from src.data.tax_year_2024 import (
 )
 from src.models.filing_status import FilingStatus
 from src.models.tax_output import FicaResult
+from src.tools._cents import from_cents, to_cents
 
 TWO_PLACES = Decimal("0.01")
+_D_ZERO = Decimal("0")
+_NO_TAX = Decimal("0.00")
 
 # 92.35% of net SE income is the taxable base — IRC §1402(a)
 SE_TAXABLE_FRACTION = Decimal("0.9235")
@@ -28,6 +31,23 @@ SE_SS_RATE = Decimal("0.124")  # combined employee + employer SS (12.4%)
 SE_MEDICARE_RATE = Decimal("0.029")  # combined employee + employer Medicare (2.9%)
 SE_DEDUCTIBLE_FRACTION = Decimal("0.5")
 
+# Integer forms for the whole-cent path: rates in basis points, limits in cents
+_SS_RATE_BP = int(SOCIAL_SECURITY_RATE_EMPLOYEE.scaleb(4))
+_MEDICARE_RATE_BP = int(MEDICARE_RATE_EMPLOYEE.scaleb(4))
+_SE_TAXABLE_BP = int(SE_TAXABLE_FRACTION.scaleb(4))
+_SE_SS_RATE_BP = int(SE_SS_RATE.scaleb(4))
+_SE_MEDICARE_RATE_BP = int(SE_MEDICARE_RATE.scaleb(4))
+_ADDITIONAL_MEDICARE_BP = int(ADDITIONAL_MEDICARE_RATE.scaleb(4))
+_SS_WAGE_BASE_CENTS = to_cents(SOCIAL_SECURITY_WAGE_BASE)
+_ADDITIONAL_MEDICARE_THRESHOLDS_CENTS = {
+    status: to_cents(threshold) for status, threshold in ADDITIONAL_MEDICARE_THRESHOLDS.items()
+}
+
+
+def _apply_bp(cents: int, rate_bp: int) -> int:
+    """``cents * rate`` rounded ROUND_HALF_UP to the cent (non-negative inputs)."""
+    return (cents * rate_bp + 5_000) // 10_000
+
 
 def calculate_fica(
     w2_wages: Decimal,
@@ -37,6 +57,8 @@ def calculate_fica(
     """Compute FICA (employee side) + self-employment tax.
 
     Schedule SE, Form 1040 Lines 4 and 14.
+    Whole-cent inputs are computed in integer cents; inputs with sub-cent
+    precision use Decimal arithmetic.  Both give identical results.
     """
     if w2_wages < 0:
         msg = "w2_wages must be >= 0"
@@ -45,36 +67,87 @@ def calculate_fica(
         msg = "self_employment_income must be >= 0"
         raise ValueError(msg)
 
+    wages = to_cents(w2_wages)
+    se_income = to_cents(self_employment_income)
+    if wages is None or se_income is None:
+        return _calculate_fica_decimal(w2_wages, self_employment_income, filing_status)
+
+    w2_ss_tax, w2_medicare_tax, se_ss_tax, se_medicare_tax, additional_medicare = _fica_cents(
+        wages, se_income, filing_status
+    )
+    se_tax = se_ss_tax + se_medicare_tax
+
+    # Trusted internal values — skip re-validating what was just computed
+    return FicaResult.model_construct(
+        ss_tax=from_cents(w2_ss_tax + se_ss_tax),
+        medicare_tax=from_cents(w2_medicare_tax + se_medicare_tax),
+        additional_medicare_tax=from_cents(additional_medicare),
+        se_tax=from_cents(se_tax),
+        se_tax_deduction=from_cents((se_tax + 1) // 2),  # 50%, half-up
+        total_fica=from_cents(w2_ss_tax + w2_medicare_tax + se_tax + additional_medicare),
+    )
+
+
+def _fica_cents(
+    wages: int, se_income: int, filing_status: FilingStatus
+) -> tuple[int, int, int, int, int]:
+    """Return ``(w2_ss, w2_medicare, se_ss, se_medicare, additional_medicare)`` in cents."""
+    # --- W-2 Employee Side ---
+    w2_ss_tax = _apply_bp(min(wages, _SS_WAGE_BASE_CENTS), _SS_RATE_BP)
+    w2_medicare_tax = _apply_bp(wages, _MEDICARE_RATE_BP)
+
+    # --- Self-Employment Tax (SE base = 92.35% of net SE income) ---
+    se_base = _apply_bp(se_income, _SE_TAXABLE_BP)
+    se_ss_wages = min(se_base, max(_SS_WAGE_BASE_CENTS - wages, 0))
+    se_ss_tax = _apply_bp(se_ss_wages, _SE_SS_RATE_BP)
+    se_medicare_tax = _apply_bp(se_base, _SE_MEDICARE_RATE_BP)
+
+    # --- Additional Medicare Tax on W-2 wages + SE base over the threshold ---
+    excess_medicare = wages + se_base - _ADDITIONAL_MEDICARE_THRESHOLDS_CENTS[filing_status]
+    additional_medicare = (
+        _apply_bp(excess_medicare, _ADDITIONAL_MEDICARE_BP) if excess_medicare > 0 else 0
+    )
+    return w2_ss_tax, w2_medicare_tax, se_ss_tax, se_medicare_tax, additional_medicare
+
+
+def _calculate_fica_decimal(
+    w2_wages: Decimal,
+    self_employment_income: Decimal,
+    filing_status: FilingStatus,
+) -> FicaResult:
+    """Decimal implementation, used when an input has sub-cent precision."""
     # --- W-2 Employee Side ---
     ss_wages = min(w2_wages, SOCIAL_SECURITY_WAGE_BASE)
     w2_ss_tax = (ss_wages * SOCIAL_SECURITY_RATE_EMPLOYEE).quantize(
-        TWO_PLACES, rounding=ROUND_HALF_UP
+        TWO_PLACES, ROUND_HALF_UP
     )
     w2_medicare_tax = (w2_wages * MEDICARE_RATE_EMPLOYEE).quantize(
-        TWO_PLACES, rounding=ROUND_HALF_UP
+        TWO_PLACES, ROUND_HALF_UP
     )
 
     # --- Self-Employment Tax ---
-    se_tax = Decimal("0")
-    se_ss_tax = Decimal("0")
-    se_medicare_tax = Decimal("0")
+    se_tax = _NO_TAX
+    se_ss_tax = _D_ZERO
+    se_medicare_tax = _D_ZERO
 
+    # SE taxable base = 92.35% of net SE income — IRC §1402(a); also feeds
+    # the Additional Medicare Tax below
+    se_base = _D_ZERO
     if self_employment_income > 0:
-        # SE taxable base = 92.35% of net SE income — IRC §1402(a)
         se_base = (self_employment_income * SE_TAXABLE_FRACTION).quantize(
-            TWO_PLACES, rounding=ROUND_HALF_UP
+            TWO_PLACES, ROUND_HALF_UP
         )
 
         # SS portion: capped at remaining wage base after W-2 wages
-        remaining_ss_base = max(SOCIAL_SECURITY_WAGE_BASE - w2_wages, Decimal("0"))
+        remaining_ss_base = max(SOCIAL_SECURITY_WAGE_BASE - w2_wages, _D_ZERO)
         se_ss_wages = min(se_base, remaining_ss_base)
         se_ss_tax = (se_ss_wages * SE_SS_RATE).quantize(
-            TWO_PLACES, rounding=ROUND_HALF_UP
+            TWO_PLACES, ROUND_HALF_UP
         )
 
         # Medicare portion: on full SE base (no cap)
         se_medicare_tax = (se_base * SE_MEDICARE_RATE).quantize(
-            TWO_PLACES, rounding=ROUND_HALF_UP
+            TWO_PLACES, ROUND_HALF_UP
         )
 
         se_tax = se_ss_tax + se_medicare_tax
@@ -83,33 +156,31 @@ def calculate_fica(
     # Applied to combined wages + SE base exceeding threshold
     # Note: for SE, the additional Medicare applies to SE income (not SE base)
     # but only the employee-equivalent portion triggers it. We use W-2 wages + SE base.
-    additional_medicare_threshold = ADDITIONAL_MEDICARE_THRESHOLDS[filing_status.value]
-    se_base_for_amt = Decimal("0")
-    if self_employment_income > 0:
-        se_base_for_amt = (self_employment_income * SE_TAXABLE_FRACTION).quantize(
-            TWO_PLACES, rounding=ROUND_HALF_UP
+    additional_medicare_threshold = ADDITIONAL_MEDICARE_THRESHOLDS[filing_status]
+    combined_for_medicare = w2_wages + se_base
+    if combined_for_medicare <= additional_medicare_threshold:
+        additional_medicare = _NO_TAX  # the common case: nothing over the threshold
+    else:
+        excess_medicare = combined_for_medicare - additional_medicare_threshold
+        additional_medicare = (excess_medicare * ADDITIONAL_MEDICARE_RATE).quantize(
+            TWO_PLACES, ROUND_HALF_UP
         )
-    combined_for_medicare = w2_wages + se_base_for_amt
-    excess_medicare = max(combined_for_medicare - additional_medicare_threshold, Decimal("0"))
-    additional_medicare = (excess_medicare * ADDITIONAL_MEDICARE_RATE).quantize(
-        TWO_PLACES, rounding=ROUND_HALF_UP
-    )
 
     # --- SE Tax Deduction (above-the-line) ---
     se_tax_deduction = (se_tax * SE_DEDUCTIBLE_FRACTION).quantize(
-        TWO_PLACES, rounding=ROUND_HALF_UP
+        TWO_PLACES, ROUND_HALF_UP
     )
 
     # --- Totals ---
     total_fica = w2_ss_tax + w2_medicare_tax + se_tax + additional_medicare
 
-    return FicaResult(
-        ss_tax=(w2_ss_tax + se_ss_tax).quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
+    return FicaResult.model_construct(
+        ss_tax=(w2_ss_tax + se_ss_tax).quantize(TWO_PLACES, ROUND_HALF_UP),
         medicare_tax=(w2_medicare_tax + se_medicare_tax).quantize(
-            TWO_PLACES, rounding=ROUND_HALF_UP
+            TWO_PLACES, ROUND_HALF_UP
         ),
         additional_medicare_tax=additional_medicare,
         se_tax=se_tax,
         se_tax_deduction=se_tax_deduction,
-        total_fica=total_fica.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
+        total_fica=total_fica.quantize(TWO_PLACES, ROUND_HALF_UP),
     )
@@ -10,8 +10,14 @@ from decimal import ROUND_HALF_UP, Decimal
 from src.data.tax_year_2024 import NIIT_RATE, NIIT_THRESHOLDS
 from src.models.filing_status import FilingStatus
 from src.models.tax_output import NiitResult
+from src.tools._cents import to_cents
 
 TWO_PLACES = Decimal("0.01")
+_D_ZERO = Decimal("0")
+_NO_TAX = Decimal("0.00")
+
+_THRESHOLDS_CENTS = {status: to_cents(t) for status, t in NIIT_THRESHOLDS.items()}
+_RATE_BP = int(NIIT_RATE.scaleb(4))  # 3.8% -> 380 basis points
 
 
 def calculate_niit(
@@ -30,11 +36,21 @@ def calculate_niit(
         msg = "net_investment_income must be >= 0"
         raise ValueError(msg)
 
-    threshold = NIIT_THRESHOLDS[filing_status.value]
-    excess_magi = max(magi - threshold, Decimal("0"))
+    threshold = NIIT_THRESHOLDS[filing_status]
+    if magi < threshold:
+        # Most filers: no excess MAGI, so no NIIT whatever the investment income
+        return NiitResult.model_construct(
+            magi=magi,
+            threshold=threshold,
+            excess_magi=_D_ZERO,
+            net_investment_income=net_investment_income,
+            niit=_NO_TAX,
+        )
+
+    excess_magi = max(magi - threshold, _D_ZERO)
 
     taxable_base = min(net_investment_income, excess_magi)
-    niit = (taxable_base * NIIT_RATE).quantize(TWO_PLACES, rounding=ROUND_HALF_UP)
+    niit = (taxable_base * NIIT_RATE).quantize(TWO_PLACES, ROUND_HALF_UP)
 
     return NiitResult(
         magi=magi,
@@ -43,3 +59,21 @@ def calculate_niit(
         net_investment_income=net_investment_income,
         niit=niit,
     )
+
+
+def niit_cents(magi_cents: int, nii_cents: int, filing_status: FilingStatus) -> int:
+    """``calculate_niit``'s ``niit`` for whole-cent inputs, in cents.
+
+    For callers that already work in integer cents and only need the tax.
+    """
+    if magi_cents < 0:
+        msg = "magi must be >= 0"
+        raise ValueError(msg)
+    if nii_cents < 0:
+        msg = "net_investment_income must be >= 0"
+        raise ValueError(msg)
+
+    excess_magi = magi_cents - _THRESHOLDS_CENTS[filing_status]
+    if excess_magi <= 0:
+        return 0
+    return (min(nii_cents, excess_magi) * _RATE_BP + 5_000) // 10_000
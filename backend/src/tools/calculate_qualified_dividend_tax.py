@@ -15,10 +15,12 @@ def calculate_qualified_dividend_tax(
     qualified_dividends: Decimal,
     ordinary_income: Decimal,
     filing_status: FilingStatus,
+    include_breakdown: bool = True,
 ) -> QualifiedDividendTaxResult:
     """Compute tax on qualified dividends at preferential rates.
 
     Qualified Dividends and Capital Gain Tax Worksheet — Form 1040, Line 16.
+    Pass ``include_breakdown=False`` to skip building the per-bracket detail.
     """
     if qualified_dividends < 0:
         msg = "qualified_dividends must be >= 0"
@@ -31,6 +33,7 @@ def calculate_qualified_dividend_tax(
         amount=qualified_dividends,
         ordinary_income=ordinary_income,
         filing_status=filing_status,
+        include_breakdown=include_breakdown,
     )
 
     return QualifiedDividendTaxResult(
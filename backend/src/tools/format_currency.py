@@ -10,10 +10,11 @@ def format_currency(amount: Decimal) -> str:
 
     Pure formatting — no Pydantic model needed.
     """
-    rounded = amount.quantize(TWO_PLACES, rounding=ROUND_HALF_UP)
-    # Normalize negative zero → positive zero
-    if rounded == 0:
-        rounded = Decimal("0.00")
+    rounded = amount.quantize(TWO_PLACES, ROUND_HALF_UP)
+    # Already exactly two places, so plain "," grouping suffices — no ".2f"
+    # re-rounding inside Decimal.__format__
     if rounded < 0:
-        return f"-${abs(rounded):,.2f}"
-    return f"${rounded:,.2f}"
+        return f"-${-rounded:,}"
+    if not rounded:
+        return "$0.00"  # also normalizes negative zero
+    return f"${rounded:,}"
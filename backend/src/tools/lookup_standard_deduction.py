@@ -22,8 +22,19 @@ def lookup_standard_deduction(
     Additional deduction (per qualifying condition):
       - Single / HoH: $1,950
       - MFJ / MFS / QSS: $1,550
+
+    There are only 20 distinct inputs, so every result is built at import
+    time and the returned frozen model is shared between callers.
     """
-    base = STANDARD_DEDUCTION[filing_status.value]
+    return _RESULTS[filing_status, is_blind, is_over_65]
+
+
+def _build_result(
+    filing_status: FilingStatus,
+    is_blind: bool,
+    is_over_65: bool,
+) -> StandardDeductionResult:
+    base = STANDARD_DEDUCTION[filing_status]
 
     per_condition = (
         ADDITIONAL_DEDUCTION_SINGLE_HOH
@@ -40,3 +51,11 @@ def lookup_standard_deduction(
         additional_amount=additional,
         total_deduction=base + additional,
     )
+
+
+_RESULTS: dict[tuple[FilingStatus, bool, bool], StandardDeductionResult] = {
+    (status, is_blind, is_over_65): _build_result(status, is_blind, is_over_65)
+    for status in FilingStatus
+    for is_blind in (False, True)
+    for is_over_65 in (False, True)
+}
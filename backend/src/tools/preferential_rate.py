@@ -7,28 +7,107 @@ which rate brackets it falls into.
 
 from decimal import ROUND_HALF_UP, Decimal
 
-from src.data.tax_year_2024 import CAPITAL_GAINS_THRESHOLDS
+from src.data.tax_year_2024 import CAPITAL_GAINS_THRESHOLDS, CAPITAL_GAINS_THRESHOLDS_CENTS
 from src.models.filing_status import FilingStatus
 from src.models.tax_output import PreferentialRateDetail
+from src.tools._cents import from_cents, to_cents
 
 TWO_PLACES = Decimal("0.01")
+_D_ZERO = Decimal("0")
+_NO_TAX = Decimal("0.00")
 
 
 def calculate_preferential_rate_tax(
     amount: Decimal,
     ordinary_income: Decimal,
     filing_status: FilingStatus,
+    include_breakdown: bool = True,
 ) -> tuple[Decimal, list[PreferentialRateDetail]]:
     """Apply 0%/15%/20% rates to *amount*, stacked on top of *ordinary_income*.
 
     Returns (total_tax, breakdown).  If amount <= 0, returns ($0, []).
+    With ``include_breakdown=False`` the breakdown is left empty, for callers
+    that only need the total.
+    Whole-cent inputs are stacked in integer cents, and their breakdown
+    amounts come back as two-place Decimals.  Sub-cent inputs use Decimal
+    arithmetic throughout.
     """
     if amount <= 0:
-        return Decimal("0.00"), []
+        return _NO_TAX, []
 
-    thresholds = CAPITAL_GAINS_THRESHOLDS[filing_status.value]
+    amount_cents = to_cents(amount)
+    ordinary_cents = to_cents(ordinary_income)
+    if amount_cents is None or ordinary_cents is None:
+        return _calculate_preferential_rate_tax_decimal(
+            amount, ordinary_income, filing_status, include_breakdown
+        )
+
+    breakdown: list[PreferentialRateDetail] = []
+    total_tax = preferential_rate_tax_cents(
+        amount_cents, ordinary_cents, filing_status, breakdown if include_breakdown else None
+    )
+    return from_cents(total_tax), breakdown
+
+
+def preferential_rate_tax_cents(
+    amount_cents: int,
+    ordinary_cents: int,
+    filing_status: FilingStatus,
+    breakdown: list[PreferentialRateDetail] | None = None,
+) -> int:
+    """Preferential-rate tax in cents on *amount_cents* stacked on *ordinary_cents*.
+
+    The integer-cent path of ``calculate_preferential_rate_tax``, for callers
+    that already hold whole cents.  Bracket details are appended to
+    *breakdown* when one is given.  Returns 0 if amount_cents <= 0.
+    """
+    total_tax = 0
+    remaining = amount_cents
+    income_so_far = ordinary_cents
+
+    for upper_bound, upper_cents, rate, rate_bp in CAPITAL_GAINS_THRESHOLDS_CENTS[filing_status]:
+        if remaining <= 0:
+            break
+
+        room = remaining if upper_cents is None else upper_cents - income_so_far
+        if room <= 0:
+            # Ordinary income already exceeds this bracket — skip
+            income_so_far = max(income_so_far, upper_cents)
+            continue
+
+        taxable_in_bracket = min(remaining, room)
+        tax_in_bracket = (taxable_in_bracket * rate_bp + 5_000) // 10_000
+
+        if breakdown is not None:
+            # Plain constructor: pydantic-core validates these five Decimal
+            # fields faster than model_construct assigns them in Python
+            breakdown.append(
+                PreferentialRateDetail(
+                    rate=rate,
+                    bracket_bottom=from_cents(income_so_far),
+                    bracket_top=upper_bound,
+                    taxable_in_bracket=from_cents(taxable_in_bracket),
+                    tax_in_bracket=from_cents(tax_in_bracket),
+                )
+            )
+
+        total_tax += tax_in_bracket
+        remaining -= taxable_in_bracket
+        income_so_far += taxable_in_bracket
+
+    return total_tax
+
+
+def _calculate_preferential_rate_tax_decimal(
+    amount: Decimal,
+    ordinary_income: Decimal,
+    filing_status: FilingStatus,
+    include_breakdown: bool = True,
+) -> tuple[Decimal, list[PreferentialRateDetail]]:
+    """Decimal implementation, used when an input has sub-cent precision."""
+    thresholds = CAPITAL_GAINS_THRESHOLDS[filing_status]
     breakdown: list[PreferentialRateDetail] = []
-    total_tax = Decimal("0")
+    total_tax = _D_ZERO
 
     # "stacking" means ordinary income has already filled the lower brackets.
     # The preferential income starts where ordinary income left off.
@@ -40,7 +119,7 @@ def calculate_preferential_rate_tax(
             break
 
         # Room left in this bracket above income already placed
-        room = remaining if upper_bound is None else max(upper_bound - income_so_far, Decimal("0"))
+        room = remaining if upper_bound is None else max(upper_bound - income_so_far, _D_ZERO)
 
         if room <= 0:
             # Ordinary income already exceeds this bracket — skip
@@ -49,21 +128,22 @@ def calculate_preferential_rate_tax(
 
         taxable_in_bracket = min(remaining, room)
         tax_in_bracket = (taxable_in_bracket * rate).quantize(
-            TWO_PLACES, rounding=ROUND_HALF_UP
+            TWO_PLACES, ROUND_HALF_UP
         )
 
-        breakdown.append(
-            PreferentialRateDetail(
-                rate=rate,
-                bracket_bottom=income_so_far,
-                bracket_top=upper_bound,
-                taxable_in_bracket=taxable_in_bracket,
-                tax_in_bracket=tax_in_bracket,
+        if include_breakdown:
+            breakdown.append(
+                PreferentialRateDetail(
+                    rate=rate,
+                    bracket_bottom=income_so_far,
+                    bracket_top=upper_bound,
+                    taxable_in_bracket=taxable_in_bracket,
+                    tax_in_bracket=tax_in_bracket,
+                )
             )
-        )
 
         total_tax += tax_in_bracket
         remaining -= taxable_in_bracket
         income_so_far += taxable_in_bracket
 
-    return total_tax.quantize(TWO_PLACES, rounding=ROUND_HALF_UP), breakdown
+    return total_tax.quantize(TWO_PLACES, ROUND_HALF_UP), breakdown
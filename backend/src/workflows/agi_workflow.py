@@ -20,7 +20,10 @@ def run_agi_workflow(
     The SE tax deduction (50% of self-employment tax) is an above-the-line
     deduction that must be computed before AGI. This workflow auto-injects it.
     """
-    gross_income = GrossIncome(
+    # Both models are assembled from already-validated pipeline data: every
+    # field is a Decimal, the ge=0 fields come from ge=0 sources, and each
+    # 1099-DIV enforces qualified <= ordinary — so validation is skipped.
+    gross_income = GrossIncome.model_construct(
         w2_wages=income.wages,
         nec_1099=income.self_employment_income,
         interest_income=income.interest_income,
@@ -30,7 +33,7 @@ def run_agi_workflow(
         long_term_gains=income.long_term_gains,
     )
 
-    above_line = AboveLineDeductions(
+    above_line = AboveLineDeductions.model_construct(
         se_tax_deduction=fica.se_tax_deduction,
         hsa_deduction=tax_return.hsa_deduction,
         student_loan_interest=tax_return.student_loan_interest,
@@ -40,3 +43,4 @@ def run_agi_workflow(
     )
 
     return calculate_agi(gross_income, above_line)
+
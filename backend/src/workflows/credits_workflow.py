@@ -9,40 +9,49 @@ from decimal import ROUND_HALF_UP, Decimal
 from src.data.tax_year_2024 import (
     CHILD_TAX_CREDIT_MAX,
     CHILD_TAX_CREDIT_PHASEOUT,
-    CHILD_TAX_CREDIT_PHASEOUT_RATE,
     CHILD_TAX_CREDIT_REFUNDABLE,
 )
 from src.models.filing_status import FilingStatus
 from src.models.tax_output import AGIResult
 from src.models.workflow_models import CreditsResult, TaxComputationResult, TaxReturnInput
-from src.tools.apply_credit import apply_credit
+from src.tools._cents import from_cents, to_cents
 
 TWO_PLACES = Decimal("0.01")
 
+_PHASEOUT_CENTS = {
+    status: to_cents(threshold) for status, threshold in CHILD_TAX_CREDIT_PHASEOUT.items()
+}
+_CTC_MAX_CENTS = to_cents(CHILD_TAX_CREDIT_MAX)
+_CTC_REFUNDABLE_CENTS = to_cents(CHILD_TAX_CREDIT_REFUNDABLE)
 
-def _calculate_child_tax_credit(
+
+def _child_tax_credit_cents(
     num_children: int,
-    agi: Decimal,
+    agi_cents: int,
+    tax_cents: int,
     filing_status: FilingStatus,
-) -> Decimal:
-    """Compute the total CTC before splitting into refundable/non-refundable.
+) -> tuple[int, int, int]:
+    """Return ``(ctc, nonrefundable_applied, refundable_applied)`` in cents.
 
-    IRC §24: $2,000 per qualifying child, phased out by $50 per $1,000
-    of AGI exceeding the threshold.
+    IRC §24: $2,000 per qualifying child, phased out by $50 per $1,000 of AGI
+    over the threshold (rounded half-up to the next $1,000).  The credit is
+    applied non-refundably up to the tax, then refundably (ACTC) up to $1,700
+    per child — the same split as two ``apply_credit`` calls, in integer cents.
     """
     if num_children <= 0:
-        return Decimal("0")
-
-    max_credit = CHILD_TAX_CREDIT_MAX * num_children
-    threshold = CHILD_TAX_CREDIT_PHASEOUT[filing_status.value]
-    excess = max(agi - threshold, Decimal("0"))
+        return 0, 0, 0
 
-    # Phaseout: $50 reduction per $1,000 of excess (round up to next $1,000)
-    # Equivalent to: ceil(excess / 1000) * 50 = excess * 0.05 rounded up
-    phaseout_units = (excess / Decimal("1000")).to_integral_value(rounding=ROUND_HALF_UP)
-    phaseout = (phaseout_units * Decimal("50")).quantize(TWO_PLACES, rounding=ROUND_HALF_UP)
+    # $1,000 = 100,000 cents, $50 = 5,000 cents
+    excess_cents = max(agi_cents - _PHASEOUT_CENTS[filing_status], 0)
+    phaseout_cents = (excess_cents + 50_000) // 100_000 * 5_000
+    ctc = max(_CTC_MAX_CENTS * num_children - phaseout_cents, 0)
 
-    return max(max_credit - phaseout, Decimal("0"))
+    after_nonrefundable = tax_cents - ctc
+    if after_nonrefundable < 0:
+        after_nonrefundable = 0
+    nonrefundable = tax_cents - after_nonrefundable
+    refundable = min(ctc - nonrefundable, _CTC_REFUNDABLE_CENTS * num_children)
+    return ctc, nonrefundable, refundable
 
 
 def run_credits_workflow(
@@ -56,47 +65,23 @@ def run_credits_workflow(
     - Non-refundable portion: up to full CTC, limited by tax liability
     - Refundable portion (ACTC): up to $1,700/child, applied after non-refundable
     """
-    total_tax = tax_computation.total_income_tax
-
-    # Child Tax Credit
-    ctc_total = _calculate_child_tax_credit(
-        num_children=tax_return.credits.num_qualifying_children,
-        agi=agi_result.agi,
-        filing_status=tax_return.filing_status,
-    )
-
-    # Split into non-refundable and refundable portions
-    # Non-refundable: limited by tax liability (cannot reduce below $0)
-    nonrefundable_result = apply_credit(
-        tax_owed=total_tax,
-        credit_amount=ctc_total,
-        is_refundable=False,
+    # AGI and tax arrive as two-place amounts from the earlier workflows
+    tax_cents = _cents(tax_computation.total_income_tax)
+    ctc, nonrefundable, refundable = _child_tax_credit_cents(
+        tax_return.credits.num_qualifying_children,
+        _cents(agi_result.agi),
+        tax_cents,
+        tax_return.filing_status,
     )
-    nonrefundable_applied = nonrefundable_result.credit_applied
-    tax_after_nonrefundable = nonrefundable_result.tax_after
-
-    # Refundable (Additional Child Tax Credit): up to $1,700 per child
-    # Only the unused portion of CTC (up to the refundable cap) becomes refundable
-    unused_ctc = ctc_total - nonrefundable_applied
-    refundable_cap = CHILD_TAX_CREDIT_REFUNDABLE * tax_return.credits.num_qualifying_children
-    refundable_amount = min(unused_ctc, refundable_cap)
-
-    refundable_result = apply_credit(
-        tax_owed=tax_after_nonrefundable,
-        credit_amount=refundable_amount,
-        is_refundable=True,
+    return CreditsResult(
+        child_tax_credit=from_cents(ctc),
+        nonrefundable_ctc_applied=from_cents(nonrefundable),
+        refundable_ctc_applied=from_cents(refundable),
+        total_credits_applied=from_cents(nonrefundable + refundable),
+        tax_after_credits=from_cents(tax_cents - nonrefundable - refundable),
     )
-    refundable_applied = refundable_result.credit_applied
 
-    total_credits = nonrefundable_applied + refundable_applied
-    tax_after = refundable_result.tax_after
 
-    return CreditsResult(
-        child_tax_credit=ctc_total.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        nonrefundable_ctc_applied=nonrefundable_applied.quantize(
-            TWO_PLACES, rounding=ROUND_HALF_UP
-        ),
-        refundable_ctc_applied=refundable_applied.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        total_credits_applied=total_credits.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        tax_after_credits=tax_after.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-    )
+def _cents(amount: Decimal) -> int:
+    """*amount* in whole cents, rounded half-up to the cent."""
+    return to_cents(amount.quantize(TWO_PLACES, ROUND_HALF_UP))
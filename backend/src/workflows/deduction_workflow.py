@@ -10,9 +10,12 @@ from decimal import ROUND_HALF_UP, Decimal
 from src.models.filing_status import FilingStatus
 from src.models.tax_output import AGIResult
 from src.models.workflow_models import DeductionResult, IncomeResult, TaxReturnInput
+from src.tools._cents import from_cents, to_cents
 from src.tools.lookup_standard_deduction import lookup_standard_deduction
 
 TWO_PLACES = Decimal("0.01")
+_ZERO = Decimal("0")
+_NO_DEDUCTION = Decimal("0.00")
 
 # SALT cap — Tax Cuts and Jobs Act §11042, IRC §164(b)(6)
 SALT_CAP_DEFAULT = Decimal("10000")
@@ -28,20 +31,20 @@ def _compute_itemized_total(
 ) -> Decimal:
     """Compute the itemized deduction total with SALT cap and medical threshold."""
     if tax_return.itemized_deductions is None:
-        return Decimal("0")
+        return _NO_DEDUCTION
 
     item = tax_return.itemized_deductions
 
     # Medical: only amount exceeding 7.5% of AGI — IRC §213(a)
     medical_floor = (agi * MEDICAL_AGI_THRESHOLD).quantize(
-        TWO_PLACES, rounding=ROUND_HALF_UP
+        TWO_PLACES, ROUND_HALF_UP
     )
-    medical_deduction = max(item.medical - medical_floor, Decimal("0"))
+    medical_deduction = max(item.medical - medical_floor, _ZERO)
 
     # SALT: capped at $10,000 ($5,000 MFS) — IRC §164(b)(6)
     salt_cap = (
         SALT_CAP_MFS
-        if tax_return.filing_status == FilingStatus.MARRIED_FILING_SEPARATELY
+        if tax_return.filing_status is FilingStatus.MARRIED_FILING_SEPARATELY
         else SALT_CAP_DEFAULT
     )
     salt_deduction = min(item.state_and_local_taxes, salt_cap)
@@ -55,7 +58,31 @@ def _compute_itemized_total(
         + item.other
     )
 
-    return total.quantize(TWO_PLACES, rounding=ROUND_HALF_UP)
+    return total.quantize(TWO_PLACES, ROUND_HALF_UP)
+
+
+def _cap_preferential(
+    qualified_divs: Decimal,
+    ltcg: Decimal,
+    taxable_income: Decimal,
+) -> tuple[Decimal, Decimal]:
+    """Scale qualified dividends and LTCG down so together they equal *taxable_income*.
+
+    Qualified dividends keep their proportional share (rounded half-up to the
+    cent); LTCG takes the rest.  Whole-cent amounts are scaled in integer
+    cents; otherwise in Decimal.
+    """
+    qd_cents = to_cents(qualified_divs)
+    ltcg_cents = to_cents(ltcg)
+    ti_cents = to_cents(taxable_income)
+    if qd_cents is not None and ltcg_cents is not None and ti_cents is not None:
+        total_cents = qd_cents + ltcg_cents
+        capped_qd = (2 * qd_cents * ti_cents + total_cents) // (2 * total_cents)
+        return from_cents(capped_qd), from_cents(ti_cents - capped_qd)
+
+    ratio = taxable_income / (qualified_divs + ltcg)
+    capped = (qualified_divs * ratio).quantize(TWO_PLACES, ROUND_HALF_UP)
+    return capped, (taxable_income - capped).quantize(TWO_PLACES, ROUND_HALF_UP)
 
 
 def run_deduction_workflow(
@@ -78,9 +105,11 @@ def run_deduction_workflow(
         is_blind=tax_return.is_blind,
         is_over_65=tax_return.is_over_65,
     )
-    standard_amount = std_result.total_deduction
+    # Rounded once here; every branch below then picks an already-rounded amount
+    standard_amount = std_result.total_deduction.quantize(TWO_PLACES, ROUND_HALF_UP)
 
-    # Itemized deduction
+    # Itemized deduction — still computed when the standard deduction is forced,
+    # since the result reports what itemizing would have given
     itemized_total = _compute_itemized_total(tax_return, agi_result.agi)
 
     # Choose higher unless forced
@@ -95,37 +124,33 @@ def run_deduction_workflow(
         deduction_amount = standard_amount
 
     # Taxable income — Form 1040 Line 15
-    taxable_income = max(agi_result.agi - deduction_amount, Decimal("0"))
+    taxable_income = max(agi_result.agi - deduction_amount, _ZERO)
 
     # Partition into ordinary vs. preferential — IRC §1(h)
     # Preferential = qualified dividends + net long-term capital gains (if positive)
     pref_qualified_divs = income.qualified_dividends
-    pref_ltcg = max(income.long_term_gains, Decimal("0"))
+    pref_ltcg = max(income.long_term_gains, _ZERO)
     total_preferential = pref_qualified_divs + pref_ltcg
 
     # If preferential exceeds taxable income, proportionally cap each component
-    if total_preferential > taxable_income and total_preferential > Decimal("0"):
-        ratio = taxable_income / total_preferential
-        pref_qualified_divs = (pref_qualified_divs * ratio).quantize(
-            TWO_PLACES, rounding=ROUND_HALF_UP
-        )
-        pref_ltcg = (taxable_income - pref_qualified_divs).quantize(
-            TWO_PLACES, rounding=ROUND_HALF_UP
+    if total_preferential > taxable_income and total_preferential > _ZERO:
+        pref_qualified_divs, pref_ltcg = _cap_preferential(
+            pref_qualified_divs, pref_ltcg, taxable_income
         )
 
     ordinary_taxable = max(
-        taxable_income - pref_qualified_divs - pref_ltcg, Decimal("0")
+        taxable_income - pref_qualified_divs - pref_ltcg, _ZERO
     )
 
     return DeductionResult(
-        standard_deduction_amount=standard_amount.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        itemized_total=itemized_total.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
+        standard_deduction_amount=standard_amount,
+        itemized_total=itemized_total,  # already rounded by _compute_itemized_total
         used_standard=used_standard,
-        deduction_amount=deduction_amount.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        taxable_income=taxable_income.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        ordinary_taxable_income=ordinary_taxable.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
+        deduction_amount=deduction_amount,
+        taxable_income=taxable_income.quantize(TWO_PLACES, ROUND_HALF_UP),
+        ordinary_taxable_income=ordinary_taxable.quantize(TWO_PLACES, ROUND_HALF_UP),
         preferential_qualified_dividends=pref_qualified_divs.quantize(
-            TWO_PLACES, rounding=ROUND_HALF_UP
+            TWO_PLACES, ROUND_HALF_UP
         ),
-        preferential_long_term_gains=pref_ltcg.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
+        preferential_long_term_gains=pref_ltcg.quantize(TWO_PLACES, ROUND_HALF_UP),
     )
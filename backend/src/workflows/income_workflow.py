@@ -5,37 +5,56 @@ IncomeResult with net investment income pre-computed for NIIT.
 """
 
 from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
 
 from src.models.workflow_models import IncomeResult, TaxReturnInput
 
 TWO_PLACES = Decimal("0.01")
+_ZERO = Decimal("0")
 
 
 def run_income_workflow(tax_return: TaxReturnInput) -> IncomeResult:
     """Aggregate all income sources from form inputs.
 
     Form 1040 Lines 1-8: Wages, interest, dividends, capital gains, other income.
+    Memoised on the income amounts alone, so re-running a return whose
+    deductions, credits or payments changed reuses the same (frozen) result.
     """
-    wages = sum((w2.wages for w2 in tax_return.w2s), Decimal("0"))
-    se_income = sum(
-        (nec.compensation for nec in tax_return.income_1099_nec), Decimal("0")
-    )
-    interest = sum(
-        (form.interest for form in tax_return.income_1099_int), Decimal("0")
-    )
-    ordinary_divs = sum(
-        (form.ordinary_dividends for form in tax_return.income_1099_div), Decimal("0")
-    )
-    qualified_divs = sum(
-        (form.qualified_dividends for form in tax_return.income_1099_div), Decimal("0")
-    )
-    st_gains = sum(
-        (form.short_term_gains for form in tax_return.income_1099_b), Decimal("0")
-    )
-    lt_gains = sum(
-        (form.long_term_gains for form in tax_return.income_1099_b), Decimal("0")
+    return _aggregate_income(
+        tuple(w2.wages for w2 in tax_return.w2s),
+        tuple(nec.compensation for nec in tax_return.income_1099_nec),
+        tuple(form.interest for form in tax_return.income_1099_int),
+        tuple(
+            (form.ordinary_dividends, form.qualified_dividends)
+            for form in tax_return.income_1099_div
+        ),
+        tuple((form.short_term_gains, form.long_term_gains) for form in tax_return.income_1099_b),
     )
 
+
+# Every field is rounded to the cent, so amounts that compare equal (and share
+# a cache key) always produce the same result whatever their precision.
+@lru_cache(maxsize=1024)
+def _aggregate_income(
+    w2_wages: tuple[Decimal, ...],
+    nec_compensation: tuple[Decimal, ...],
+    interest_amounts: tuple[Decimal, ...],
+    dividends: tuple[tuple[Decimal, Decimal], ...],
+    gains: tuple[tuple[Decimal, Decimal], ...],
+) -> IncomeResult:
+    wages = sum(w2_wages, _ZERO)
+    se_income = sum(nec_compensation, _ZERO)
+    interest = sum(interest_amounts, _ZERO)
+    # One pass per two-field form, accumulating both fields together
+    ordinary_divs = qualified_divs = _ZERO
+    for ordinary, qualified in dividends:
+        ordinary_divs += ordinary
+        qualified_divs += qualified
+    st_gains = lt_gains = _ZERO
+    for short_term, long_term in gains:
+        st_gains += short_term
+        lt_gains += long_term
+
     # Total gross income — Form 1040 Line 9
     total_gross = (
         wages + se_income + interest + ordinary_divs + st_gains + lt_gains
@@ -43,17 +62,17 @@ def run_income_workflow(tax_return: TaxReturnInput) -> IncomeResult:
 
     # Net investment income for NIIT — IRC §1411
     # Interest + ordinary dividends + net capital gains (losses capped at $0 for NII)
-    net_gains = max(st_gains + lt_gains, Decimal("0"))
+    net_gains = max(st_gains + lt_gains, _ZERO)
     nii = interest + ordinary_divs + net_gains
 
     return IncomeResult(
-        wages=wages.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        self_employment_income=se_income.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        interest_income=interest.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        ordinary_dividends=ordinary_divs.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        qualified_dividends=qualified_divs.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        short_term_gains=st_gains.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        long_term_gains=lt_gains.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        total_gross_income=total_gross.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        net_investment_income=nii.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
+        wages=wages.quantize(TWO_PLACES, ROUND_HALF_UP),
+        self_employment_income=se_income.quantize(TWO_PLACES, ROUND_HALF_UP),
+        interest_income=interest.quantize(TWO_PLACES, ROUND_HALF_UP),
+        ordinary_dividends=ordinary_divs.quantize(TWO_PLACES, ROUND_HALF_UP),
+        qualified_dividends=qualified_divs.quantize(TWO_PLACES, ROUND_HALF_UP),
+        short_term_gains=st_gains.quantize(TWO_PLACES, ROUND_HALF_UP),
+        long_term_gains=lt_gains.quantize(TWO_PLACES, ROUND_HALF_UP),
+        total_gross_income=total_gross.quantize(TWO_PLACES, ROUND_HALF_UP),
+        net_investment_income=nii.quantize(TWO_PLACES, ROUND_HALF_UP),
     )
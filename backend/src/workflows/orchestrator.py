@@ -3,7 +3,10 @@
 This is the single entry point that the API (Phase 3) will call.
 """
 
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 
 from src.models.workflow_models import FullTaxCalculationResult, TaxReturnInput
 from src.workflows.agi_workflow import run_agi_workflow
@@ -16,8 +19,17 @@ from src.workflows.tax_computation_workflow import run_tax_computation_workflow
 
 logger = logging.getLogger(__name__)
 
+# Recently computed results, keyed by a digest of the input's JSON form and
+# kept in LRU order.  Results are frozen models, so sharing them is safe.
+RESULT_CACHE_SIZE = 1024
+_result_cache: OrderedDict[bytes, FullTaxCalculationResult] = OrderedDict()
+_result_cache_lock = threading.Lock()
 
-def calculate_full_tax(tax_return: TaxReturnInput) -> FullTaxCalculationResult:
+
+def calculate_full_tax(
+    tax_return: TaxReturnInput,
+    persist: bool = True,
+) -> FullTaxCalculationResult:
     """Run the full tax-calculation pipeline.
 
     Pipeline order:
@@ -28,7 +40,41 @@ def calculate_full_tax(tax_return: TaxReturnInput) -> FullTaxCalculationResult:
     5. Tax Computation → bracket + preferential + NIIT
     6. Credits → apply CTC and other credits
     7. Summary → final liability, rates, refund/owed
+
+    The pipeline is deterministic, so repeated inputs are answered from an
+    LRU cache.  With ``persist`` (the default) every call, cached or not, is
+    saved to the history database before returning; pass ``persist=False``
+    to skip that or to save later via ``persist_calculation``.
     """
+    key = hashlib.blake2b(tax_return.model_dump_json().encode(), digest_size=16).digest()
+    with _result_cache_lock:
+        result = _result_cache.get(key)
+        if result is not None:
+            _result_cache.move_to_end(key)
+
+    if result is None:
+        result = _run_pipeline(tax_return)
+        with _result_cache_lock:
+            _result_cache[key] = result
+            while len(_result_cache) > RESULT_CACHE_SIZE:
+                _result_cache.popitem(last=False)
+
+    if persist:
+        persist_calculation(tax_return, result)
+    return result
+
+
+def persist_calculation(tax_return: TaxReturnInput, result: FullTaxCalculationResult) -> None:
+    """Save one calculation to SQLite; failures are logged, never raised."""
+    try:
+        from src.database.repository import save_calculation
+
+        save_calculation(tax_return, result)
+    except Exception:
+        logger.warning("Failed to auto-save calculation to database", exc_info=True)
+
+
+def _run_pipeline(tax_return: TaxReturnInput) -> FullTaxCalculationResult:
     filing_status = tax_return.filing_status
 
     # 1. Income aggregation
@@ -56,7 +102,7 @@ def calculate_full_tax(tax_return: TaxReturnInput) -> FullTaxCalculationResult:
         tax_return, income, agi, deductions, tax_computation, credits, fica
     )
 
-    result = FullTaxCalculationResult(
+    return FullTaxCalculationResult(
         income=income,
         fica=fica,
         agi=agi,
@@ -65,13 +111,3 @@ def calculate_full_tax(tax_return: TaxReturnInput) -> FullTaxCalculationResult:
         credits=credits,
         summary=summary,
     )
-
-    # Auto-persist to SQLite
-    try:
-        from src.database.repository import save_calculation
-
-        save_calculation(tax_return, result)
-    except Exception:
-        logger.warning("Failed to auto-save calculation to database", exc_info=True)
-
-    return result
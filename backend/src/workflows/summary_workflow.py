@@ -15,9 +15,10 @@ from src.models.workflow_models import (
     TaxReturnInput,
     TaxSummary,
 )
-from src.tools.calculate_bracket_tax import calculate_bracket_tax
 
 TWO_PLACES = Decimal("0.01")
+SIX_PLACES = Decimal("0.000001")
+_ZERO = Decimal("0")
 
 
 def run_summary_workflow(
@@ -35,10 +36,14 @@ def run_summary_workflow(
     Refund/owed = income tax after credits - total payments
     (FICA is a separate obligation and is not offset by income tax payments.)
     """
-    # Auto-sum W-2 withholding from all W-2s
-    total_withholding = sum(
-        (w2.federal_withholding for w2 in tax_return.w2s), Decimal("0")
-    )
+    # Auto-sum W-2 withholding from all W-2s (most returns have none or one)
+    w2s = tax_return.w2s
+    if not w2s:
+        total_withholding = _ZERO
+    elif len(w2s) == 1:
+        total_withholding = w2s[0].federal_withholding
+    else:
+        total_withholding = sum([w2.federal_withholding for w2 in w2s], _ZERO)
 
     total_payments = total_withholding + tax_return.estimated_payments
 
@@ -50,52 +55,39 @@ def run_summary_workflow(
     # Only income tax is offset by withholding/estimated payments
     refund_or_owed = income_tax_after_credits - total_payments
 
-    # Effective rate = total tax / total income (0 if no income)
+    # Effective rate = total tax / total income (0 if no income).  Net capital
+    # losses can push gross income below zero, so this is a sign test, not truthiness.
+    gross = income.total_gross_income
     effective_rate = (
-        (total_tax / income.total_gross_income).quantize(
-            Decimal("0.000001"), rounding=ROUND_HALF_UP
-        )
-        if income.total_gross_income > Decimal("0")
-        else Decimal("0")
-    )
-
-    # Marginal rate — use the bracket tax tool to determine the bracket
-    # Use total taxable income to find the marginal bracket
-    bracket_result = calculate_bracket_tax(
-        taxable_income=deductions.taxable_income,
-        filing_status=tax_return.filing_status,
+        (total_tax / gross).quantize(SIX_PLACES, ROUND_HALF_UP)
+        if gross > _ZERO
+        else _ZERO
     )
-    marginal_rate = bracket_result.marginal_rate
 
-    return TaxSummary(
+    # Upstream workflow and tool results are already rounded to the cent; only
+    # the amounts summed here from raw form inputs still need rounding.  Every
+    # field is a Decimal (or the validated filing status), so validation is skipped.
+    return TaxSummary.model_construct(
         filing_status=tax_return.filing_status,
-        total_income=income.total_gross_income.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        agi=agi_result.agi.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        deduction_amount=deductions.deduction_amount.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        taxable_income=deductions.taxable_income.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        ordinary_tax=tax_computation.ordinary_tax.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        qualified_dividend_tax=tax_computation.qualified_dividend_tax.quantize(
-            TWO_PLACES, rounding=ROUND_HALF_UP
-        ),
-        capital_gains_tax=tax_computation.capital_gains_tax.quantize(
-            TWO_PLACES, rounding=ROUND_HALF_UP
-        ),
-        niit=tax_computation.niit.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        total_income_tax_before_credits=tax_computation.total_income_tax.quantize(
-            TWO_PLACES, rounding=ROUND_HALF_UP
-        ),
-        total_credits=credits.total_credits_applied.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        income_tax_after_credits=income_tax_after_credits.quantize(
-            TWO_PLACES, rounding=ROUND_HALF_UP
-        ),
-        total_fica=fica.total_fica.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        total_tax=total_tax.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
+        total_income=income.total_gross_income,
+        agi=agi_result.agi,
+        deduction_amount=deductions.deduction_amount,
+        taxable_income=deductions.taxable_income,
+        ordinary_tax=tax_computation.ordinary_tax,
+        qualified_dividend_tax=tax_computation.qualified_dividend_tax,
+        capital_gains_tax=tax_computation.capital_gains_tax,
+        niit=tax_computation.niit,
+        total_income_tax_before_credits=tax_computation.total_income_tax,
+        total_credits=credits.total_credits_applied,
+        income_tax_after_credits=income_tax_after_credits,
+        total_fica=fica.total_fica,
+        total_tax=total_tax,
         effective_rate=effective_rate,
-        marginal_rate=marginal_rate,
-        total_withholding=total_withholding.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
+        marginal_rate=tax_computation.marginal_rate,
+        total_withholding=total_withholding.quantize(TWO_PLACES, ROUND_HALF_UP),
         estimated_payments=tax_return.estimated_payments.quantize(
-            TWO_PLACES, rounding=ROUND_HALF_UP
+            TWO_PLACES, ROUND_HALF_UP
         ),
-        total_payments=total_payments.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
-        refund_or_owed=refund_or_owed.quantize(TWO_PLACES, rounding=ROUND_HALF_UP),
+        total_payments=total_payments.quantize(TWO_PLACES, ROUND_HALF_UP),
+        refund_or_owed=refund_or_owed.quantize(TWO_PLACES, ROUND_HALF_UP),
     )
@@ -10,10 +10,10 @@ from decimal import ROUND_HALF_UP, Decimal
 from src.models.filing_status import FilingStatus
 from src.models.tax_output import AGIResult
 from src.models.workflow_models import DeductionResult, IncomeResult, TaxComputationResult
-from src.tools.calculate_bracket_tax import calculate_bracket_tax
-from src.tools.calculate_capital_gains_tax import calculate_capital_gains_tax
-from src.tools.calculate_niit import calculate_niit
-from src.tools.calculate_qualified_dividend_tax import calculate_qualified_dividend_tax
+from src.tools._cents import from_cents, to_cents
+from src.tools.calculate_bracket_tax import calculate_bracket_tax_batch, marginal_rate
+from src.tools.calculate_niit import niit_cents
+from src.tools.preferential_rate import preferential_rate_tax_cents
 
 TWO_PLACES = Decimal("0.01")
 
@@ -32,43 +32,17 @@ def run_tax_computation_workflow(
     3. Long-term capital gains tax at 0/15/20%, stacked on ordinary + qualified divs
     4. NIIT (3.8% on lesser of NII or MAGI excess) — IRC §1411
     """
-    # 1. Bracket tax on ordinary taxable income
-    bracket_result = calculate_bracket_tax(
-        taxable_income=deductions.ordinary_taxable_income,
-        filing_status=filing_status,
-    )
-    ordinary_tax = bracket_result.total_tax
-
-    # 2. Qualified dividend tax — stacked on ordinary income
-    div_result = calculate_qualified_dividend_tax(
-        qualified_dividends=deductions.preferential_qualified_dividends,
+    ordinary_tax, qualified_div_tax, capital_gains_tax, niit = _compute_all_taxes(
+        filing_status,
         ordinary_income=deductions.ordinary_taxable_income,
-        filing_status=filing_status,
-    )
-    qualified_div_tax = div_result.tax
-
-    # 3. Long-term capital gains tax — stacked on ordinary + qualified divs
-    # Per IRC §1(h), LTCG stacks above qualified dividends
-    stacking_base = deductions.ordinary_taxable_income + deductions.preferential_qualified_dividends
-    cg_result = calculate_capital_gains_tax(
-        short_term_gains=Decimal("0"),  # ST gains already included in ordinary taxable
+        qualified_dividends=deductions.preferential_qualified_dividends,
         long_term_gains=deductions.preferential_long_term_gains,
-        ordinary_income=stacking_base,
-        filing_status=filing_status,
-    )
-    capital_gains_tax = cg_result.long_term_tax
-
-    # 4. NIIT — IRC §1411, Form 8960
-    # MAGI ≈ AGI for most taxpayers (no foreign exclusions here)
-    niit_result = calculate_niit(
+        # MAGI ≈ AGI for most taxpayers (no foreign exclusions here)
         magi=agi_result.agi,
         net_investment_income=income.net_investment_income,
-        filing_status=filing_status,
     )
-    niit = niit_result.niit
-
     total = (ordinary_tax + qualified_div_tax + capital_gains_tax + niit).quantize(
-        TWO_PLACES, rounding=ROUND_HALF_UP
+        TWO_PLACES, ROUND_HALF_UP
     )
 
     return TaxComputationResult(
@@ -77,4 +51,47 @@ def run_tax_computation_workflow(
         capital_gains_tax=capital_gains_tax,
         niit=niit,
         total_income_tax=total,
+        # Preferential income stacks on top of ordinary income, so the bracket
+        # that matters is the one holding total taxable income
+        marginal_rate=marginal_rate(deductions.taxable_income, filing_status),
     )
+
+
+def _compute_all_taxes(
+    filing_status: FilingStatus,
+    ordinary_income: Decimal,
+    qualified_dividends: Decimal,
+    long_term_gains: Decimal,
+    magi: Decimal,
+    net_investment_income: Decimal,
+) -> tuple[Decimal, Decimal, Decimal, Decimal]:
+    """Return ``(ordinary_tax, qualified_dividend_tax, capital_gains_tax, niit)``.
+
+    The earlier workflows hand over two-place amounts, so everything is taxed
+    in one pass of integer-cent arithmetic through the tools' cent helpers:
+    the bracket ladder, both preferential stacks, and NIIT.  The tools raise
+    ValueError for negative amounts, as they do for Decimal inputs.
+    """
+    ordinary = _cents(ordinary_income)
+    qualified = _cents(qualified_dividends)
+    gains = _cents(long_term_gains)
+
+    (ordinary_tax,) = calculate_bracket_tax_batch((ordinary,), (filing_status,))
+    # Most returns have no preferential or investment income: skip those steps
+    qualified_tax = gains_tax = 0
+    if qualified > 0 or gains > 0:
+        # Qualified dividends stack on ordinary income; LTCG stacks on both (IRC §1(h))
+        qualified_tax = preferential_rate_tax_cents(qualified, ordinary, filing_status)
+        gains_tax = preferential_rate_tax_cents(gains, ordinary + qualified, filing_status)
+    niit = niit_cents(_cents(magi), _cents(net_investment_income), filing_status)
+    return (
+        from_cents(ordinary_tax),
+        from_cents(qualified_tax),
+        from_cents(gains_tax),
+        from_cents(niit),
+    )
+
+
+def _cents(amount: Decimal) -> int:
+    """*amount* in whole cents, rounded half-up as the earlier workflows round."""
+    return to_cents(amount.quantize(TWO_PLACES, ROUND_HALF_UP))
@@ -0,0 +1,84 @@
+"""Tests for the SQLite connection pool."""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from src.database import db as db_module
+from src.database import repository
+
+
+@pytest.fixture(autouse=True)
+def _isolate_db(tmp_path, monkeypatch):
+    """Point the connection pool at a temporary database for every test."""
+    monkeypatch.setattr(db_module, "DB_PATH", tmp_path / "test_pool.db")
+    db_module.init_db(pool_size=2)
+    yield
+    db_module.close_db()
+
+
+class TestConnectionPool:
+    def test_nested_borrows_get_distinct_connections(self):
+        with db_module.get_db() as first, db_module.get_db() as second:
+            assert first is not second
+
+    def test_connection_returned_to_pool(self):
+        with db_module.get_db() as first:
+            pass
+        with db_module.get_db() as again, db_module.get_db() as other:
+            assert first in (again, other)
+
+    def test_wal_and_autocommit(self):
+        with db_module.get_db() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.isolation_level is None
+
+    def test_schema_applied(self):
+        with db_module.get_db() as conn:
+            row = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?",
+                ("tax_calculations",),
+            ).fetchone()
+        assert row is not None
+
+    def test_list_query_uses_covering_index(self):
+        with db_module.get_db() as conn:
+            plan = conn.execute(
+                f"EXPLAIN QUERY PLAN {repository._LIST_SQL}", (10, 0)
+            ).fetchall()
+        assert any("COVERING INDEX idx_calc_summary" in row["detail"] for row in plan)
+
+    def test_lazy_init_after_close(self):
+        db_module.close_db()
+        with db_module.get_db() as conn:
+            assert conn.execute("SELECT 1").fetchone()[0] == 1
+
+    def test_close_closes_borrowed_connections(self):
+        with db_module.get_db() as conn:
+            db_module.close_db()
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+        with db_module.get_db() as fresh:
+            assert fresh is not conn
+            assert fresh.execute("SELECT 1").fetchone()[0] == 1
+
+    def test_waiter_moves_to_replacement_pool(self):
+        borrowed = []
+        got = threading.Event()
+
+        def wait_for_connection():
+            with db_module.get_db() as conn:
+                borrowed.append(conn)
+                conn.execute("SELECT 1")
+                got.set()
+
+        with db_module.get_db() as first, db_module.get_db() as second:
+            waiter = threading.Thread(target=wait_for_connection)
+            waiter.start()
+            time.sleep(0.05)  # let the waiter block on the exhausted pool
+            db_module.init_db(pool_size=2)
+        waiter.join(timeout=5)
+        assert got.is_set()
+        assert borrowed[0] not in (first, second)
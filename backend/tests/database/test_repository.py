@@ -1,8 +1,5 @@
 """Tests for the SQLite database repository layer."""
 
-import sqlite3
-from unittest.mock import patch
-
 import pytest
 
 from src.database import db as db_module
@@ -19,25 +16,13 @@ from src.workflows.orchestrator import calculate_full_tax
 # Fixtures
 # ---------------------------------------------------------------------------
 
-def _make_test_connection(tmp_path):
-    """Create a fresh in-memory-style SQLite DB in tmp_path and return it."""
-    db_path = tmp_path / "test_tax.db"
-    conn = sqlite3.connect(str(db_path), check_same_thread=False)
-    conn.row_factory = sqlite3.Row
-    schema = db_module._SCHEMA_PATH.read_text()
-    conn.executescript(schema)
-    return conn
-
-
 @pytest.fixture(autouse=True)
 def _isolate_db(tmp_path, monkeypatch):
-    """Redirect the repository to a temporary database for every test."""
-    conn = _make_test_connection(tmp_path)
-    monkeypatch.setattr(db_module, "_connection", conn)
-    # Make get_db() always return our test connection
-    monkeypatch.setattr(db_module, "get_db", lambda: conn)
+    """Point the connection pool at a temporary database for every test."""
+    monkeypatch.setattr(db_module, "DB_PATH", tmp_path / "test_tax.db")
+    db_module.init_db()
     yield
-    conn.close()
+    db_module.close_db()
 
 
 def _sample_input() -> TaxReturnInput:
@@ -48,11 +33,14 @@ def _sample_input() -> TaxReturnInput:
 
 
 def _sample_result(tax_input: TaxReturnInput | None = None) -> FullTaxCalculationResult:
-    """Build a result via the orchestrator but suppress the auto-save side effect."""
+    """Build a result via the orchestrator without its auto-save side effect.
+
+    Repeat inputs are answered from the orchestrator's result cache, so tests
+    that reuse ``_sample_input()`` share one computed result.
+    """
     if tax_input is None:
         tax_input = _sample_input()
-    with patch("src.database.repository.save_calculation"):
-        return calculate_full_tax(tax_input)
+    return calculate_full_tax(tax_input, persist=False)
 
 
 # ---------------------------------------------------------------------------
@@ -106,6 +94,22 @@ class TestListCalculations:
         assert rows[0]["id"] == id2
         assert rows[1]["id"] == id1
 
+    def test_limit_and_offset(self):
+        tax_input = _sample_input()
+        result = _sample_result(tax_input)
+        ids = [save_calculation(tax_input, result) for _ in range(3)]
+
+        assert [r["id"] for r in list_calculations(limit=2)] == [ids[2], ids[1]]
+        assert [r["id"] for r in list_calculations(limit=2, offset=2)] == [ids[0]]
+
+    def test_no_limit_by_default(self):
+        tax_input = _sample_input()
+        result = _sample_result(tax_input)
+        for _ in range(150):
+            save_calculation(tax_input, result)
+
+        assert len(list_calculations()) == 150
+
 
 class TestGetCalculation:
     def test_returns_full_row(self):
@@ -1,5 +1,6 @@
 """Integration tests for the analysis API endpoints."""
 
+import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -18,17 +19,10 @@ client = TestClient(app)
 @pytest.fixture(autouse=True)
 def _isolate_db(tmp_path, monkeypatch):
     """Redirect the database to a temporary path for every test."""
-    import sqlite3
-
-    db_path = tmp_path / "test_tax.db"
-    conn = sqlite3.connect(str(db_path), check_same_thread=False)
-    conn.row_factory = sqlite3.Row
-    schema = db_module._SCHEMA_PATH.read_text()
-    conn.executescript(schema)
-    monkeypatch.setattr(db_module, "_connection", conn)
-    monkeypatch.setattr(db_module, "get_db", lambda: conn)
+    monkeypatch.setattr(db_module, "DB_PATH", tmp_path / "test_tax.db")
+    db_module.init_db()
     yield
-    conn.close()
+    db_module.close_db()
 
 
 # ---------------------------------------------------------------------------
@@ -101,3 +95,41 @@ class TestMockedToolCalls:
         assert resp.status_code == 200
         assert "Executive Summary" in resp.json()["result"]
         mock_fn.assert_awaited_once_with("Full report")
+
+
+# ---------------------------------------------------------------------------
+# Tests: Malformed chart specs from the model
+# ---------------------------------------------------------------------------
+
+class TestChartSpecShape:
+    """A chart spec of the wrong shape comes back as an error message, not a 500."""
+
+    @pytest.fixture(autouse=True)
+    def _set_api_key(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key-123")
+
+    def _chart_with_spec(self, spec: dict) -> str:
+        plan = json.dumps({"sql": "SELECT 'a' AS x, 1 AS y", "chart": spec})
+        with patch(
+            "mcp_server.tools.create_chart.ask_claude", new_callable=AsyncMock
+        ) as mock_ask:
+            mock_ask.return_value = plan
+            resp = client.post("/api/analysis/chart", json={"prompt": "Bar chart"})
+        assert resp.status_code == 200
+        return resp.json()["result"]
+
+    def test_list_type(self):
+        result = self._chart_with_spec({"type": ["bar"], "x": "x", "y": "y"})
+        assert result.startswith("Error building chart: chart 'type' must be a string")
+
+    def test_non_string_y(self):
+        result = self._chart_with_spec({"type": "bar", "x": "x", "y": 5})
+        assert result.startswith("Error building chart: chart 'y' must be")
+
+    def test_list_x(self):
+        result = self._chart_with_spec({"type": "bar", "x": ["a"], "y": "y"})
+        assert result.startswith("Error building chart: chart 'x' must be a string")
+
+    def test_y_list_with_non_string(self):
+        result = self._chart_with_spec({"type": "bar", "x": "x", "y": ["y", 1]})
+        assert result.startswith("Error building chart: chart 'y' must be")
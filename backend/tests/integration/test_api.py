@@ -2,6 +2,7 @@
 
 from decimal import Decimal
 
+import pytest
 from starlette.testclient import TestClient
 
 from src.api.main import app
@@ -68,6 +69,34 @@ class TestFullCalculation:
         assert "capital_gains_tax" in tax_comp
         assert "qualified_dividend_tax" in tax_comp
 
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"filing_status": "SINGLE"},
+            {"filing_status": "SINGLE", "w2s": [{"wages": "75000.005"}]},
+            {
+                "filing_status": "HEAD_OF_HOUSEHOLD",
+                "income_1099_nec": [{"compensation": "85000"}],
+                "credits": {"num_qualifying_children": 2},
+                "estimated_payments": "1000",
+            },
+            {
+                "filing_status": "MARRIED_FILING_JOINTLY",
+                "w2s": [{"wages": "300000", "federal_withholding": "60000"}],
+                "income_1099_b": [{"long_term_gains": "-5000"}],
+                "itemized_deductions": {"mortgage_interest": "30000", "medical": "40000"},
+            },
+        ],
+    )
+    def test_money_fields_rounded_to_cents(self, payload):
+        """Every workflow amount reaches the client with exactly two decimal places."""
+        data = client.post("/api/calculate", json=payload).json()
+        rates = {"effective_rate", "marginal_rate", "filing_status", "used_standard"}
+        for section in ("deductions", "tax_computation", "credits", "summary"):
+            for field, value in data[section].items():
+                if field not in rates:
+                    assert Decimal(value).as_tuple().exponent == -2, (section, field, value)
+
     def test_invalid_filing_status_returns_422(self):
         """Invalid filing status should return 422."""
         payload = {
@@ -117,6 +146,46 @@ class TestQuickEstimate:
         # Marginal rate for 85400 single should be 22%
         assert Decimal(data["marginal_rate"]) == Decimal("0.22")
 
+    def test_repeat_estimate_keeps_input_precision(self):
+        """Memoised estimates echo each request's own income representation."""
+        first = client.post(
+            "/api/calculate/estimate",
+            json={"gross_income": "50000", "filing_status": "SINGLE"},
+        )
+        second = client.post(
+            "/api/calculate/estimate",
+            json={"gross_income": "50000.00", "filing_status": "SINGLE"},
+        )
+        assert first.json()["gross_income"] == "50000"
+        assert second.json()["gross_income"] == "50000.00"
+        assert first.json()["estimated_tax"] == second.json()["estimated_tax"]
+        assert first.headers["cache-control"] == "private, max-age=60"
+
+    def test_estimate_from_integer_cents(self):
+        """gross_income_cents is an exact alternative to the decimal amount."""
+        by_cents = client.post(
+            "/api/calculate/estimate",
+            json={"gross_income_cents": 10_000_000, "filing_status": "SINGLE"},
+        )
+        by_amount = client.post(
+            "/api/calculate/estimate",
+            json={"gross_income": "100000.00", "filing_status": "SINGLE"},
+        )
+        assert by_cents.status_code == 200
+        assert by_cents.json() == by_amount.json()
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"filing_status": "SINGLE"},
+            {"gross_income": "1", "gross_income_cents": 100, "filing_status": "SINGLE"},
+            {"gross_income_cents": "100", "filing_status": "SINGLE"},
+        ],
+    )
+    def test_invalid_income_fields_rejected(self, payload):
+        resp = client.post("/api/calculate/estimate", json=payload)
+        assert resp.status_code == 422
+
 
 # ---------------------------------------------------------------------------
 # GET /api/brackets/2024 — tax brackets
@@ -161,6 +230,27 @@ class TestBrackets:
                 f"{status} top bracket should have no upper bound"
             )
 
+    def test_cacheable_response_headers(self):
+        """Static bracket data should be served with long-lived caching headers."""
+        first = client.get("/api/brackets/2024")
+        second = client.get("/api/brackets/2024")
+
+        assert "immutable" in first.headers["cache-control"]
+        assert first.headers["etag"] == second.headers["etag"]
+        assert first.content == second.content
+
+    def test_matching_etag_returns_304(self):
+        etag = client.get("/api/brackets/2024").headers["etag"]
+        resp = client.get("/api/brackets/2024", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["etag"] == etag
+
+    def test_stale_etag_returns_body(self):
+        resp = client.get("/api/brackets/2024", headers={"If-None-Match": '"stale"'})
+        assert resp.status_code == 200
+        assert "brackets" in resp.json()
+
 
 # ---------------------------------------------------------------------------
 # GET /api/deductions/2024 — standard deductions
@@ -203,3 +293,28 @@ class TestDeductions:
             assert Decimal(data["standard_deductions"][status]) == Decimal(amount), (
                 f"{status}: expected {amount}, got {data['standard_deductions'][status]}"
             )
+
+
+# ---------------------------------------------------------------------------
+# Middleware — CORS preflight and compression
+# ---------------------------------------------------------------------------
+
+
+class TestMiddleware:
+    """CORS preflight caching and gzip behaviour."""
+
+    def test_preflight_is_cacheable(self):
+        resp = client.options(
+            "/api/calculate",
+            headers={
+                "Origin": "http://localhost:5173",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "Content-Type",
+            },
+        )
+        assert resp.status_code == 200
+        assert resp.headers["access-control-max-age"] == "86400"
+
+    def test_large_payload_gzipped(self):
+        resp = client.get("/api/brackets/2024", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
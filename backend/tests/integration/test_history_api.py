@@ -1,7 +1,5 @@
 """Integration tests for the /api/history endpoints."""
 
-import sqlite3
-
 import pytest
 from starlette.testclient import TestClient
 
@@ -18,15 +16,10 @@ client = TestClient(app)
 @pytest.fixture(autouse=True)
 def _isolate_db(tmp_path, monkeypatch):
     """Each test gets its own temporary SQLite database."""
-    db_path = tmp_path / "test_history.db"
-    conn = sqlite3.connect(str(db_path), check_same_thread=False)
-    conn.row_factory = sqlite3.Row
-    schema = db_module._SCHEMA_PATH.read_text()
-    conn.executescript(schema)
-    monkeypatch.setattr(db_module, "_connection", conn)
-    monkeypatch.setattr(db_module, "get_db", lambda: conn)
+    monkeypatch.setattr(db_module, "DB_PATH", tmp_path / "test_history.db")
+    db_module.init_db()
     yield
-    conn.close()
+    db_module.close_db()
 
 
 def _do_calculation() -> dict:
@@ -71,6 +64,18 @@ class TestHistoryList:
         assert len(rows) == 2
         assert rows[0]["id"] > rows[1]["id"]
 
+    def test_pagination(self):
+        _do_calculation()
+        _do_calculation()
+        newest = client.get("/api/history", params={"limit": 1}).json()
+        older = client.get("/api/history", params={"limit": 1, "offset": 1}).json()
+        assert len(newest) == 1 and len(older) == 1
+        assert newest[0]["id"] > older[0]["id"]
+
+    def test_invalid_limit_returns_422(self):
+        resp = client.get("/api/history", params={"limit": 0})
+        assert resp.status_code == 422
+
 
 class TestHistoryDetail:
     def test_get_existing(self):
@@ -73,3 +73,18 @@ class TestApplyCreditErrors:
     def test_negative_credit_raises(self):
         with pytest.raises(ValueError, match="credit_amount must be >= 0"):
             apply_credit(Decimal("5000"), Decimal("-100"), is_refundable=False)
+
+
+class TestSubCentInputs:
+    """Amounts with sub-cent precision are rounded once on output."""
+
+    def test_sub_cent_tax_rounded(self):
+        result = apply_credit(Decimal("1000.005"), Decimal("2000"), is_refundable=False)
+        assert result.tax_before == Decimal("1000.01")
+        assert result.credit_applied == Decimal("1000.01")
+        assert result.tax_after == Decimal("0.00")
+
+    def test_sub_cent_refundable(self):
+        result = apply_credit(Decimal("100"), Decimal("0.125"), is_refundable=True)
+        assert result.tax_after == Decimal("99.88")
+        assert result.credit_applied == Decimal("0.13")
@@ -3,6 +3,7 @@
 from decimal import Decimal
 
 import pytest
+from pydantic import ValidationError
 
 from src.models.tax_input import AboveLineDeductions, GrossIncome
 from src.tools.calculate_agi import calculate_agi
@@ -88,6 +89,16 @@ class TestCalculateAGI:
         result = calculate_agi(income)
         assert result.agi == Decimal("44444.44")
 
+    def test_sub_cent_inputs_summed_before_rounding(self):
+        """Sub-cent amounts are summed exactly and rounded once, not per field."""
+        income = GrossIncome(
+            w2_wages=Decimal("100.005"),
+            interest_income=Decimal("0.005"),
+        )
+        result = calculate_agi(income)
+        assert result.total_gross_income == Decimal("100.01")
+        assert result.agi == Decimal("100.01")
+
     def test_all_deduction_types(self):
         income = GrossIncome(w2_wages=Decimal("100000"))
         deductions = AboveLineDeductions(
@@ -118,3 +129,11 @@ class TestGrossIncomeValidation:
     def test_negative_w2_wages_raises(self):
         with pytest.raises(ValueError):
             GrossIncome(w2_wages=Decimal("-1"))
+
+    def test_models_are_frozen(self):
+        income = GrossIncome(w2_wages=Decimal("1000"))
+        with pytest.raises(ValidationError):
+            income.w2_wages = Decimal("2000")
+        with pytest.raises(ValidationError):
+            AboveLineDeductions().hsa_deduction = Decimal("1")
+
@@ -3,12 +3,20 @@
 All expected values hand-calculated from 2024 brackets (Rev. Proc. 2023-34).
 """
 
+import random
 from decimal import Decimal
 
 import pytest
 
+from src.data.tax_year_2024 import FEDERAL_BRACKETS
 from src.models.filing_status import FilingStatus
-from src.tools.calculate_bracket_tax import calculate_bracket_tax
+from src.tools.calculate_bracket_tax import (
+    _calculate_bracket_tax_decimal,
+    calculate_bracket_tax,
+    calculate_bracket_tax_batch,
+    calculate_bracket_tax_totals,
+    marginal_rate,
+)
 
 
 class TestSingleBracketTax:
@@ -143,3 +151,99 @@ class TestBracketTaxErrors:
     def test_filing_status_preserved(self):
         result = calculate_bracket_tax(Decimal("50000"), FilingStatus.HEAD_OF_HOUSEHOLD)
         assert result.filing_status == FilingStatus.HEAD_OF_HOUSEHOLD
+
+
+class TestIntegerCentsPath:
+    """Integer fast paths must match the Decimal implementation exactly."""
+
+    INCOMES = ["0", "0.01", "0.05", "11600", "11600.01", "47150.55", "100000", "191950",
+               "243725.99", "365600", "609350", "731200.10", "1000000", "47150.00", "12345.678"]
+
+    @pytest.mark.parametrize("status", list(FilingStatus))
+    @pytest.mark.parametrize("income", INCOMES)
+    def test_full_result_matches_decimal_version(self, status, income):
+        expected = _calculate_bracket_tax_decimal(Decimal(income), status)
+        result = calculate_bracket_tax(Decimal(income), status)
+        assert result.model_dump_json() == expected.model_dump_json()
+
+    @pytest.mark.parametrize("status", list(FilingStatus))
+    @pytest.mark.parametrize("income", INCOMES)
+    def test_totals_match_decimal_version(self, status, income):
+        expected = _calculate_bracket_tax_decimal(Decimal(income), status)
+        total, effective, marginal = calculate_bracket_tax_totals(Decimal(income), status)
+        assert str(total) == str(expected.total_tax)
+        assert str(effective) == str(expected.effective_rate)
+        assert str(marginal) == str(expected.marginal_rate)
+
+    @pytest.mark.parametrize("status", list(FilingStatus))
+    @pytest.mark.parametrize("income", INCOMES)
+    def test_marginal_rate_matches_decimal_version(self, status, income):
+        expected = _calculate_bracket_tax_decimal(Decimal(income), status)
+        assert str(marginal_rate(Decimal(income), status)) == str(expected.marginal_rate)
+
+    @pytest.mark.parametrize("income", ["0.005", "47150.555", "250000.125", "800000.9999"])
+    def test_sub_cent_income_rounds_to_cents(self, income):
+        result = calculate_bracket_tax(Decimal(income), FilingStatus.SINGLE)
+        assert result.total_tax == sum(d.tax_in_bracket for d in result.breakdown)
+        assert result.total_tax.as_tuple().exponent == -2
+        for detail in result.breakdown:
+            assert detail.tax_in_bracket.as_tuple().exponent == -2
+
+    def test_repeat_calls_share_cached_result(self):
+        first = calculate_bracket_tax(Decimal("85400"), FilingStatus.SINGLE)
+        second = calculate_bracket_tax(Decimal("85400"), FilingStatus.SINGLE)
+        assert first is second
+
+    def test_cache_keeps_input_precision(self):
+        plain = calculate_bracket_tax(Decimal("85400"), FilingStatus.SINGLE)
+        padded = calculate_bracket_tax(Decimal("85400.00"), FilingStatus.SINGLE)
+        assert str(plain.taxable_income) == "85400"
+        assert str(padded.taxable_income) == "85400.00"
+        assert plain.total_tax == padded.total_tax
+
+    @pytest.mark.parametrize("status", list(FilingStatus))
+    def test_sampled_cents_match_decimal_version(self, status):
+        """Seeded sample of whole-cent incomes from $0 to $1M, plus every bracket edge."""
+        rng = random.Random(2024)
+        samples = [rng.randrange(100_000_001) for _ in range(400)]
+        for upper in FEDERAL_BRACKETS[status]:
+            if upper[0] is not None:
+                edge = int(upper[0] * 100)
+                samples += [edge - 1, edge, edge + 1]
+        for cents in samples:
+            income = Decimal(cents).scaleb(-2)
+            expected = _calculate_bracket_tax_decimal(income, status)
+            assert calculate_bracket_tax(income, status) == expected
+
+    def test_totals_negative_income_raises(self):
+        with pytest.raises(ValueError, match="taxable_income must be >= 0"):
+            calculate_bracket_tax_totals(Decimal("-1"), FilingStatus.SINGLE)
+
+
+class TestBracketTaxBatch:
+    def test_matches_scalar_version(self):
+        incomes = ["0", "11600", "85400", "200000.01", "1000000"]
+        statuses = list(FilingStatus)
+        cents = [int(Decimal(i) * 100) for i in incomes]
+        taxes = calculate_bracket_tax_batch(cents, statuses)
+        for income, status, tax in zip(incomes, statuses, taxes, strict=True):
+            expected = calculate_bracket_tax(Decimal(income), status).total_tax
+            assert Decimal(tax).scaleb(-2) == expected
+
+    @pytest.mark.parametrize("status", list(FilingStatus))
+    def test_generated_ladder_matches_decimal_version(self, status):
+        """The generated per-status functions agree at and around every bracket edge."""
+        rng = random.Random(2024)
+        samples = [0, 1, *(rng.randrange(100_000_001) for _ in range(200))]
+        for upper, _ in FEDERAL_BRACKETS[status]:
+            if upper is not None:
+                edge = int(upper * 100)
+                samples += [edge - 1, edge, edge + 1]
+        taxes = calculate_bracket_tax_batch(samples, [status] * len(samples))
+        for cents, tax in zip(samples, taxes, strict=True):
+            expected = _calculate_bracket_tax_decimal(Decimal(cents).scaleb(-2), status)
+            assert Decimal(tax).scaleb(-2) == expected.total_tax
+
+    def test_negative_income_raises(self):
+        with pytest.raises(ValueError, match="taxable_income must be >= 0"):
+            calculate_bracket_tax_batch([-1], [FilingStatus.SINGLE])
@@ -4,12 +4,19 @@ Expected values hand-calculated from 2024 capital gains rate thresholds (Rev. Pr
 Long-term gains are stacked on top of ordinary income to determine the applicable rate.
 """
 
+import random
 from decimal import Decimal
 
 import pytest
 
+from src.data.tax_year_2024 import CAPITAL_GAINS_THRESHOLDS
 from src.models.filing_status import FilingStatus
 from src.tools.calculate_capital_gains_tax import calculate_capital_gains_tax
+from src.tools.preferential_rate import (
+    _calculate_preferential_rate_tax_decimal,
+    calculate_preferential_rate_tax,
+    preferential_rate_tax_cents,
+)
 
 
 class TestSingleCapitalGains:
@@ -150,3 +157,81 @@ class TestCapitalGainsErrors:
             calculate_capital_gains_tax(
                 Decimal("0"), Decimal("10000"), Decimal("-1"), FilingStatus.SINGLE
             )
+
+
+class TestIntegerCentsPath:
+    """Integer stacking must agree with the Decimal implementation."""
+
+    @pytest.mark.parametrize("status", list(FilingStatus))
+    def test_sampled_cents_match_decimal_version(self, status):
+        rng = random.Random(2024)
+        ordinary = [rng.randrange(80_000_001) for _ in range(150)]
+        for upper, _ in CAPITAL_GAINS_THRESHOLDS[status]:
+            if upper is not None:
+                edge = int(upper * 100)
+                ordinary += [edge - 1, edge, edge + 1]
+        for ordinary_cents in ordinary:
+            args = (
+                Decimal(rng.randrange(1, 80_000_001)).scaleb(-2),
+                Decimal(ordinary_cents).scaleb(-2),
+                status,
+            )
+            tax, breakdown = calculate_preferential_rate_tax(*args)
+            expected_tax, expected_breakdown = _calculate_preferential_rate_tax_decimal(*args)
+            assert str(tax) == str(expected_tax)
+            assert breakdown == expected_breakdown
+
+    @pytest.mark.parametrize("amount", ["100000", "100000.005"])
+    def test_breakdown_can_be_skipped(self, amount):
+        args = (Decimal(amount), Decimal("40000"), FilingStatus.SINGLE)
+        tax, breakdown = calculate_preferential_rate_tax(*args, include_breakdown=False)
+        assert breakdown == []
+        assert tax == calculate_preferential_rate_tax(*args)[0]
+
+    def test_sub_cent_amount_uses_decimal_path(self):
+        tax, breakdown = calculate_preferential_rate_tax(
+            Decimal("10000.005"), Decimal("600000"), FilingStatus.SINGLE
+        )
+        assert tax == Decimal("2000.00")
+        assert breakdown[0].taxable_in_bracket == Decimal("10000.005")
+
+    def test_breakdown_amounts_serialize_with_two_places(self):
+        """Whole-cent breakdown amounts are two-place Decimals in JSON output
+        ("46170.00", not "46170"); bracket tops keep the table's form."""
+        result = calculate_capital_gains_tax(
+            Decimal("0"), Decimal("50000"), Decimal("855"), FilingStatus.SINGLE
+        )
+        assert result.model_dump(mode="json")["breakdown"] == [
+            {
+                "rate": "0.00",
+                "bracket_bottom": "855.00",
+                "bracket_top": "47025",
+                "taxable_in_bracket": "46170.00",
+                "tax_in_bracket": "0.00",
+            },
+            {
+                "rate": "0.15",
+                "bracket_bottom": "47025.00",
+                "bracket_top": "518900",
+                "taxable_in_bracket": "3830.00",
+                "tax_in_bracket": "574.50",
+            },
+        ]
+
+
+class TestPreferentialRateCents:
+    @pytest.mark.parametrize("status", list(FilingStatus))
+    def test_matches_decimal_version(self, status):
+        rng = random.Random(2024)
+        amounts = [0, -100, *(rng.randrange(1, 80_000_001) for _ in range(200))]
+        ordinary = [rng.randrange(80_000_001) for _ in amounts]
+        for upper, _ in CAPITAL_GAINS_THRESHOLDS[status]:
+            if upper is not None:
+                amounts += [1, 100, 10_000_000]
+                ordinary += [int(upper * 100)] * 3
+        for amount, base in zip(amounts, ordinary, strict=True):
+            expected, _ = _calculate_preferential_rate_tax_decimal(
+                Decimal(amount).scaleb(-2), Decimal(base).scaleb(-2), status
+            )
+            tax = preferential_rate_tax_cents(amount, base, status)
+            assert Decimal(tax).scaleb(-2) == expected
@@ -7,12 +7,13 @@ Hand-calculated from 2024 FICA constants:
   SE: 92.35% taxable base; 12.4% SS + 2.9% Medicare; 50% deductible
 """
 
+import random
 from decimal import Decimal
 
 import pytest
 
 from src.models.filing_status import FilingStatus
-from src.tools.calculate_fica import calculate_fica
+from src.tools.calculate_fica import _calculate_fica_decimal, calculate_fica
 
 
 class TestW2Only:
@@ -29,8 +30,9 @@ class TestW2Only:
         assert result.ss_tax == Decimal("3100.00")
         assert result.medicare_tax == Decimal("725.00")
         assert result.additional_medicare_tax == Decimal("0.00")
-        assert result.se_tax == Decimal("0")
-        assert result.se_tax_deduction == Decimal("0")
+        assert result.se_tax == Decimal("0.00")
+        assert result.se_tax.as_tuple().exponent == -2
+        assert result.se_tax_deduction == Decimal("0.00")
         assert result.total_fica == Decimal("3825.00")
 
     def test_wages_above_ss_cap(self):
@@ -182,3 +184,34 @@ class TestFicaErrors:
     def test_negative_se_income_raises(self):
         with pytest.raises(ValueError, match="self_employment_income must be >= 0"):
             calculate_fica(Decimal("0"), Decimal("-1"), FilingStatus.SINGLE)
+
+
+class TestIntegerCentsPath:
+    """The integer-cent path must match the Decimal implementation exactly."""
+
+    EDGES = ["0", "0.01", "168600", "168600.01", "200000", "200000.01", "250000", "125000.50"]
+
+    @pytest.mark.parametrize("status", list(FilingStatus))
+    def test_edges_match_decimal_version(self, status):
+        for wages in self.EDGES:
+            for se_income in self.EDGES:
+                args = (Decimal(wages), Decimal(se_income), status)
+                assert calculate_fica(*args).model_dump_json() == (
+                    _calculate_fica_decimal(*args).model_dump_json()
+                )
+
+    @pytest.mark.parametrize("status", list(FilingStatus))
+    def test_sampled_cents_match_decimal_version(self, status):
+        rng = random.Random(2024)
+        for _ in range(300):
+            wages = Decimal(rng.randrange(40_000_001)).scaleb(-2)
+            se_income = Decimal(rng.choice([0, rng.randrange(40_000_001)])).scaleb(-2)
+            args = (wages, se_income, status)
+            assert calculate_fica(*args).model_dump_json() == (
+                _calculate_fica_decimal(*args).model_dump_json()
+            )
+
+    def test_sub_cent_inputs_use_decimal_path(self):
+        result = calculate_fica(Decimal("50000.005"), Decimal("0"), FilingStatus.SINGLE)
+        assert result.medicare_tax == Decimal("725.00")
+        assert result.total_fica.as_tuple().exponent == -2
@@ -4,12 +4,14 @@
 Thresholds: $200k SINGLE/HOH, $250k MFJ/QSS, $125k MFS.
 """
 
+import random
 from decimal import Decimal
 
 import pytest
 
 from src.models.filing_status import FilingStatus
-from src.tools.calculate_niit import calculate_niit
+from src.tools._cents import from_cents
+from src.tools.calculate_niit import calculate_niit, niit_cents
 
 
 class TestSingleNIIT:
@@ -128,3 +130,21 @@ class TestNIITErrors:
     def test_negative_nii_raises(self):
         with pytest.raises(ValueError, match="net_investment_income must be >= 0"):
             calculate_niit(Decimal("250000"), Decimal("-1"), FilingStatus.SINGLE)
+
+
+class TestNiitCents:
+    """niit_cents matches calculate_niit for whole-cent inputs."""
+
+    @pytest.mark.parametrize("status", list(FilingStatus))
+    def test_sampled_inputs_match_tool(self, status):
+        rng = random.Random(1411)
+        for _ in range(200):
+            magi, nii = rng.randrange(60_000_001), rng.randrange(20_000_001)
+            expected = calculate_niit(
+                Decimal(magi).scaleb(-2), Decimal(nii).scaleb(-2), status
+            ).niit
+            assert from_cents(niit_cents(magi, nii, status)) == expected
+
+    def test_negative_magi_raises(self):
+        with pytest.raises(ValueError, match="magi must be >= 0"):
+            niit_cents(-1, 0, FilingStatus.SINGLE)
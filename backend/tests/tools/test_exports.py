@@ -0,0 +1,17 @@
+"""Tests for the src.tools package re-exports."""
+
+from decimal import Decimal
+
+import src.workflows.orchestrator  # noqa: F401  (loads the tool submodules first)
+from src.models.filing_status import FilingStatus
+
+
+def test_reexports_are_the_tool_functions():
+    """Names imported from src.tools are the functions, not their same-named submodules."""
+    from src.tools import apply_credit, calculate_bracket_tax, calculate_fica
+
+    assert apply_credit(Decimal("5000"), Decimal("2000"), is_refundable=False).tax_after == (
+        Decimal("3000.00")
+    )
+    assert calculate_bracket_tax(Decimal("10000"), FilingStatus.SINGLE).total_tax > 0
+    assert calculate_fica(Decimal("50000"), Decimal("0"), FilingStatus.SINGLE).total_fica > 0
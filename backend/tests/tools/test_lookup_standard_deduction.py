@@ -78,3 +78,7 @@ class TestAdditionalDeduction:
         )
         assert r.additional_amount == Decimal("3100")
         assert r.total_deduction == Decimal("32300")
+
+    def test_repeat_calls_share_cached_result(self):
+        first = lookup_standard_deduction(FilingStatus.SINGLE, is_blind=True)
+        assert lookup_standard_deduction(FilingStatus.SINGLE, is_blind=True) is first
@@ -0,0 +1,81 @@
+"""Builders for the workflow results the workflow tests feed each other.
+
+Each builder fills every field with zero (or the Single standard deduction)
+and validates the overrides through the real model constructor.
+"""
+
+from decimal import Decimal
+
+from src.models.tax_output import AGIResult, FicaResult
+from src.models.workflow_models import DeductionResult, IncomeResult, TaxComputationResult
+
+_ZERO = Decimal("0")
+
+_INCOME_DEFAULTS = dict.fromkeys(
+    (
+        "wages",
+        "self_employment_income",
+        "interest_income",
+        "ordinary_dividends",
+        "qualified_dividends",
+        "short_term_gains",
+        "long_term_gains",
+        "total_gross_income",
+        "net_investment_income",
+    ),
+    _ZERO,
+)
+
+_FICA_DEFAULTS = dict.fromkeys(
+    (
+        "ss_tax",
+        "medicare_tax",
+        "additional_medicare_tax",
+        "se_tax",
+        "se_tax_deduction",
+        "total_fica",
+    ),
+    _ZERO,
+)
+
+_DEDUCTION_DEFAULTS = {
+    "standard_deduction_amount": Decimal("14600"),
+    "itemized_total": _ZERO,
+    "used_standard": True,
+    "deduction_amount": Decimal("14600"),
+    "taxable_income": _ZERO,
+    "ordinary_taxable_income": _ZERO,
+    "preferential_qualified_dividends": _ZERO,
+    "preferential_long_term_gains": _ZERO,
+}
+
+
+def make_income(**kwargs) -> IncomeResult:
+    return IncomeResult(**{**_INCOME_DEFAULTS, **kwargs})
+
+
+def make_fica(**kwargs) -> FicaResult:
+    return FicaResult(**{**_FICA_DEFAULTS, **kwargs})
+
+
+def make_agi(agi: Decimal) -> AGIResult:
+    return AGIResult(
+        total_gross_income=agi,
+        total_above_line_deductions=_ZERO,
+        agi=agi,
+    )
+
+
+def make_deductions(**kwargs) -> DeductionResult:
+    return DeductionResult(**{**_DEDUCTION_DEFAULTS, **kwargs})
+
+
+def make_tax_comp(total: Decimal) -> TaxComputationResult:
+    return TaxComputationResult(
+        ordinary_tax=total,
+        qualified_dividend_tax=_ZERO,
+        capital_gains_tax=_ZERO,
+        niit=_ZERO,
+        total_income_tax=total,
+        marginal_rate=Decimal("0.10"),
+    )
@@ -3,43 +3,13 @@
 from decimal import Decimal
 
 from src.models.filing_status import FilingStatus
-from src.models.tax_output import FicaResult
 from src.models.workflow_models import (
     Income1099NEC,
-    IncomeResult,
     TaxReturnInput,
     W2Income,
 )
 from src.workflows.agi_workflow import run_agi_workflow
-
-
-def _make_income(**kwargs) -> IncomeResult:
-    defaults = dict(
-        wages=Decimal("0"),
-        self_employment_income=Decimal("0"),
-        interest_income=Decimal("0"),
-        ordinary_dividends=Decimal("0"),
-        qualified_dividends=Decimal("0"),
-        short_term_gains=Decimal("0"),
-        long_term_gains=Decimal("0"),
-        total_gross_income=Decimal("0"),
-        net_investment_income=Decimal("0"),
-    )
-    defaults.update(kwargs)
-    return IncomeResult(**defaults)
-
-
-def _make_fica(**kwargs) -> FicaResult:
-    defaults = dict(
-        ss_tax=Decimal("0"),
-        medicare_tax=Decimal("0"),
-        additional_medicare_tax=Decimal("0"),
-        se_tax=Decimal("0"),
-        se_tax_deduction=Decimal("0"),
-        total_fica=Decimal("0"),
-    )
-    defaults.update(kwargs)
-    return FicaResult(**defaults)
+from tests.workflows.builders import make_fica, make_income
 
 
 class TestAGIWorkflow:
@@ -50,8 +20,8 @@ class TestAGIWorkflow:
             filing_status=FilingStatus.SINGLE,
             w2s=[W2Income(wages=Decimal("75000"))],
         )
-        income = _make_income(wages=Decimal("75000"), total_gross_income=Decimal("75000"))
-        fica = _make_fica()
+        income = make_income(wages=Decimal("75000"), total_gross_income=Decimal("75000"))
+        fica = make_fica()
         result = run_agi_workflow(ret, income, fica)
         assert result.agi == Decimal("75000.00")
 
@@ -61,12 +31,12 @@ class TestAGIWorkflow:
             filing_status=FilingStatus.SINGLE,
             income_1099_nec=[Income1099NEC(compensation=Decimal("100000"))],
         )
-        income = _make_income(
+        income = make_income(
             self_employment_income=Decimal("100000"),
             total_gross_income=Decimal("100000"),
         )
         # SE tax = ~14130 (100000 * 0.9235 * 0.153), deduction = ~7065
-        fica = _make_fica(
+        fica = make_fica(
             se_tax=Decimal("14130.00"),
             se_tax_deduction=Decimal("7065.00"),
         )
@@ -81,8 +51,8 @@ class TestAGIWorkflow:
             w2s=[W2Income(wages=Decimal("60000"))],
             hsa_deduction=Decimal("4150"),
         )
-        income = _make_income(wages=Decimal("60000"), total_gross_income=Decimal("60000"))
-        fica = _make_fica()
+        income = make_income(wages=Decimal("60000"), total_gross_income=Decimal("60000"))
+        fica = make_fica()
         result = run_agi_workflow(ret, income, fica)
         assert result.agi == Decimal("55850.00")
 
@@ -94,16 +64,16 @@ class TestAGIWorkflow:
             student_loan_interest=Decimal("2500"),
             educator_expenses=Decimal("300"),
         )
-        income = _make_income(wages=Decimal("80000"), total_gross_income=Decimal("80000"))
-        fica = _make_fica()
+        income = make_income(wages=Decimal("80000"), total_gross_income=Decimal("80000"))
+        fica = make_fica()
         result = run_agi_workflow(ret, income, fica)
         # AGI = 80000 - 4150 - 2500 - 300 = 73050
         assert result.agi == Decimal("73050.00")
 
     def test_zero_income(self):
         ret = TaxReturnInput(filing_status=FilingStatus.SINGLE)
-        income = _make_income()
-        fica = _make_fica()
+        income = make_income()
+        fica = make_fica()
         result = run_agi_workflow(ret, income, fica)
         assert result.agi == Decimal("0.00")
 
@@ -114,14 +84,15 @@ class TestAGIWorkflow:
             income_1099_nec=[Income1099NEC(compensation=Decimal("80000"))],
             hsa_deduction=Decimal("4150"),
         )
-        income = _make_income(
+        income = make_income(
             self_employment_income=Decimal("80000"),
             total_gross_income=Decimal("80000"),
         )
-        fica = _make_fica(
+        fica = make_fica(
             se_tax=Decimal("11304.00"),
             se_tax_deduction=Decimal("5652.00"),
         )
         result = run_agi_workflow(ret, income, fica)
         # AGI = 80000 - 5652 - 4150 = 70198
         assert result.agi == Decimal("70198.00")
+
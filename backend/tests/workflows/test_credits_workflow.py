@@ -1,34 +1,19 @@
 """Tests for the credits workflow."""
 
+import random
 from decimal import Decimal
 
+import pytest
+
 from src.models.filing_status import FilingStatus
-from src.models.tax_output import AGIResult
 from src.models.workflow_models import (
-    TaxComputationResult,
     TaxCredits,
     TaxReturnInput,
     W2Income,
 )
+from src.tools.apply_credit import apply_credit
 from src.workflows.credits_workflow import run_credits_workflow
-
-
-def _make_agi(agi: Decimal) -> AGIResult:
-    return AGIResult(
-        total_gross_income=agi,
-        total_above_line_deductions=Decimal("0"),
-        agi=agi,
-    )
-
-
-def _make_tax_comp(total: Decimal) -> TaxComputationResult:
-    return TaxComputationResult(
-        ordinary_tax=total,
-        qualified_dividend_tax=Decimal("0"),
-        capital_gains_tax=Decimal("0"),
-        niit=Decimal("0"),
-        total_income_tax=total,
-    )
+from tests.workflows.builders import make_agi, make_tax_comp
 
 
 class TestCreditsWorkflow:
@@ -36,8 +21,8 @@ class TestCreditsWorkflow:
 
     def test_no_children(self):
         ret = TaxReturnInput(filing_status=FilingStatus.SINGLE)
-        agi = _make_agi(Decimal("75000"))
-        tax_comp = _make_tax_comp(Decimal("8341"))
+        agi = make_agi(Decimal("75000"))
+        tax_comp = make_tax_comp(Decimal("8341"))
         result = run_credits_workflow(ret, agi, tax_comp)
         assert result.child_tax_credit == Decimal("0.00")
         assert result.total_credits_applied == Decimal("0.00")
@@ -49,8 +34,8 @@ class TestCreditsWorkflow:
             filing_status=FilingStatus.SINGLE,
             credits=TaxCredits(num_qualifying_children=1),
         )
-        agi = _make_agi(Decimal("75000"))
-        tax_comp = _make_tax_comp(Decimal("8341"))
+        agi = make_agi(Decimal("75000"))
+        tax_comp = make_tax_comp(Decimal("8341"))
         result = run_credits_workflow(ret, agi, tax_comp)
         assert result.child_tax_credit == Decimal("2000.00")
         assert result.nonrefundable_ctc_applied == Decimal("2000.00")
@@ -63,8 +48,8 @@ class TestCreditsWorkflow:
             filing_status=FilingStatus.MARRIED_FILING_JOINTLY,
             credits=TaxCredits(num_qualifying_children=2),
         )
-        agi = _make_agi(Decimal("150000"))
-        tax_comp = _make_tax_comp(Decimal("15000"))
+        agi = make_agi(Decimal("150000"))
+        tax_comp = make_tax_comp(Decimal("15000"))
         result = run_credits_workflow(ret, agi, tax_comp)
         assert result.child_tax_credit == Decimal("4000.00")
         assert result.nonrefundable_ctc_applied == Decimal("4000.00")
@@ -76,8 +61,8 @@ class TestCreditsWorkflow:
             filing_status=FilingStatus.SINGLE,
             credits=TaxCredits(num_qualifying_children=2),
         )
-        agi = _make_agi(Decimal("30000"))
-        tax_comp = _make_tax_comp(Decimal("1000"))
+        agi = make_agi(Decimal("30000"))
+        tax_comp = make_tax_comp(Decimal("1000"))
         result = run_credits_workflow(ret, agi, tax_comp)
         # CTC = $4,000 (2 × $2,000)
         assert result.child_tax_credit == Decimal("4000.00")
@@ -95,8 +80,8 @@ class TestCreditsWorkflow:
             filing_status=FilingStatus.SINGLE,
             credits=TaxCredits(num_qualifying_children=1),
         )
-        agi = _make_agi(Decimal("210000"))
-        tax_comp = _make_tax_comp(Decimal("40000"))
+        agi = make_agi(Decimal("210000"))
+        tax_comp = make_tax_comp(Decimal("40000"))
         result = run_credits_workflow(ret, agi, tax_comp)
         # Phaseout: (210000 - 200000) / 1000 = 10 units × $50 = $500
         # CTC = 2000 - 500 = 1500
@@ -110,10 +95,59 @@ class TestCreditsWorkflow:
             filing_status=FilingStatus.SINGLE,
             credits=TaxCredits(num_qualifying_children=1),
         )
-        agi = _make_agi(Decimal("250000"))
-        tax_comp = _make_tax_comp(Decimal("50000"))
+        agi = make_agi(Decimal("250000"))
+        tax_comp = make_tax_comp(Decimal("50000"))
         result = run_credits_workflow(ret, agi, tax_comp)
         # Phaseout: (250000-200000)/1000 = 50 × $50 = $2500 > $2000
         # CTC = max(2000-2500, 0) = 0
         assert result.child_tax_credit == Decimal("0.00")
         assert result.total_credits_applied == Decimal("0.00")
+
+    @pytest.mark.parametrize(
+        ("agi", "expected"),
+        [
+            ("200499.99", "2000.00"),  # under half a $1,000 step — no reduction yet
+            ("200500.00", "1950.00"),  # half a step rounds up to one $50 unit
+            ("201499.99", "1950.00"),
+            ("201500", "1900.00"),
+            ("200500.004", "1950.00"),  # sub-cent AGI rounds to the cent
+        ],
+    )
+    def test_phaseout_step_rounding(self, agi, expected):
+        ret = TaxReturnInput(
+            filing_status=FilingStatus.SINGLE,
+            credits=TaxCredits(num_qualifying_children=1),
+        )
+        tax_comp = make_tax_comp(Decimal("50000"))
+        result = run_credits_workflow(ret, make_agi(Decimal(agi)), tax_comp)
+        assert result.child_tax_credit == Decimal(expected)
+
+
+class TestCreditSplit:
+    """The credit is split exactly as two apply_credit calls would split it."""
+
+    @pytest.mark.parametrize("status", list(FilingStatus))
+    def test_sampled_inputs_match_apply_credit(self, status):
+        rng = random.Random(2024)
+        for _ in range(200):
+            children = rng.randrange(5)
+            ret = TaxReturnInput(
+                filing_status=status,
+                credits=TaxCredits(num_qualifying_children=children),
+            )
+            agi = make_agi(Decimal(rng.randrange(60_000_001)).scaleb(-2))
+            total_tax = Decimal(rng.randrange(2_000_001)).scaleb(-2)
+            result = run_credits_workflow(ret, agi, make_tax_comp(total_tax))
+
+            nonrefundable = apply_credit(total_tax, result.child_tax_credit, is_refundable=False)
+            refundable = apply_credit(
+                nonrefundable.tax_after,
+                min(
+                    result.child_tax_credit - nonrefundable.credit_applied,
+                    Decimal("1700") * children,
+                ),
+                is_refundable=True,
+            )
+            assert result.nonrefundable_ctc_applied == nonrefundable.credit_applied
+            assert result.refundable_ctc_applied == refundable.credit_applied
+            assert result.tax_after_credits == refundable.tax_after
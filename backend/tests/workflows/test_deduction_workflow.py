@@ -2,39 +2,16 @@
 
 from decimal import Decimal
 
+import pytest
+
 from src.models.filing_status import FilingStatus
-from src.models.tax_output import AGIResult
 from src.models.workflow_models import (
-    IncomeResult,
     ItemizedDeductions,
     TaxReturnInput,
     W2Income,
 )
-from src.workflows.deduction_workflow import run_deduction_workflow
-
-
-def _make_income(**kwargs) -> IncomeResult:
-    defaults = dict(
-        wages=Decimal("0"),
-        self_employment_income=Decimal("0"),
-        interest_income=Decimal("0"),
-        ordinary_dividends=Decimal("0"),
-        qualified_dividends=Decimal("0"),
-        short_term_gains=Decimal("0"),
-        long_term_gains=Decimal("0"),
-        total_gross_income=Decimal("0"),
-        net_investment_income=Decimal("0"),
-    )
-    defaults.update(kwargs)
-    return IncomeResult(**defaults)
-
-
-def _make_agi(agi: Decimal) -> AGIResult:
-    return AGIResult(
-        total_gross_income=agi,
-        total_above_line_deductions=Decimal("0"),
-        agi=agi,
-    )
+from src.workflows.deduction_workflow import _cap_preferential, run_deduction_workflow
+from tests.workflows.builders import make_agi, make_income
 
 
 class TestDeductionWorkflow:
@@ -45,8 +22,8 @@ class TestDeductionWorkflow:
             filing_status=FilingStatus.SINGLE,
             w2s=[W2Income(wages=Decimal("75000"))],
         )
-        income = _make_income(wages=Decimal("75000"), total_gross_income=Decimal("75000"))
-        agi = _make_agi(Decimal("75000"))
+        income = make_income(wages=Decimal("75000"), total_gross_income=Decimal("75000"))
+        agi = make_agi(Decimal("75000"))
         result = run_deduction_workflow(ret, income, agi)
         assert result.used_standard is True
         assert result.deduction_amount == Decimal("14600.00")
@@ -58,8 +35,8 @@ class TestDeductionWorkflow:
             filing_status=FilingStatus.MARRIED_FILING_JOINTLY,
             w2s=[W2Income(wages=Decimal("150000"))],
         )
-        income = _make_income(wages=Decimal("150000"), total_gross_income=Decimal("150000"))
-        agi = _make_agi(Decimal("150000"))
+        income = make_income(wages=Decimal("150000"), total_gross_income=Decimal("150000"))
+        agi = make_agi(Decimal("150000"))
         result = run_deduction_workflow(ret, income, agi)
         assert result.used_standard is True
         assert result.deduction_amount == Decimal("29200.00")
@@ -75,8 +52,8 @@ class TestDeductionWorkflow:
                 charitable=Decimal("5000"),
             ),
         )
-        income = _make_income(wages=Decimal("200000"), total_gross_income=Decimal("200000"))
-        agi = _make_agi(Decimal("200000"))
+        income = make_income(wages=Decimal("200000"), total_gross_income=Decimal("200000"))
+        agi = make_agi(Decimal("200000"))
         result = run_deduction_workflow(ret, income, agi)
         # Itemized: 10000 (SALT capped) + 12000 + 5000 = 27000 > 14600
         assert result.used_standard is False
@@ -93,8 +70,8 @@ class TestDeductionWorkflow:
                 mortgage_interest=Decimal("8000"),
             ),
         )
-        income = _make_income(wages=Decimal("200000"), total_gross_income=Decimal("200000"))
-        agi = _make_agi(Decimal("200000"))
+        income = make_income(wages=Decimal("200000"), total_gross_income=Decimal("200000"))
+        agi = make_agi(Decimal("200000"))
         result = run_deduction_workflow(ret, income, agi)
         # SALT capped at $10,000 + mortgage $8,000 = $18,000
         assert result.itemized_total == Decimal("18000.00")
@@ -108,8 +85,8 @@ class TestDeductionWorkflow:
                 mortgage_interest=Decimal("12000"),
             ),
         )
-        income = _make_income(wages=Decimal("100000"), total_gross_income=Decimal("100000"))
-        agi = _make_agi(Decimal("100000"))
+        income = make_income(wages=Decimal("100000"), total_gross_income=Decimal("100000"))
+        agi = make_agi(Decimal("100000"))
         result = run_deduction_workflow(ret, income, agi)
         # SALT capped at $5,000 for MFS + mortgage $12,000 = $17,000
         assert result.itemized_total == Decimal("17000.00")
@@ -123,8 +100,8 @@ class TestDeductionWorkflow:
                 state_and_local_taxes=Decimal("5000"),
             ),
         )
-        income = _make_income(wages=Decimal("50000"), total_gross_income=Decimal("50000"))
-        agi = _make_agi(Decimal("50000"))
+        income = make_income(wages=Decimal("50000"), total_gross_income=Decimal("50000"))
+        agi = make_agi(Decimal("50000"))
         result = run_deduction_workflow(ret, income, agi)
         # Medical: 10000 - (50000 * 0.075) = 10000 - 3750 = 6250
         # SALT: 5000 (under cap)
@@ -143,8 +120,8 @@ class TestDeductionWorkflow:
                 charitable=Decimal("5000"),
             ),
         )
-        income = _make_income(wages=Decimal("200000"), total_gross_income=Decimal("200000"))
-        agi = _make_agi(Decimal("200000"))
+        income = make_income(wages=Decimal("200000"), total_gross_income=Decimal("200000"))
+        agi = make_agi(Decimal("200000"))
         result = run_deduction_workflow(ret, income, agi)
         # Forced standard even though itemized ($27k) > standard ($14.6k)
         assert result.used_standard is True
@@ -156,13 +133,13 @@ class TestDeductionWorkflow:
             filing_status=FilingStatus.SINGLE,
             w2s=[W2Income(wages=Decimal("80000"))],
         )
-        income = _make_income(
+        income = make_income(
             wages=Decimal("80000"),
             qualified_dividends=Decimal("5000"),
             long_term_gains=Decimal("10000"),
             total_gross_income=Decimal("80000"),
         )
-        agi = _make_agi(Decimal("80000"))
+        agi = make_agi(Decimal("80000"))
         result = run_deduction_workflow(ret, income, agi)
         # taxable = 80000 - 14600 = 65400
         # preferential = 5000 + 10000 = 15000
@@ -178,13 +155,13 @@ class TestDeductionWorkflow:
             filing_status=FilingStatus.SINGLE,
             w2s=[W2Income(wages=Decimal("20000"))],
         )
-        income = _make_income(
+        income = make_income(
             wages=Decimal("20000"),
             qualified_dividends=Decimal("3000"),
             long_term_gains=Decimal("7000"),
             total_gross_income=Decimal("20000"),
         )
-        agi = _make_agi(Decimal("20000"))
+        agi = make_agi(Decimal("20000"))
         result = run_deduction_workflow(ret, income, agi)
         # taxable = 20000 - 14600 = 5400
         # preferential = 3000 + 7000 = 10000 > 5400
@@ -196,10 +173,22 @@ class TestDeductionWorkflow:
         assert result.preferential_long_term_gains == Decimal("3780.00")
         assert result.ordinary_taxable_income == Decimal("0.00")
 
+    @pytest.mark.parametrize(
+        ("divs", "ltcg", "taxable", "expected"),
+        [
+            ("1000", "2000", "1000", ("333.33", "666.67")),
+            ("1000.00", "1000.00", "0.01", ("0.01", "0.00")),  # half a cent rounds up
+            ("1000.001", "2000", "1000", ("333.33", "666.67")),  # sub-cent: Decimal path
+        ],
+    )
+    def test_proportional_cap_rounding(self, divs, ltcg, taxable, expected):
+        capped = _cap_preferential(Decimal(divs), Decimal(ltcg), Decimal(taxable))
+        assert tuple(str(amount) for amount in capped) == expected
+
     def test_zero_income(self):
         ret = TaxReturnInput(filing_status=FilingStatus.SINGLE)
-        income = _make_income()
-        agi = _make_agi(Decimal("0"))
+        income = make_income()
+        agi = make_agi(Decimal("0"))
         result = run_deduction_workflow(ret, income, agi)
         assert result.taxable_income == Decimal("0.00")
         assert result.ordinary_taxable_income == Decimal("0.00")
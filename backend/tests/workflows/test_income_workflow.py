@@ -129,3 +129,18 @@ class TestIncomeWorkflow:
         assert result.long_term_gains == Decimal("8000.00")
         # NII = max(1000 + 8000, 0) = 9000
         assert result.net_investment_income == Decimal("9000.00")
+
+
+class TestIncomeCache:
+    """Aggregation is memoised on the income amounts only."""
+
+    def test_non_income_changes_reuse_result(self):
+        w2s = [W2Income(wages=Decimal("64000"))]
+        first = run_income_workflow(_make_return(w2s=w2s))
+        second = run_income_workflow(_make_return(w2s=w2s, estimated_payments=Decimal("500")))
+        assert second is first
+
+    def test_equal_amounts_at_other_precision_share_result(self):
+        plain = run_income_workflow(_make_return(w2s=[W2Income(wages=Decimal("64100"))]))
+        padded = run_income_workflow(_make_return(w2s=[W2Income(wages=Decimal("64100.00"))]))
+        assert str(padded.wages) == str(plain.wages) == "64100.00"
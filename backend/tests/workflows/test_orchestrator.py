@@ -0,0 +1,65 @@
+"""Tests for the full-pipeline orchestrator's result cache."""
+
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from src.models.workflow_models import TaxReturnInput
+from src.workflows import orchestrator
+from src.workflows.orchestrator import calculate_full_tax
+
+
+def _make_return(wages: str = "75000") -> TaxReturnInput:
+    return TaxReturnInput(filing_status="SINGLE", w2s=[{"wages": wages}])
+
+
+@pytest.fixture(autouse=True)
+def _no_persist():
+    """Record auto-save calls instead of writing to the database."""
+    with patch("src.database.repository.save_calculation") as save:
+        yield save
+
+
+class TestResultCache:
+    def test_repeat_input_returns_cached_result(self):
+        first = calculate_full_tax(_make_return())
+        assert calculate_full_tax(_make_return()) is first
+
+    def test_input_precision_is_part_of_the_key(self):
+        plain = calculate_full_tax(_make_return("75000"))
+        padded = calculate_full_tax(_make_return("75000.00"))
+        assert plain is not padded
+        assert plain.summary.total_tax == padded.summary.total_tax
+
+    def test_cache_hit_is_still_persisted(self, _no_persist):
+        tax_return = _make_return("61000")
+        calculate_full_tax(tax_return)
+        calculate_full_tax(tax_return)
+        assert _no_persist.call_count == 2
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(orchestrator, "RESULT_CACHE_SIZE", 2)
+        first = calculate_full_tax(_make_return("10000"))
+        calculate_full_tax(_make_return("20000"))
+        calculate_full_tax(_make_return("30000"))
+        assert len(orchestrator._result_cache) <= 2
+        assert calculate_full_tax(_make_return("10000")) is not first
+
+    def test_cached_result_is_frozen(self):
+        result = calculate_full_tax(_make_return())
+        with pytest.raises(ValidationError, match="frozen"):
+            result.summary.total_tax = 0
+
+
+class TestSummaryValidation:
+    def test_constructed_summary_passes_validation(self):
+        """The summary skips validation when built; it must still be a valid model."""
+        summary = calculate_full_tax(_make_return()).summary
+        assert type(summary).model_validate(summary.model_dump()) == summary
+
+
+class TestPersistence:
+    def test_persist_false_skips_save(self, _no_persist):
+        calculate_full_tax(_make_return("52000"), persist=False)
+        _no_persist.assert_not_called()
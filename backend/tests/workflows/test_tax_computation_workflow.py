@@ -1,50 +1,17 @@
 """Tests for the tax computation workflow."""
 
+import random
 from decimal import Decimal
 
-from src.models.filing_status import FilingStatus
-from src.models.tax_output import AGIResult
-from src.models.workflow_models import DeductionResult, IncomeResult
-from src.workflows.tax_computation_workflow import run_tax_computation_workflow
-
-
-def _make_income(**kwargs) -> IncomeResult:
-    defaults = dict(
-        wages=Decimal("0"),
-        self_employment_income=Decimal("0"),
-        interest_income=Decimal("0"),
-        ordinary_dividends=Decimal("0"),
-        qualified_dividends=Decimal("0"),
-        short_term_gains=Decimal("0"),
-        long_term_gains=Decimal("0"),
-        total_gross_income=Decimal("0"),
-        net_investment_income=Decimal("0"),
-    )
-    defaults.update(kwargs)
-    return IncomeResult(**defaults)
+import pytest
 
-
-def _make_agi(agi: Decimal) -> AGIResult:
-    return AGIResult(
-        total_gross_income=agi,
-        total_above_line_deductions=Decimal("0"),
-        agi=agi,
-    )
-
-
-def _make_deductions(**kwargs) -> DeductionResult:
-    defaults = dict(
-        standard_deduction_amount=Decimal("14600"),
-        itemized_total=Decimal("0"),
-        used_standard=True,
-        deduction_amount=Decimal("14600"),
-        taxable_income=Decimal("0"),
-        ordinary_taxable_income=Decimal("0"),
-        preferential_qualified_dividends=Decimal("0"),
-        preferential_long_term_gains=Decimal("0"),
-    )
-    defaults.update(kwargs)
-    return DeductionResult(**defaults)
+from src.models.filing_status import FilingStatus
+from src.tools.calculate_bracket_tax import calculate_bracket_tax
+from src.tools.calculate_capital_gains_tax import calculate_capital_gains_tax
+from src.tools.calculate_niit import calculate_niit
+from src.tools.calculate_qualified_dividend_tax import calculate_qualified_dividend_tax
+from src.workflows.tax_computation_workflow import _compute_all_taxes, run_tax_computation_workflow
+from tests.workflows.builders import make_agi, make_deductions, make_income
 
 
 class TestTaxComputationWorkflow:
@@ -52,9 +19,9 @@ class TestTaxComputationWorkflow:
 
     def test_ordinary_income_only(self):
         """$60,400 ordinary taxable income (Single) — standard scenario."""
-        income = _make_income(wages=Decimal("75000"), total_gross_income=Decimal("75000"))
-        agi = _make_agi(Decimal("75000"))
-        deductions = _make_deductions(
+        income = make_income(wages=Decimal("75000"), total_gross_income=Decimal("75000"))
+        agi = make_agi(Decimal("75000"))
+        deductions = make_deductions(
             taxable_income=Decimal("60400"),
             ordinary_taxable_income=Decimal("60400"),
         )
@@ -69,17 +36,18 @@ class TestTaxComputationWorkflow:
         assert result.capital_gains_tax == Decimal("0.00")
         assert result.niit == Decimal("0.00")
         assert result.total_income_tax == Decimal("8341.00")
+        assert result.marginal_rate == Decimal("0.22")
 
     def test_with_qualified_dividends(self):
         """$50,400 ordinary + $5,000 qualified dividends (Single)."""
-        income = _make_income(
+        income = make_income(
             wages=Decimal("70000"),
             qualified_dividends=Decimal("5000"),
             total_gross_income=Decimal("70000"),
             net_investment_income=Decimal("5000"),
         )
-        agi = _make_agi(Decimal("70000"))
-        deductions = _make_deductions(
+        agi = make_agi(Decimal("70000"))
+        deductions = make_deductions(
             taxable_income=Decimal("55400"),
             ordinary_taxable_income=Decimal("50400"),
             preferential_qualified_dividends=Decimal("5000"),
@@ -93,14 +61,14 @@ class TestTaxComputationWorkflow:
 
     def test_with_long_term_gains(self):
         """Ordinary + LTCG (Single, under NIIT threshold)."""
-        income = _make_income(
+        income = make_income(
             wages=Decimal("50000"),
             long_term_gains=Decimal("20000"),
             total_gross_income=Decimal("70000"),
             net_investment_income=Decimal("20000"),
         )
-        agi = _make_agi(Decimal("70000"))
-        deductions = _make_deductions(
+        agi = make_agi(Decimal("70000"))
+        deductions = make_deductions(
             taxable_income=Decimal("55400"),
             ordinary_taxable_income=Decimal("35400"),
             preferential_long_term_gains=Decimal("20000"),
@@ -109,18 +77,20 @@ class TestTaxComputationWorkflow:
         assert result.ordinary_tax > Decimal("0")
         assert result.capital_gains_tax >= Decimal("0")  # 0% bracket likely
         assert result.niit == Decimal("0.00")
+        # Gains stack on top: the marginal bracket is that of total taxable income
+        assert result.marginal_rate == Decimal("0.22")
 
     def test_niit_applies(self):
         """High income triggers NIIT — Single $250k AGI with $30k NII."""
-        income = _make_income(
+        income = make_income(
             wages=Decimal("220000"),
             interest_income=Decimal("10000"),
             ordinary_dividends=Decimal("20000"),
             total_gross_income=Decimal("250000"),
             net_investment_income=Decimal("30000"),
         )
-        agi = _make_agi(Decimal("250000"))
-        deductions = _make_deductions(
+        agi = make_agi(Decimal("250000"))
+        deductions = make_deductions(
             taxable_income=Decimal("235400"),
             ordinary_taxable_income=Decimal("235400"),
         )
@@ -129,15 +99,15 @@ class TestTaxComputationWorkflow:
         assert result.niit == Decimal("1140.00")
 
     def test_zero_income(self):
-        income = _make_income()
-        agi = _make_agi(Decimal("0"))
-        deductions = _make_deductions()
+        income = make_income()
+        agi = make_agi(Decimal("0"))
+        deductions = make_deductions()
         result = run_tax_computation_workflow(income, agi, deductions, FilingStatus.SINGLE)
         assert result.total_income_tax == Decimal("0.00")
 
     def test_stacking_order_divs_then_gains(self):
         """Verify qualified dividends stack before LTCG per IRC §1(h)."""
-        income = _make_income(
+        income = make_income(
             wages=Decimal("40000"),
             qualified_dividends=Decimal("10000"),
             long_term_gains=Decimal("10000"),
@@ -145,8 +115,8 @@ class TestTaxComputationWorkflow:
             total_gross_income=Decimal("60000"),
             net_investment_income=Decimal("20000"),
         )
-        agi = _make_agi(Decimal("60000"))
-        deductions = _make_deductions(
+        agi = make_agi(Decimal("60000"))
+        deductions = make_deductions(
             taxable_income=Decimal("45400"),
             ordinary_taxable_income=Decimal("25400"),
             preferential_qualified_dividends=Decimal("10000"),
@@ -165,3 +135,63 @@ class TestTaxComputationWorkflow:
             + result.niit
         )
         assert result.total_income_tax == expected_total
+
+
+def _tool_by_tool(status, ordinary, qualified, gains, magi, nii):
+    """The four taxes from the Decimal tools, one call each."""
+    return (
+        calculate_bracket_tax(ordinary, status).total_tax,
+        calculate_qualified_dividend_tax(qualified, ordinary, status).tax,
+        calculate_capital_gains_tax(
+            Decimal("0"), gains, ordinary + qualified, status
+        ).long_term_tax,
+        calculate_niit(magi, nii, status).niit,
+    )
+
+
+class TestFusedTaxPath:
+    """The integer-cent fused path must match the tool-by-tool results exactly."""
+
+    @pytest.mark.parametrize("status", list(FilingStatus))
+    def test_sampled_inputs_match_tools(self, status):
+        rng = random.Random(2024)
+        for _ in range(200):
+            ordinary, qualified, gains, nii = (
+                Decimal(rng.randrange(50_000_001)).scaleb(-2) for _ in range(4)
+            )
+            magi = ordinary + qualified + gains + Decimal(rng.randrange(10_000_001)).scaleb(-2)
+            args = (status, ordinary, qualified, gains, magi, nii)
+            fused = _compute_all_taxes(*args)
+            assert [str(t) for t in fused] == [str(t) for t in _tool_by_tool(*args)]
+
+    @pytest.mark.parametrize("status", list(FilingStatus))
+    def test_no_investment_income_matches_tools(self, status):
+        """W-2-only returns skip the preferential step."""
+        args = (status, Decimal("260000.00"), Decimal("0"), Decimal("0"), Decimal("300000"),
+                Decimal("0"))
+        fused = _compute_all_taxes(*args)
+        assert [str(t) for t in fused] == [str(t) for t in _tool_by_tool(*args)]
+
+    def test_sub_cent_inputs_round_to_the_cent(self):
+        def taxes(ordinary):
+            return _compute_all_taxes(
+                FilingStatus.SINGLE,
+                ordinary,
+                Decimal("1000"),
+                Decimal("2000"),
+                Decimal("260000"),
+                Decimal("3000"),
+            )
+
+        assert taxes(Decimal("50000.005")) == taxes(Decimal("50000.01"))
+
+    def test_negative_magi_still_raises(self):
+        with pytest.raises(ValueError, match="magi must be >= 0"):
+            _compute_all_taxes(
+                FilingStatus.SINGLE,
+                Decimal("0"),
+                Decimal("0"),
+                Decimal("0"),
+                Decimal("-1"),
+                Decimal("0"),
+            )
@@ -118,6 +118,7 @@ export interface TaxComputationResult {
   capital_gains_tax: string;
   niit: string;
   total_income_tax: string;
+  marginal_rate: string;
 }
 
 export interface CreditsResult {
@@ -1,5 +1,7 @@
 """Tax domain context for LLM system prompts used by MCP tools."""
 
+from functools import lru_cache
+
 SCHEMA_CONTEXT = """
 Database: SQLite (backend/tax_data.db)
 
@@ -48,16 +50,32 @@ Standard Deduction (2024): Single $14,600 | MFJ $29,200 | HoH $21,900
 """.strip()
 
 _TOOL_DESCRIPTIONS = {
-    "query_data": "You translate natural language questions about tax data into SQL queries. Return ONLY the SQL query, no explanation.",
-    "create_chart": "You analyze tax data visualization requests and produce Plotly Python code. Return a JSON object with keys: 'sql' (the query to run) and 'plotly_code' (Python code using plotly that assumes a variable 'rows' containing query results as list of dicts).",
+    "query_data": "You translate natural language questions about tax data into SQL queries. Return ONLY the SQL query between <SQL> and </SQL> tags, no explanation.",
+    "create_chart": "You analyze tax data visualization requests and describe the chart to draw. Return a JSON object with keys: 'sql' (the query to run) and 'chart' (the chart type and which result columns to plot).",
     "create_table": "You analyze tax data table requests and produce SQL queries with formatting hints. Return a JSON object with keys: 'sql' (the query to run), 'columns' (list of column display names), and 'title' (table title).",
     "generate_report": "You analyze tax data and write comprehensive reports. Return a JSON object with keys: 'queries' (list of SQL queries to run for gathering data) and 'analysis_prompt' (a prompt describing what to analyze given the query results).",
 }
 
 
+_RULES = """Important rules:
+- Only generate SELECT statements. Never generate INSERT, UPDATE, DELETE, DROP, ALTER, CREATE, or TRUNCATE.
+- Use the exact column names from the schema.
+- When filtering by filing_status, use the exact enum values (e.g., WHERE filing_status = 'SINGLE').
+- Rates are stored as decimals (0.22 not 22). Multiply by 100 for display percentages.
+- For monetary values, round to 2 decimal places in queries.
+- The input_data and result_data columns contain JSON. Use json_extract() for querying nested fields.
+"""
+
+# Everything after the tool description is the same for every tool
+_PROMPT_TAIL = f"{SCHEMA_CONTEXT}\n\n{DOMAIN_CONTEXT}\n\n{_RULES}"
+
+
+@lru_cache(maxsize=8)
 def get_system_prompt(tool_name: str) -> str:
     """Return a system prompt tailored for the given tool.
 
+    Prompts are static per tool, so each one is built once and cached.
+
     Args:
         tool_name: One of 'query_data', 'create_chart', 'create_table', 'generate_report'.
 
@@ -70,15 +88,4 @@ def get_system_prompt(tool_name: str) -> str:
 
 {tool_desc}
 
-{SCHEMA_CONTEXT}
-
-{DOMAIN_CONTEXT}
-
-Important rules:
-- Only generate SELECT statements. Never generate INSERT, UPDATE, DELETE, DROP, ALTER, CREATE, or TRUNCATE.
-- Use the exact column names from the schema.
-- When filtering by filing_status, use the exact enum values (e.g., WHERE filing_status = 'SINGLE').
-- Rates are stored as decimals (0.22 not 22). Multiply by 100 for display percentages.
-- For monetary values, round to 2 decimal places in queries.
-- The input_data and result_data columns contain JSON. Use json_extract() for querying nested fields.
-"""
+{_PROMPT_TAIL}"""
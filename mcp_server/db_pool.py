@@ -0,0 +1,69 @@
+"""Read-only SQLite connection pool shared by the MCP tools.
+
+The tools only ever read the backend's tax database, so a few read-only
+connections are opened on first use and handed out via ``get_readonly_db()``
+instead of connecting (and re-reading the schema) for every query.  The
+backend runs the database in WAL mode, so these readers never block its
+writer or each other.
+"""
+
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+DB_PATH: Path = Path(__file__).resolve().parent.parent / "backend" / "tax_data.db"
+
+POOL_SIZE = 4
+
+# Applied to every pooled connection.  cache_size is in KiB when negative (~64 MB).
+_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA query_only=1",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+_pool: queue.Queue[sqlite3.Connection] | None = None
+_pool_lock = threading.Lock()
+
+
+def _connect() -> sqlite3.Connection:
+    """Open one read-only connection with the pool's PRAGMAs applied."""
+    conn = sqlite3.connect(
+        f"file:{DB_PATH}?mode=ro", uri=True, check_same_thread=False, isolation_level=None
+    )
+    conn.row_factory = sqlite3.Row
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+@contextmanager
+def get_readonly_db() -> Iterator[sqlite3.Connection]:
+    """Borrow a pooled read-only connection for the duration of the ``with`` block.
+
+    Blocks until a connection is free, so async tools borrow from a worker
+    thread (``asyncio.to_thread``).  Raises FileNotFoundError if the backend
+    has not created the database yet.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            if not DB_PATH.exists():
+                raise FileNotFoundError(
+                    f"Tax database not found at {DB_PATH}. "
+                    "Run a tax calculation first to create the database."
+                )
+            fresh: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=POOL_SIZE)
+            for _ in range(POOL_SIZE):
+                fresh.put(_connect())
+            _pool = fresh
+        pool = _pool
+    conn = pool.get()
+    try:
+        yield conn
+    finally:
+        pool.put(conn)
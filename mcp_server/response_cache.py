@@ -0,0 +1,37 @@
+"""In-process cache of Claude responses, keyed on the exact prompts sent.
+
+The tools ask Claude to translate a request into SQL or a plan, then run
+that against live data, so replaying the text for an identical (system,
+user) prompt pair returns fresh results without another API round-trip.
+"""
+
+import time
+from collections import OrderedDict
+
+TTL_SECONDS = 24 * 60 * 60
+MAX_ENTRIES = 256
+
+_entries: OrderedDict[tuple[str, str], tuple[float, str]] = OrderedDict()
+
+
+def get(system_prompt: str, user_prompt: str) -> str | None:
+    """Return the cached response for this prompt pair, or None if absent or expired."""
+    key = (system_prompt, user_prompt)
+    entry = _entries.get(key)
+    if entry is None:
+        return None
+    stored_at, text = entry
+    if time.monotonic() - stored_at > TTL_SECONDS:
+        del _entries[key]
+        return None
+    _entries.move_to_end(key)
+    return text
+
+
+def put(system_prompt: str, user_prompt: str, text: str) -> None:
+    """Store *text* as the response for this prompt pair, evicting the oldest if full."""
+    key = (system_prompt, user_prompt)
+    _entries[key] = (time.monotonic(), text)
+    _entries.move_to_end(key)
+    if len(_entries) > MAX_ENTRIES:
+        _entries.popitem(last=False)
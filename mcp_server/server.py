@@ -8,6 +8,14 @@ Run with: python -m mcp_server.server
 
 from mcp.server.fastmcp import FastMCP
 
+# Imported at startup so anthropic, plotly and orjson load before the first
+# tool call rather than during it.  Module aliases avoid clashing with the
+# tool function names below.
+from mcp_server.tools import create_chart as chart_tool
+from mcp_server.tools import create_table as table_tool
+from mcp_server.tools import generate_report as report_tool
+from mcp_server.tools import query_data as query_tool
+
 mcp = FastMCP("Tax Data Analyst")
 
 
@@ -26,9 +34,7 @@ async def query_tax_data(question: str) -> str:
     Returns:
         Formatted text with the query results.
     """
-    from mcp_server.tools.query_data import query_tax_data as _query
-
-    return await _query(question)
+    return await query_tool.query_tax_data(question)
 
 
 @mcp.tool()
@@ -46,9 +52,7 @@ async def create_chart(prompt: str) -> str:
     Returns:
         Self-contained HTML string with the Plotly chart.
     """
-    from mcp_server.tools.create_chart import create_chart as _chart
-
-    return await _chart(prompt)
+    return await chart_tool.create_chart(prompt)
 
 
 @mcp.tool()
@@ -66,9 +70,7 @@ async def create_table(prompt: str) -> str:
     Returns:
         Markdown-formatted table string.
     """
-    from mcp_server.tools.create_table import create_table as _table
-
-    return await _table(prompt)
+    return await table_tool.create_table(prompt)
 
 
 @mcp.tool()
@@ -86,9 +88,7 @@ async def generate_report(prompt: str) -> str:
     Returns:
         Formatted analytical report with insights and recommendations.
     """
-    from mcp_server.tools.generate_report import generate_report as _report
-
-    return await _report(prompt)
+    return await report_tool.generate_report(prompt)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,88 @@
+"""Helpers shared by the MCP tools: Claude calls, JSON replies, SQL checks."""
+
+import re
+from functools import lru_cache
+
+import anthropic
+import orjson
+
+from mcp_server import response_cache
+
+FORBIDDEN_KEYWORDS = frozenset({
+    "INSERT", "UPDATE", "DELETE", "DROP", "ALTER",
+    "CREATE", "TRUNCATE", "REPLACE", "ATTACH", "DETACH",
+})
+
+# Any forbidden keyword as a whole word, wherever it sits ("1;DROP" included).
+# REPLACE followed by "(" is SQLite's string function, not REPLACE INTO.
+_FORBIDDEN_RE = re.compile(
+    r"\b(?:"
+    + "|".join(sorted(FORBIDDEN_KEYWORDS - {"REPLACE"}))
+    + r"|REPLACE\b(?!\s*\())\b",
+    re.IGNORECASE,
+)
+
+# A markdown fence line, e.g. "```json" or the closing "```"
+_FENCE_RE = re.compile(r"^```.*$", re.MULTILINE)
+# The query_data prompt asks for the SQL between these tags
+_SQL_TAG_RE = re.compile(r"<SQL>(.*?)</SQL>", re.DOTALL | re.IGNORECASE)
+
+
+def validate_readonly_sql(sql: str) -> bool:
+    """Check that the SQL contains only read operations."""
+    return _FORBIDDEN_RE.search(sql) is None
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> anthropic.AsyncAnthropic:
+    """Return the shared API client, so calls reuse its HTTP connection pool."""
+    return anthropic.AsyncAnthropic()
+
+
+async def ask_claude(system_prompt: str, user_prompt: str) -> str:
+    """Call the Claude API with the given prompts."""
+    cached = response_cache.get(system_prompt, user_prompt)
+    if cached is not None:
+        return cached
+
+    client = _get_client()
+    response = await client.messages.create(
+        model="claude-sonnet-4-5-20250929",
+        max_tokens=4096,
+        # Cache breakpoint on the static per-tool prompt: repeat calls within
+        # the cache TTL reuse the processed prefix instead of re-reading it
+        system=[
+            {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+        ],
+        messages=[{"role": "user", "content": user_prompt}],
+    )
+    text = response.content[0].text
+    response_cache.put(system_prompt, user_prompt, text)
+    return text
+
+
+def extract_json(text: str) -> dict:
+    """Extract JSON from Claude's response, handling markdown fences.
+
+    Raises json.JSONDecodeError (via orjson's subclass) if no JSON is found.
+    """
+    # Asked for bare JSON, Claude usually sends just that: try it as-is first
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        cleaned = text.strip()
+        if not cleaned.startswith("```"):
+            raise
+    return orjson.loads(_FENCE_RE.sub("", cleaned))
+
+
+def extract_sql(text: str) -> str:
+    """Extract the SQL from Claude's response.
+
+    Takes the text between <SQL> tags, or else the whole response with any
+    markdown fence lines removed.
+    """
+    match = _SQL_TAG_RE.search(text)
+    if match is not None:
+        return match.group(1).strip()
+    return _FENCE_RE.sub("", text).strip()
@@ -1,59 +1,100 @@
 """Tool for creating Plotly charts from tax data."""
 
+import asyncio
 import json
 import sqlite3
-from pathlib import Path
 
 import anthropic
+import plotly.io as pio
 
 from mcp_server.context import get_system_prompt
+from mcp_server.db_pool import get_readonly_db
+from mcp_server.tools._common import ask_claude, extract_json, validate_readonly_sql
 
-DB_PATH = Path(__file__).resolve().parent.parent.parent / "backend" / "tax_data.db"
+# The figure is assembled as plain dicts in plotly.js's own JSON shape and
+# rendered with validation off: the query's columns go to the page as they
+# are, without plotly.py walking every value through its trace validators.
+_TEMPLATE = pio.templates["plotly_white"].to_plotly_json()
 
-FORBIDDEN_KEYWORDS = {
-    "INSERT", "UPDATE", "DELETE", "DROP", "ALTER",
-    "CREATE", "TRUNCATE", "REPLACE", "ATTACH", "DETACH",
-}
 
+def _y_columns(spec: dict) -> list[str]:
+    """The spec's ``y`` as a list — a single column name or several series."""
+    y = spec["y"]
+    return [y] if isinstance(y, str) else list(y)
 
-def _get_readonly_connection() -> sqlite3.Connection:
-    if not DB_PATH.exists():
-        raise FileNotFoundError(
-            f"Tax database not found at {DB_PATH}. "
-            "Run a tax calculation first to create the database."
-        )
-    conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
-    conn.row_factory = sqlite3.Row
-    return conn
 
+def _xy_traces(spec: dict, data: dict[str, list], trace_type: str, **style) -> list[dict]:
+    x = data[spec["x"]]
+    return [
+        {"type": trace_type, "x": x, "y": data[col], "name": col, **style}
+        for col in _y_columns(spec)
+    ]
 
-def _validate_readonly_sql(sql: str) -> bool:
-    upper = sql.upper()
-    tokens = upper.split()
-    return not any(kw in tokens for kw in FORBIDDEN_KEYWORDS)
 
+def _bar(spec: dict, data: dict[str, list]) -> list[dict]:
+    return _xy_traces(spec, data, "bar")
+
+
+def _line(spec: dict, data: dict[str, list]) -> list[dict]:
+    return _xy_traces(spec, data, "scatter", mode="lines+markers")
+
+
+def _scatter(spec: dict, data: dict[str, list]) -> list[dict]:
+    return _xy_traces(spec, data, "scatter", mode="markers")
+
+
+def _pie(spec: dict, data: dict[str, list]) -> list[dict]:
+    return [{"type": "pie", "labels": data[spec["x"]], "values": data[_y_columns(spec)[0]]}]
 
-def _ask_claude(system_prompt: str, user_prompt: str) -> str:
-    client = anthropic.Anthropic()
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=4096,
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_prompt}],
-    )
-    return response.content[0].text
 
+# Chart type -> builder of the figure's traces from (spec, column data)
+_BUILDERS = {"bar": _bar, "line": _line, "scatter": _scatter, "pie": _pie}
 
-def _extract_json(text: str) -> dict:
-    """Extract JSON from Claude's response, handling markdown fences."""
-    cleaned = text.strip()
-    if cleaned.startswith("```"):
-        lines = cleaned.split("\n")
-        cleaned = "\n".join(
-            line for line in lines
-            if not line.startswith("```")
-        ).strip()
-    return json.loads(cleaned)
+
+def _check_spec(spec: dict) -> None:
+    """Check the shape of the model's chart spec before anything is built from it.
+
+    Raises ValueError unless ``type`` and ``x`` are strings and ``y`` is a
+    string or a list of strings.
+    """
+    for key in ("type", "x"):
+        if not isinstance(spec.get(key), str):
+            raise ValueError(f"chart {key!r} must be a string, got {spec.get(key)!r}")
+    y = spec.get("y")
+    if not isinstance(y, str) and not (
+        isinstance(y, list) and y and all(isinstance(col, str) for col in y)
+    ):
+        raise ValueError(f"chart 'y' must be a column name or a list of them, got {y!r}")
+
+
+def _build_figure(spec: dict, data: dict[str, list]) -> dict:
+    """Turn a chart spec and the query's columns into a Plotly figure dict.
+
+    Raises ValueError for an unknown chart type and KeyError for a column the
+    query did not return.
+    """
+    builder = _BUILDERS.get(spec.get("type"))
+    if builder is None:
+        msg = f"unsupported chart type {spec.get('type')!r}; expected one of {sorted(_BUILDERS)}"
+        raise ValueError(msg)
+
+    layout = {
+        "title": {"text": spec.get("title")},
+        "xaxis": {"title": {"text": spec.get("x_label", spec["x"])}},
+        "yaxis": {"title": {"text": spec.get("y_label", ", ".join(_y_columns(spec)))}},
+        "barmode": "group",
+        "template": _TEMPLATE,
+    }
+    return {"data": builder(spec, data), "layout": layout}
+
+
+def _run_query(sql: str) -> tuple[list[str], list[sqlite3.Row]]:
+    """Execute *sql* on a pooled read-only connection; return (columns, rows)."""
+    with get_readonly_db() as conn:
+        cursor = conn.execute(sql)
+        raw_rows = cursor.fetchall()
+        columns = [desc[0] for desc in cursor.description] if cursor.description else []
+    return columns, raw_rows
 
 
 async def create_chart(prompt: str) -> str:
@@ -77,71 +118,69 @@ async def create_chart(prompt: str) -> str:
         f"User wants this chart: {prompt}\n\n"
         "Return a JSON object with exactly these keys:\n"
         "- \"sql\": a SELECT query to get the data needed\n"
-        "- \"plotly_code\": Python code using plotly.graph_objects that:\n"
-        "  1. Assumes a variable 'rows' exists as a list of dicts with the query results\n"
-        "  2. Creates a plotly figure assigned to variable 'fig'\n"
-        "  3. Does NOT call fig.show()\n"
-        "  4. Uses a clean, professional style\n\n"
+        "- \"chart\": an object describing the chart, with keys:\n"
+        "  - \"type\": one of \"bar\", \"line\", \"scatter\", \"pie\"\n"
+        "  - \"x\": the result column for the x axis (the slice labels for a pie)\n"
+        "  - \"y\": the result column to plot, or a list of columns for several series "
+        "(the slice values for a pie)\n"
+        "  - \"title\": the chart title\n"
+        "  - optional \"x_label\" / \"y_label\": axis titles\n"
+        "Do any aggregation in the SQL; the columns are plotted as returned.\n\n"
         "Return ONLY valid JSON, no other text."
     )
 
     try:
-        response_text = _ask_claude(system_prompt, chart_request)
+        response_text = await ask_claude(system_prompt, chart_request)
     except anthropic.APIError as e:
         return f"Error communicating with Claude API: {e}"
 
     # Parse the response
     try:
-        plan = _extract_json(response_text)
+        plan = extract_json(response_text)
     except (json.JSONDecodeError, ValueError):
         return f"Error: Could not parse chart plan from Claude response.\nRaw response: {response_text[:500]}"
 
     sql = plan.get("sql", "")
-    plotly_code = plan.get("plotly_code", "")
+    spec = plan.get("chart")
 
-    if not sql or not plotly_code:
-        return "Error: Claude did not provide both SQL and Plotly code."
+    if not sql or not isinstance(spec, dict) or "x" not in spec or "y" not in spec:
+        return "Error: Claude did not provide both SQL and a chart spec with x and y columns."
+
+    try:
+        _check_spec(spec)
+    except ValueError as e:
+        return f"Error building chart: {e}"
 
     # Validate SQL
-    if not _validate_readonly_sql(sql):
+    if not validate_readonly_sql(sql):
         return "Error: Generated query contains forbidden operations. Only SELECT queries are allowed."
 
-    # Execute SQL
+    # Execute SQL in a worker thread — borrowing a pooled connection can block
+    # until another tool returns one
     try:
-        conn = _get_readonly_connection()
+        columns, raw_rows = await asyncio.to_thread(_run_query, sql)
     except FileNotFoundError as e:
         return str(e)
-
-    try:
-        cursor = conn.execute(sql)
-        raw_rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description] if cursor.description else []
-        rows = [dict(zip(columns, row)) for row in raw_rows]
     except sqlite3.Error as e:
-        conn.close()
         return f"SQL Error: {e}\nGenerated query: {sql}"
-    finally:
-        conn.close()
 
-    if not rows:
+    if not raw_rows:
         return "No data found to chart. Run some tax calculations first."
 
-    # Execute Plotly code in a sandboxed namespace
-    import plotly.graph_objects as go
-
-    namespace = {"rows": rows, "go": go}
+    # Columnar view of the results: one list of values per column
+    data = dict(
+        zip(columns, (list(values) for values in zip(*raw_rows, strict=True)), strict=True)
+    )
     try:
-        exec(plotly_code, namespace)  # noqa: S102
-    except Exception as e:
-        return f"Error executing chart code: {e}\nGenerated code:\n{plotly_code}"
-
-    fig = namespace.get("fig")
-    if fig is None:
-        return "Error: Chart code did not produce a 'fig' variable."
+        fig = _build_figure(spec, data)
+    except KeyError as e:
+        return f"Error: Chart spec refers to column {e} not returned by the query: {sql}"
+    except ValueError as e:
+        return f"Error building chart: {e}"
 
     # Generate self-contained HTML
     try:
-        html = fig.to_html(include_plotlyjs="cdn", full_html=True)
+        html = pio.to_html(fig, include_plotlyjs="cdn", full_html=True, validate=False)
         return html
     except Exception as e:
         return f"Error generating HTML: {e}"
@@ -1,95 +1,60 @@
 """Tool for creating formatted markdown tables from tax data."""
 
+import asyncio
+import io
 import json
 import sqlite3
-from pathlib import Path
+from collections.abc import Iterable
 
 import anthropic
 
 from mcp_server.context import get_system_prompt
+from mcp_server.db_pool import get_readonly_db
+from mcp_server.tools._common import ask_claude, extract_json, validate_readonly_sql
 
-DB_PATH = Path(__file__).resolve().parent.parent.parent / "backend" / "tax_data.db"
 
-FORBIDDEN_KEYWORDS = {
-    "INSERT", "UPDATE", "DELETE", "DROP", "ALTER",
-    "CREATE", "TRUNCATE", "REPLACE", "ATTACH", "DETACH",
-}
+def _display_value(val: object) -> str:
+    """Render one cell: floats as money-style numbers, NULL as empty."""
+    if isinstance(val, float):
+        return f"{val:,.2f}"
+    if val is None:
+        return ""
+    return str(val)
 
 
-def _get_readonly_connection() -> sqlite3.Connection:
-    if not DB_PATH.exists():
-        raise FileNotFoundError(
-            f"Tax database not found at {DB_PATH}. "
-            "Run a tax calculation first to create the database."
-        )
-    conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
-    conn.row_factory = sqlite3.Row
-    return conn
-
-
-def _validate_readonly_sql(sql: str) -> bool:
-    upper = sql.upper()
-    tokens = upper.split()
-    return not any(kw in tokens for kw in FORBIDDEN_KEYWORDS)
-
-
-def _ask_claude(system_prompt: str, user_prompt: str) -> str:
-    client = anthropic.Anthropic()
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=4096,
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_prompt}],
-    )
-    return response.content[0].text
-
-
-def _extract_json(text: str) -> dict:
-    """Extract JSON from Claude's response, handling markdown fences."""
-    cleaned = text.strip()
-    if cleaned.startswith("```"):
-        lines = cleaned.split("\n")
-        cleaned = "\n".join(
-            line for line in lines
-            if not line.startswith("```")
-        ).strip()
-    return json.loads(cleaned)
+def _format_markdown_table(
+    rows: Iterable[sqlite3.Row], columns: list[str], title: str
+) -> str:
+    """Build a markdown table from rows (indexed by position) and column names.
 
+    *rows* is consumed once, so a cursor can be passed to format the results
+    as SQLite steps through them instead of fetching them all first.
+    """
+    body = io.StringIO()
+    count = 0
+    for row in rows:
+        body.write("| " + " | ".join(map(_display_value, row)) + " |\n")
+        count += 1
 
-def _format_markdown_table(rows: list[dict], columns: list[str], title: str) -> str:
-    """Build a markdown table from rows and column names."""
-    if not rows:
+    if not count:
         return f"## {title}\n\nNo data found."
 
-    # Calculate display values
-    display_rows = []
-    for row in rows:
-        display_row = {}
-        for col in columns:
-            val = row.get(col, "")
-            if isinstance(val, float):
-                display_row[col] = f"{val:,.2f}"
-            elif val is None:
-                display_row[col] = ""
-            else:
-                display_row[col] = str(val)
-        display_rows.append(display_row)
-
-    # Build markdown
-    lines = [f"## {title}", ""]
-
-    # Header
     header = "| " + " | ".join(columns) + " |"
     separator = "| " + " | ".join("---" for _ in columns) + " |"
-    lines.extend([header, separator])
+    return (
+        f"## {title}\n\n{header}\n{separator}\n{body.getvalue()}"
+        f"\n*{count} row{'s' if count != 1 else ''}*"
+    )
 
-    # Data rows
-    for row in display_rows:
-        line = "| " + " | ".join(row.get(col, "") for col in columns) + " |"
-        lines.append(line)
 
-    lines.append(f"\n*{len(display_rows)} row{'s' if len(display_rows) != 1 else ''}*")
-    return "\n".join(lines)
+def _run_query(sql: str, columns: list[str], title: str) -> str:
+    """Execute *sql* on a pooled read-only connection and format it as a table."""
+    with get_readonly_db() as conn:
+        cursor = conn.execute(sql)
+        actual_columns = [desc[0] for desc in cursor.description] if cursor.description else []
+        # Use actual column names from query results if they differ
+        display_columns = actual_columns if actual_columns else columns
+        return _format_markdown_table(cursor, display_columns, title)
 
 
 async def create_table(prompt: str) -> str:
@@ -120,12 +85,12 @@ async def create_table(prompt: str) -> str:
     )
 
     try:
-        response_text = _ask_claude(system_prompt, table_request)
+        response_text = await ask_claude(system_prompt, table_request)
     except anthropic.APIError as e:
         return f"Error communicating with Claude API: {e}"
 
     try:
-        plan = _extract_json(response_text)
+        plan = extract_json(response_text)
     except (json.JSONDecodeError, ValueError):
         return f"Error: Could not parse table plan.\nRaw response: {response_text[:500]}"
 
@@ -136,26 +101,14 @@ async def create_table(prompt: str) -> str:
     if not sql or not columns:
         return "Error: Claude did not provide both SQL and column names."
 
-    if not _validate_readonly_sql(sql):
+    if not validate_readonly_sql(sql):
         return "Error: Generated query contains forbidden operations."
 
+    # Run in a worker thread: borrowing a pooled connection can block until
+    # another tool returns one
     try:
-        conn = _get_readonly_connection()
+        return await asyncio.to_thread(_run_query, sql, columns, title)
     except FileNotFoundError as e:
         return str(e)
-
-    try:
-        cursor = conn.execute(sql)
-        raw_rows = cursor.fetchall()
-        actual_columns = [desc[0] for desc in cursor.description] if cursor.description else []
-        rows = [dict(zip(actual_columns, row)) for row in raw_rows]
     except sqlite3.Error as e:
-        conn.close()
         return f"SQL Error: {e}\nGenerated query: {sql}"
-    finally:
-        conn.close()
-
-    # Use actual column names from query results if they differ
-    display_columns = actual_columns if actual_columns else columns
-
-    return _format_markdown_table(rows, display_columns, title)
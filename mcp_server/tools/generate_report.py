@@ -1,59 +1,80 @@
 """Tool for generating analytical reports from tax data."""
 
+import asyncio
 import json
 import sqlite3
-from pathlib import Path
 
 import anthropic
+import orjson
 
 from mcp_server.context import get_system_prompt
+from mcp_server.db_pool import get_readonly_db
+from mcp_server.tools._common import ask_claude, extract_json, validate_readonly_sql
 
-DB_PATH = Path(__file__).resolve().parent.parent.parent / "backend" / "tax_data.db"
+# Rows read per query at most; SQLite stops stepping the statement after this
+FETCH_LIMIT = 5_000
+# Results longer than PROMPT_ROWS are shown as their first HEAD_ROWS and last
+# TAIL_ROWS rows plus per-column numeric summaries
+PROMPT_ROWS = 100
+HEAD_ROWS = 50
+TAIL_ROWS = 10
 
-FORBIDDEN_KEYWORDS = {
-    "INSERT", "UPDATE", "DELETE", "DROP", "ALTER",
-    "CREATE", "TRUNCATE", "REPLACE", "ATTACH", "DETACH",
-}
 
+def _run_query(index: int, sql: str) -> str:
+    """Run one planned query and describe its results for the report prompt."""
+    if not validate_readonly_sql(sql):
+        return f"Query {index + 1}: SKIPPED (contains forbidden operations)"
 
-def _get_readonly_connection() -> sqlite3.Connection:
-    if not DB_PATH.exists():
-        raise FileNotFoundError(
-            f"Tax database not found at {DB_PATH}. "
-            "Run a tax calculation first to create the database."
-        )
-    conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
-    conn.row_factory = sqlite3.Row
-    return conn
-
-
-def _validate_readonly_sql(sql: str) -> bool:
-    upper = sql.upper()
-    tokens = upper.split()
-    return not any(kw in tokens for kw in FORBIDDEN_KEYWORDS)
-
-
-def _ask_claude(system_prompt: str, user_prompt: str) -> str:
-    client = anthropic.Anthropic()
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=4096,
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_prompt}],
-    )
-    return response.content[0].text
-
-
-def _extract_json(text: str) -> dict:
-    """Extract JSON from Claude's response, handling markdown fences."""
-    cleaned = text.strip()
-    if cleaned.startswith("```"):
-        lines = cleaned.split("\n")
-        cleaned = "\n".join(
-            line for line in lines
-            if not line.startswith("```")
-        ).strip()
-    return json.loads(cleaned)
+    try:
+        with get_readonly_db() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None  # plain tuples: orjson encodes them directly
+            cursor.execute(sql)
+            rows = cursor.fetchmany(FETCH_LIMIT + 1)
+            columns = [desc[0] for desc in cursor.description] if cursor.description else []
+    except sqlite3.Error as e:
+        return f"Query {index + 1}: ERROR - {e}\nSQL: {sql}"
+
+    count = f"{FETCH_LIMIT}+" if len(rows) > FETCH_LIMIT else str(len(rows))
+    rows = rows[:FETCH_LIMIT]
+    # Columnar form: the column names once rather than repeated in every row
+    result: dict = {"columns": columns}
+    if len(rows) > PROMPT_ROWS:
+        result["rows"] = rows[:HEAD_ROWS] + rows[-TAIL_ROWS:]
+        result["omitted_rows"] = f"{len(rows) - HEAD_ROWS - TAIL_ROWS} rows between these"
+        result["summary"] = _summarize_columns(columns, rows)
+    else:
+        result["rows"] = rows
+    payload = orjson.dumps(result, default=str).decode()
+    return f"Query {index + 1}: {sql}\nResults ({count} rows): {payload}"
+
+
+def _summarize_columns(columns: list[str], rows: list[tuple]) -> dict[str, dict]:
+    """count/min/max/mean of every all-numeric column, in one pass over *rows*."""
+    stats: dict[int, list] = {}  # column index -> [count, min, max, total]
+    skip: set[int] = set()
+    for row in rows:
+        for i, value in enumerate(row):
+            if i in skip or value is None:
+                continue
+            if isinstance(value, bool) or not isinstance(value, int | float):
+                skip.add(i)
+                stats.pop(i, None)
+                continue
+            entry = stats.get(i)
+            if entry is None:
+                stats[i] = [1, value, value, value]
+            else:
+                entry[0] += 1
+                if value < entry[1]:
+                    entry[1] = value
+                if value > entry[2]:
+                    entry[2] = value
+                entry[3] += value
+    return {
+        columns[i]: {"count": n, "min": low, "max": high, "mean": round(total / n, 2)}
+        for i, (n, low, high, total) in sorted(stats.items())
+    }
 
 
 async def generate_report(prompt: str) -> str:
@@ -86,12 +107,12 @@ async def generate_report(prompt: str) -> str:
     )
 
     try:
-        plan_text = _ask_claude(system_prompt, planning_request)
+        plan_text = await ask_claude(system_prompt, planning_request)
     except anthropic.APIError as e:
         return f"Error communicating with Claude API: {e}"
 
     try:
-        plan = _extract_json(plan_text)
+        plan = extract_json(plan_text)
     except (json.JSONDecodeError, ValueError):
         return f"Error: Could not parse report plan.\nRaw response: {plan_text[:500]}"
 
@@ -101,34 +122,19 @@ async def generate_report(prompt: str) -> str:
     if not queries:
         return "Error: No data queries were generated for this report."
 
-    # Step 2: Execute all queries and gather data
+    # Step 2: Execute all queries and gather data — each on its own read-only
+    # connection in a worker thread, so the SELECTs run side by side
     try:
-        conn = _get_readonly_connection()
+        gathered_data = await asyncio.gather(
+            *(
+                asyncio.to_thread(_run_query, i, sql)
+                for i, sql in enumerate(queries)
+                if isinstance(sql, str)
+            )
+        )
     except FileNotFoundError as e:
         return str(e)
 
-    gathered_data = []
-    try:
-        for i, sql in enumerate(queries):
-            if not isinstance(sql, str):
-                continue
-            if not _validate_readonly_sql(sql):
-                gathered_data.append(f"Query {i + 1}: SKIPPED (contains forbidden operations)")
-                continue
-            try:
-                cursor = conn.execute(sql)
-                raw_rows = cursor.fetchall()
-                columns = [desc[0] for desc in cursor.description] if cursor.description else []
-                rows = [dict(zip(columns, row)) for row in raw_rows]
-                gathered_data.append(
-                    f"Query {i + 1}: {sql}\n"
-                    f"Results ({len(rows)} rows): {json.dumps(rows, indent=2, default=str)}"
-                )
-            except sqlite3.Error as e:
-                gathered_data.append(f"Query {i + 1}: ERROR - {e}\nSQL: {sql}")
-    finally:
-        conn.close()
-
     if not gathered_data:
         return "No data could be retrieved. Run some tax calculations first."
 
@@ -157,7 +163,7 @@ async def generate_report(prompt: str) -> str:
     )
 
     try:
-        report = _ask_claude(report_system, report_request)
+        report = await ask_claude(report_system, report_request)
     except anthropic.APIError as e:
         return f"Error generating report: {e}"
 